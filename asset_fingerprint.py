@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Asset Fingerprinting Build Stage
+Minifies the scripts and stylesheets pages reference, writes content-hashed
+copies next to them (js/main.<hash>.js) and rewrites every <script>/<link>
+reference so the one-year immutable cache headers are safe to use
+"""
+
+import argparse
+import glob
+import json
+import os
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
+from build_cache import HASH_LENGTH, file_hash, hash_bytes
+from css_purge import PAGE_PATTERNS, expand, minify_css, read_text, write_if_changed
+
+MANIFEST_PATH = 'asset-manifest.json'
+
+# Assets that get fingerprinted copies when a page references them
+SOURCE_PATTERNS = ['js/*.js', 'hebrew-home/js/*.js', 'css/*.css', 'css/purged/*.css']
+
+# Fingerprinted copies: name.<hash>.js / name.<hash>.css
+FINGERPRINT_GLOB = '.' + '[0-9a-f]' * HASH_LENGTH
+OUTPUT_PATTERNS = [pattern.replace('*.', '*' + FINGERPRINT_GLOB + '.') for pattern in SOURCE_PATTERNS]
+FINGERPRINTED_NAME = re.compile(r'\.[0-9a-f]{%d}(\.(?:js|css))$' % HASH_LENGTH)
+
+ASSET_REFERENCE_PATTERN = re.compile(r'(<(?:script|link)\b[^>]*?\b(?:src|href)=")([^":?#]+\.(?:js|css))(")', re.IGNORECASE)
+
+# After these characters (or keywords) a '/' starts a regular expression, not a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+# Whitespace next to these never separates tokens
+SPACE_INSENSITIVE = set('{}()[];,:=<>?!&|*%^~')
+# Line breaks right after these can never trigger (or prevent) semicolon insertion
+BREAK_INSENSITIVE = set('{([;,')
+
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void',
+                  'throw', 'instanceof', 'yield', 'await'}
+
+def source_path(asset_path):
+    """Site path of the original asset behind a (possibly fingerprinted) path"""
+    return FINGERPRINTED_NAME.sub(r'\1', asset_path)
+
+def is_fingerprinted(asset_path):
+    return FINGERPRINTED_NAME.search(asset_path) is not None
+
+def fingerprinted_path(asset_path, content_hash):
+    """js/main.js → js/main.<hash>.js"""
+    stem, ext = posixpath.splitext(asset_path)
+    return f"{stem}.{content_hash}{ext}"
+
+class JsMinifier:
+    """Strips comments and redundant whitespace from a script.
+
+    Line breaks are kept (collapsed to one) so automatic semicolon insertion
+    behaves exactly as in the source; strings, template literals and regular
+    expression literals are copied verbatim.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.pos = 0
+        self.out = []
+
+    def last_significant(self):
+        """The last emitted non-whitespace character and the word it ends"""
+        text = ''.join(self.out[-64:]).rstrip()
+        if not text:
+            return None, ''
+        word = re.search(r'[\w$]*$', text).group(0)
+        return text[-1], word
+
+    def regex_allowed(self):
+        char, word = self.last_significant()
+        return char is None or char in REGEX_PRECEDERS or word in REGEX_KEYWORDS
+
+    def emit_space(self, char):
+        """Collapse runs of whitespace to one space or one newline"""
+        if char == '\n':
+            while self.out and self.out[-1] == ' ':
+                self.out.pop()
+            if self.out and self.out[-1] != '\n' and self.out[-1][-1] not in BREAK_INSENSITIVE:
+                self.out.append('\n')
+        elif self.out and self.out[-1] not in (' ', '\n'):
+            self.out.append(' ')
+
+    def push(self, text):
+        """Emit a token, dropping a pending space that punctuation makes redundant"""
+        if len(self.out) > 1 and self.out[-1] == ' ' and (
+                text[0] in SPACE_INSENSITIVE or self.out[-2][-1] in SPACE_INSENSITIVE):
+            self.out.pop()
+        self.out.append(text)
+
+    def copy_quoted(self, quote):
+        """Copy a string literal including its quotes"""
+        start = self.pos
+        self.pos += 1
+        while self.pos < len(self.source):
+            char = self.source[self.pos]
+            if char == '\\':
+                self.pos += 2
+                continue
+            self.pos += 1
+            if char == quote or char == '\n':
+                break
+        self.push(self.source[start:self.pos])
+
+    def copy_regex(self):
+        """Copy a regular expression literal including its flags"""
+        start = self.pos
+        self.pos += 1
+        in_class = False
+        while self.pos < len(self.source):
+            char = self.source[self.pos]
+            self.pos += 1
+            if char == '\\':
+                self.pos += 1
+            elif char == '[':
+                in_class = True
+            elif char == ']':
+                in_class = False
+            elif char == '/' and not in_class:
+                break
+            elif char == '\n':
+                break
+        while self.pos < len(self.source) and self.source[self.pos].isalpha():
+            self.pos += 1
+        self.push(self.source[start:self.pos])
+
+    def copy_template(self):
+        """Copy a template literal, minifying the code inside ${...}"""
+        self.push('`')
+        self.pos += 1
+        start = self.pos
+        while self.pos < len(self.source):
+            char = self.source[self.pos]
+            if char == '\\':
+                self.pos += 2
+            elif char == '`':
+                self.pos += 1
+                self.out.append(self.source[start:self.pos])
+                return
+            elif self.source.startswith('${', self.pos):
+                self.pos += 2
+                self.out.append(self.source[start:self.pos])
+                self.minify_code(until_brace=True)
+                self.out.append('}')
+                self.pos += 1
+                start = self.pos
+            else:
+                self.pos += 1
+        self.out.append(self.source[start:self.pos])
+
+    def minify_code(self, until_brace=False):
+        """Minify code up to the end of input (or the '}' closing a ${...})"""
+        depth = 0
+        while self.pos < len(self.source):
+            char = self.source[self.pos]
+            if char in ' \t\r\n':
+                self.emit_space('\n' if char == '\n' else ' ')
+                self.pos += 1
+            elif char in '"\'':
+                self.copy_quoted(char)
+            elif char == '`':
+                self.copy_template()
+            elif self.source.startswith('//', self.pos):
+                end = self.source.find('\n', self.pos)
+                self.pos = len(self.source) if end == -1 else end
+            elif self.source.startswith('/*', self.pos):
+                end = self.source.find('*/', self.pos + 2)
+                end = len(self.source) if end == -1 else end + 2
+                # A comment spanning lines still separates statements
+                self.emit_space('\n' if '\n' in self.source[self.pos:end] else ' ')
+                self.pos = end
+            elif char == '/' and self.regex_allowed():
+                self.copy_regex()
+            else:
+                if char == '{':
+                    depth += 1
+                elif char == '}':
+                    if until_brace and depth == 0:
+                        return
+                    depth -= 1
+                self.push(char)
+                self.pos += 1
+
+    def minify(self):
+        self.minify_code()
+        return ''.join(self.out).strip() + '\n'
+
+def minify_js(source):
+    """Minify a script conservatively (comments and whitespace only)"""
+    return JsMinifier(source).minify()
+
+class AssetFingerprinter:
+    """Writes minified, content-hashed asset copies and points pages at them"""
+
+    def __init__(self, root=".", dry_run=False, force=False, max_workers=None):
+        self.root = root
+        self.dry_run = dry_run
+        self.force = force
+        self.max_workers = max_workers
+        self.manifest = self.load_manifest()
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def load_manifest(self):
+        """Load the asset manifest, starting fresh if it is missing or corrupt"""
+        try:
+            with open(self.path(MANIFEST_PATH), 'r', encoding='utf-8') as f:
+                return json.load(f).get('assets', {})
+        except (FileNotFoundError, json.JSONDecodeError, AttributeError):
+            return {}
+
+    def page_references(self, page, html):
+        """(match, site path of the source asset) for each local script/stylesheet reference"""
+        references = []
+        for match in ASSET_REFERENCE_PATTERN.finditer(html):
+            url = match.group(2)
+            resolved = url.lstrip('/') if url.startswith('/') else posixpath.normpath(
+                posixpath.join(posixpath.dirname(page), url))
+            references.append((match, source_path(resolved)))
+        return references
+
+    def referenced_assets(self, pages):
+        """Every existing source asset that some page references"""
+        sources = set(expand(SOURCE_PATTERNS, self.root))
+        referenced = set()
+        for page in pages:
+            html, _ = read_text(self.path(page))
+            referenced.update(asset for _, asset in self.page_references(page, html) if asset in sources)
+        return sorted(referenced)
+
+    def fingerprint(self, asset):
+        """Minify and write the hashed copy of one asset; returns (asset, entry, written)"""
+        source_hash = file_hash(self.path(asset))
+        entry = self.manifest.get(asset)
+
+        # Unchanged sources keep their fingerprint without being re-minified
+        if (not self.force and entry and entry.get('source_hash') == source_hash
+                and os.path.exists(self.path(entry['file']))):
+            return asset, entry, False
+
+        with open(self.path(asset), 'r', encoding='utf-8-sig') as f:
+            source = f.read()
+        minified = minify_css(source) + '\n' if asset.endswith('.css') else minify_js(source)
+        data = minified.encode('utf-8')
+
+        entry = {
+            'source_hash': source_hash,
+            'file': fingerprinted_path(asset, hash_bytes(data)),
+            'size': os.path.getsize(self.path(asset)),
+            'minified_size': len(data)
+        }
+
+        if self.dry_run or os.path.exists(self.path(entry['file'])):
+            return asset, entry, False
+
+        with open(self.path(entry['file']), 'wb') as f:
+            f.write(data)
+        return asset, entry, True
+
+    def rewrite_page(self, page):
+        """Point a page's references at the current fingerprinted copies; returns True if it changed"""
+        html, encoding = read_text(self.path(page))
+        parts = []
+        last = 0
+
+        for match, asset in self.page_references(page, html):
+            entry = self.manifest.get(asset)
+            if not entry:
+                continue
+            url = match.group(2)
+            new_url = posixpath.join(posixpath.dirname(url), posixpath.basename(entry['file']))
+            parts.append(html[last:match.start(2)] + new_url)
+            last = match.end(2)
+
+        updated = ''.join(parts) + html[last:]
+        if updated == html:
+            return False
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would update {page}")
+            return True
+        return write_if_changed(self.path(page), updated, encoding)
+
+    def remove_stale_copies(self):
+        """Delete fingerprinted copies that no manifest entry points at"""
+        current = {entry['file'] for entry in self.manifest.values()}
+        removed = 0
+        for pattern in OUTPUT_PATTERNS:
+            for path in glob.glob(self.path(pattern)):
+                relative_path = os.path.relpath(path, self.root).replace(os.sep, '/')
+                if relative_path not in current:
+                    if not self.dry_run:
+                        os.remove(path)
+                    removed += 1
+        return removed
+
+    def write_manifest(self):
+        content = json.dumps({'version': 1, 'assets': self.manifest}, indent=2, sort_keys=True) + '\n'
+        if self.dry_run:
+            return False
+        return write_if_changed(self.path(MANIFEST_PATH), content)
+
+    def run(self):
+        """Fingerprint referenced assets and rewrite page references"""
+        print("🔖 Fingerprinting JS/CSS assets..." + (" (DRY RUN)" if self.dry_run else ""))
+        pages = expand(PAGE_PATTERNS, self.root)
+        assets = [asset for asset in self.referenced_assets(pages) if not is_fingerprinted(asset)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(self.fingerprint, assets))
+            self.manifest = {asset: entry for asset, entry, _ in results}
+            updated_pages = sum(pool.map(self.rewrite_page, pages))
+
+        written = 0
+        for asset, entry, was_written in results:
+            if was_written:
+                written += 1
+                print(f"   {entry['file']}: {entry['size'] / 1024:.1f}KB → {entry['minified_size'] / 1024:.1f}KB")
+
+        removed = self.remove_stale_copies()
+        self.write_manifest()
+
+        print(f"✅ Assets: {written} of {len(assets)} fingerprinted copies written, {removed} stale removed; "
+              f"{updated_pages} of {len(pages)} pages updated")
+        return True
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Minify and fingerprint JS/CSS assets")
+    parser.add_argument('--force', action='store_true', help='Re-minify every asset even if unchanged')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    parser.add_argument('--root', default='.', help='Site root directory')
+    return parser.parse_args()
+
+def main():
+    """Fingerprint the site's assets"""
+    args = parse_arguments()
+
+    try:
+        AssetFingerprinter(root=args.root, dry_run=args.dry_run, force=args.force).run()
+    except OSError as e:
+        print(f"❌ Asset fingerprinting failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
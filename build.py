@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Static Site Build
+Single entry point for every generated artefact. Stages form a make-style
+dependency graph keyed on input file hashes; independent stages run in
+parallel and up-to-date stages are skipped.
+"""
+
+import argparse
+import glob
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from build_cache import BuildCache, FileHashIndex, hash_bytes
+
+class Stage:
+    """A build step: the files it reads, the files it writes and the stages it follows"""
+
+    def __init__(self, name, action, inputs, outputs, deps=None, description="", check=None):
+        self.name = name
+        self.action = action
+        self.inputs = inputs
+        self.outputs = outputs
+        self.deps = deps or []
+        self.description = description
+        # Optional callable returning why the stage cannot run here (e.g. a missing optional package), or None
+        self.check = check
+
+def expand(patterns):
+    """Expand glob patterns into a sorted list of existing files"""
+    files = set()
+    for pattern in patterns:
+        files.update(path for path in glob.glob(pattern, recursive=True) if os.path.isfile(path))
+    return sorted(files)
+
+def run_blog():
+    from generate_blog_posts import create_blog_post_pages
+    return create_blog_post_pages()
+
+def run_manifest():
+    from data_manifest import DataManifest
+    DataManifest().write()
+
+def run_search():
+    from search_index import SearchIndexBuilder
+    SearchIndexBuilder().build()
+
+def run_feeds():
+    from site_feeds import SiteFeeds
+    return SiteFeeds().update()
+
+def run_series():
+    from series_prerender import SeriesPrerenderer
+    return SeriesPrerenderer().update()
+
+def run_images():
+    from image_derivatives import ImageDeriver
+    return ImageDeriver().run()
+
+def images_unavailable():
+    from image_derivatives import missing_dependency
+    return missing_dependency()
+
+def run_css():
+    from css_purge import CssPurger
+    return CssPurger().run()
+
+def run_assets():
+    from asset_fingerprint import AssetFingerprinter
+    return AssetFingerprinter().run()
+
+def run_precompress():
+    from precompress import Precompressor
+    Precompressor().run()
+
+def default_stages():
+    """The site's build graph"""
+    from asset_fingerprint import OUTPUT_PATTERNS as FINGERPRINTED_PATTERNS
+    from asset_fingerprint import SOURCE_PATTERNS as FINGERPRINT_SOURCES
+    from css_purge import PAGE_PATTERNS
+    from image_derivatives import OUTPUT_PATTERNS as IMAGE_OUTPUTS
+    from image_derivatives import SOURCE_PATTERNS as IMAGE_SOURCES
+    from precompress import ASSET_PATTERNS
+
+    return [
+        Stage(
+            'blog', run_blog,
+            inputs=['data/blog_posts.json', 'hebrew-home/data/blog_posts.json', 'templates/*.html',
+                    'generate_blog_posts.py', 'site_templates.py'],
+            outputs=['blog/*.html', 'hebrew-home/blog/*.html', 'data/blog_index.json', 'data/blog/*.json',
+                     'hebrew-home/data/blog_index.json', 'hebrew-home/data/blog/*.json'],
+            description="Blog post pages for every locale"
+        ),
+        Stage(
+            'manifest', run_manifest,
+            inputs=['data/*.json', 'data_manifest.py'],
+            outputs=['data/manifest.json', 'data/v/*.json'],
+            # The blog stage writes data/blog_index.json
+            deps=['blog'],
+            description="Content-hash manifest for data files"
+        ),
+        Stage(
+            'search', run_search,
+            inputs=['data/*_episodes.json', 'data/blog_posts.json', 'hebrew-home/data/blog_posts.json',
+                    'search_index.py'],
+            outputs=['data/search/*.json'],
+            description="Prefix-sharded search index"
+        ),
+        Stage(
+            'feeds', run_feeds,
+            inputs=['data/*_episodes.json', 'data/blog_posts.json', 'hebrew-home/data/blog_posts.json',
+                    'site_feeds.py'],
+            outputs=['sitemap.xml', 'feeds/*.xml'],
+            deps=['blog'],
+            description="sitemap.xml and per-series RSS feeds"
+        ),
+        Stage(
+            'series', run_series,
+            inputs=['data/*_episodes.json', 'series_prerender.py'],
+            outputs=['series/*.html', 'hebrew-home/series/*.html'],
+            description="First page of episode cards pre-rendered into series pages"
+        ),
+        Stage(
+            'images', run_images,
+            inputs=IMAGE_SOURCES + ['image_derivatives.py'],
+            outputs=IMAGE_OUTPUTS + PAGE_PATTERNS,
+            deps=['blog', 'series'],
+            description="Resized WebP image derivatives and srcset attributes",
+            # The committed derivatives and srcset attributes stay as they are without Pillow
+            check=images_unavailable
+        ),
+        Stage(
+            'css', run_css,
+            inputs=['css/main.css', 'css/components.css', 'css/rtl.css', 'js/*.js',
+                    'hebrew-home/js/*.js', 'data/blog_posts.json', 'hebrew-home/data/blog_posts.json',
+                    'css_purge.py'],
+            # Pages are rewritten in place, so edits to them show up as changed outputs
+            outputs=['css/purged/*.css', 'reports/*.txt'] + PAGE_PATTERNS,
+            # Every stage that rewrites pages runs one after another
+            deps=['blog', 'series', 'images'],
+            description="Purged stylesheets and per-page critical CSS"
+        ),
+        Stage(
+            'assets', run_assets,
+            inputs=FINGERPRINT_SOURCES + ['asset_fingerprint.py'],
+            outputs=FINGERPRINTED_PATTERNS + ['asset-manifest.json'] + PAGE_PATTERNS,
+            deps=['blog', 'css'],
+            description="Minified, content-hashed JS/CSS and page references to them"
+        ),
+        Stage(
+            'precompress', run_precompress,
+            inputs=ASSET_PATTERNS + ['precompress.py'],
+            outputs=[pattern + '.gz' for pattern in ASSET_PATTERNS],
+            deps=['blog', 'series', 'images', 'css', 'assets', 'manifest', 'search', 'feeds'],
+            description="Gzip/Brotli siblings for text assets"
+        )
+    ]
+
+class SiteBuilder:
+    """Runs the stage graph, skipping stages whose inputs and outputs are unchanged"""
+
+    def __init__(self, stages, force=False, max_workers=None):
+        self.stages = {stage.name: stage for stage in stages}
+        self.force = force
+        self.max_workers = max_workers
+        self.hashes = FileHashIndex()
+        self.state = BuildCache('build_graph')
+        self.results = {}
+        self.order = []
+        self.validate()
+
+    def validate(self):
+        """Reject unknown dependencies and cycles; sets self.order (dependencies first)"""
+        for stage in self.stages.values():
+            for dep in stage.deps:
+                if dep not in self.stages:
+                    raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dep}'")
+
+        visiting, done = set(), set()
+
+        def visit(name):
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Dependency cycle through stage '{name}'")
+            visiting.add(name)
+            for dep in self.stages[name].deps:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+            self.order.append(name)
+
+        for name in self.stages:
+            visit(name)
+
+    def select(self, targets):
+        """The requested stages plus everything they depend on"""
+        if not targets:
+            return set(self.stages)
+
+        selected = set()
+        pending = list(targets)
+        while pending:
+            name = pending.pop()
+            if name not in self.stages:
+                raise ValueError(f"Unknown stage '{name}' (available: {', '.join(self.stages)})")
+            if name not in selected:
+                selected.add(name)
+                pending.extend(self.stages[name].deps)
+        return selected
+
+    def input_files_digest(self, stage):
+        """Hash of a stage's source input files"""
+        # Generated files never count as inputs (data/manifest.json matches data/*.json, js/main.<hash>.js
+        # matches js/*.js); what a stage takes from its dependencies is covered by their output signatures
+        generated = set(expand([pattern for other in self.stages.values() for pattern in other.outputs]))
+        return self.hashes.digest([path for path in expand(stage.inputs) if path not in generated])
+
+    def input_signature(self, stage, files_digest=None):
+        """Hash of a stage's input files and of what its dependencies produced"""
+        parts = [files_digest or self.input_files_digest(stage)]
+        for dep in sorted(stage.deps):
+            parts.append((self.state.get(dep) or {}).get('outputs', ''))
+        return hash_bytes('|'.join(parts).encode('utf-8'))
+
+    def output_signature(self, stage):
+        return self.hashes.digest(expand(stage.outputs))
+
+    def run_stage(self, name):
+        """Run one stage if it is out of date; returns its result record"""
+        stage = self.stages[name]
+        start = time.perf_counter()
+        result = {'name': name, 'status': 'skipped', 'error': None, 'files': None}
+
+        try:
+            reason = stage.check() if stage.check else None
+            if reason:
+                # Not up to date either, so nothing is recorded and it runs once it can
+                print(f"⚠️  [{name}] not run: {reason}")
+                self.state.set(name, {})
+                result['status'] = 'unavailable'
+                result['seconds'] = time.perf_counter() - start
+                return result
+
+            result['files'] = self.input_files_digest(stage)
+            inputs = self.input_signature(stage, result['files'])
+            previous = self.state.get(name) or {}
+
+            if (not self.force and previous.get('inputs') == inputs
+                    and previous.get('outputs') == self.output_signature(stage)):
+                result['seconds'] = time.perf_counter() - start
+                return result
+
+            print(f"▶️  [{name}] {stage.description}")
+            if stage.action() is False:
+                raise RuntimeError("stage reported failure")
+
+            # Provisional, for the stages that follow in this build; record_state() settles it
+            self.state.set(name, {'inputs': inputs, 'outputs': self.output_signature(stage)})
+            result['status'] = 'built'
+        except Exception as e:
+            result['status'] = 'failed'
+            result['error'] = e
+            # Whatever the stage managed to write is not a state to skip from
+            self.state.set(name, {})
+            print(f"❌ [{name}] failed: {e}")
+
+        result['seconds'] = time.perf_counter() - start
+        return result
+
+    def record_state(self):
+        """Record every stage's signatures once the whole graph has run.
+
+        Pages are rewritten in turn by blog/series, images, css and assets, so
+        outputs recorded as each stage finished would already be stale and the
+        next build would rerun them all.
+        """
+        for name in self.order:
+            result = self.results.get(name)
+            if not result or result['status'] not in ('built', 'skipped'):
+                continue
+
+            stage = self.stages[name]
+            files = self.input_files_digest(stage)
+            if files != result['files']:
+                # A later stage rewrote this stage's inputs, so what it built is out of date
+                print(f"⚠️  [{name}] inputs changed during the build; it will run again next time")
+                self.state.set(name, {})
+                continue
+            self.state.set(name, {'inputs': self.input_signature(stage, files),
+                                  'outputs': self.output_signature(stage)})
+
+    def build(self, targets=None):
+        """Run the selected stages, starting each as soon as its dependencies finish"""
+        build_start = time.perf_counter()
+        selected = self.select(targets)
+        remaining = set(selected)
+        running = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            while remaining or running:
+                for name in sorted(remaining):
+                    deps = [dep for dep in self.stages[name].deps if dep in selected]
+                    if any(self.results.get(dep, {}).get('status') in ('failed', 'blocked') for dep in deps):
+                        self.results[name] = {'name': name, 'status': 'blocked', 'error': None, 'seconds': 0.0}
+                        remaining.discard(name)
+                    elif all(dep in self.results for dep in deps):
+                        running[pool.submit(self.run_stage, name)] = name
+                        remaining.discard(name)
+
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    self.results[name] = future.result()
+
+        self.record_state()
+        self.hashes.save()
+        self.state.save()
+        self.print_summary(time.perf_counter() - build_start)
+        return all(result['status'] in ('built', 'skipped', 'unavailable') for result in self.results.values())
+
+    def print_summary(self, total_seconds):
+        """Print per-stage status and timing"""
+        icons = {'built': '✅', 'skipped': '⏭️ ', 'unavailable': '⚠️ ', 'failed': '❌', 'blocked': '⛔'}
+        print("\n📊 Build Summary:")
+        for name in self.stages:
+            if name in self.results:
+                result = self.results[name]
+                print(f"   {icons[result['status']]} {name:<12} {result['status']:<11} {result['seconds'] * 1000:8.1f}ms")
+        print(f"   Total: {total_seconds * 1000:.1f}ms")
+
+def parse_arguments(stage_names):
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(
+        description="Build the static site's generated files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="Stages: " + ', '.join(stage_names)
+    )
+    parser.add_argument('stages', nargs='*', help='Stages to build (default: all); dependencies are included')
+    parser.add_argument('--force', action='store_true', help='Rebuild even if stages are up to date')
+    parser.add_argument('--jobs', '-j', type=int, default=None, help='Maximum number of stages to run in parallel')
+    parser.add_argument('--list', action='store_true', help='List the stages and exit')
+    return parser.parse_args()
+
+def main():
+    """Build the site"""
+    # Every stage uses paths relative to the site root
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+
+    stages = default_stages()
+    args = parse_arguments([stage.name for stage in stages])
+
+    if args.list:
+        for stage in stages:
+            deps = f" (after {', '.join(stage.deps)})" if stage.deps else ""
+            print(f"{stage.name:<12} {stage.description}{deps}")
+        return 0
+
+    try:
+        builder = SiteBuilder(stages, force=args.force, max_workers=args.jobs)
+        return 0 if builder.build(args.stages) else 1
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 2
+
+if __name__ == "__main__":
+    exit(main())
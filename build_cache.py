@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Build Cache Helpers
+Content hashing and a persistent hash cache shared by the site build and update scripts
+"""
+
+import hashlib
+import json
+import os
+import threading
+
+HASH_LENGTH = 12
+CACHE_DIR = ".build-cache"
+
+def hash_bytes(data, length=HASH_LENGTH):
+    """Return a short hex SHA-256 digest of the given bytes"""
+    return hashlib.sha256(data).hexdigest()[:length]
+
+def file_hash(file_path, length=HASH_LENGTH):
+    """Return a short hex SHA-256 digest of a file's contents"""
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            digest.update(chunk)
+    return digest.hexdigest()[:length]
+
+class BuildCache:
+    """Persistent key → value mapping (usually source hashes) for incremental builds"""
+
+    def __init__(self, name, cache_dir=CACHE_DIR):
+        self.name = name
+        self.cache_dir = cache_dir
+        self.path = os.path.join(cache_dir, f"{name}.json")
+        self.entries = self.load()
+        self.dirty = False
+        self.lock = threading.Lock()
+
+    def load(self):
+        """Load cached entries, starting fresh if the cache is missing or corrupt"""
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+                return data if isinstance(data, dict) else {}
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def get(self, key, default=None):
+        """Get the cached value for a key"""
+        with self.lock:
+            return self.entries.get(key, default)
+
+    def set(self, key, value):
+        """Store a value for a key"""
+        with self.lock:
+            if self.entries.get(key) != value:
+                self.entries[key] = value
+                self.dirty = True
+
+    def is_fresh(self, key, value):
+        """Check whether the cached value for a key matches the given one"""
+        with self.lock:
+            return key in self.entries and self.entries[key] == value
+
+    def prune(self, keep_keys):
+        """Drop entries whose keys are no longer produced by the build"""
+        keep_keys = set(keep_keys)
+        with self.lock:
+            stale = [key for key in self.entries if key not in keep_keys]
+            for key in stale:
+                del self.entries[key]
+            if stale:
+                self.dirty = True
+        return stale
+
+    def clear(self):
+        """Forget every cached entry (forces a full rebuild)"""
+        with self.lock:
+            if self.entries:
+                self.entries = {}
+                self.dirty = True
+
+    def save(self):
+        """Write the cache back to disk if it changed"""
+        with self.lock:
+            if not self.dirty:
+                return False
+
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+
+            temp_path = self.path + '.tmp'
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=2, sort_keys=True, ensure_ascii=False)
+            os.replace(temp_path, self.path)
+
+            self.dirty = False
+            return True
+
+class FileHashIndex:
+    """File content hashes memoized by (mtime, size) so unchanged files are not re-read"""
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache = BuildCache('file_hashes', cache_dir=cache_dir)
+
+    def hash(self, file_path):
+        """Content hash of a file, reusing the cached one while its stat is unchanged"""
+        stat = os.stat(file_path)
+        key = file_path.replace(os.sep, '/')
+        entry = self.cache.get(key)
+
+        if entry and entry[0] == stat.st_mtime_ns and entry[1] == stat.st_size:
+            return entry[2]
+
+        content_hash = file_hash(file_path)
+        self.cache.set(key, [stat.st_mtime_ns, stat.st_size, content_hash])
+        return content_hash
+
+    def digest(self, file_paths):
+        """Combined hash over a set of files (paths and contents)"""
+        parts = [f"{path.replace(os.sep, '/')}:{self.hash(path)}" for path in sorted(file_paths)]
+        return hash_bytes('\n'.join(parts).encode('utf-8'))
+
+    def save(self):
+        """Persist the memoized hashes"""
+        return self.cache.save()
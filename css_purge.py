@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Unused-CSS Purge and Critical-CSS Inlining
+Scans every page and script for the class names they actually use, writes
+purged copies of the site stylesheets to css/purged/, points pages at them,
+inlines each page's own above-the-fold rules into its <head> with the full
+sheets loaded without blocking render, and regenerates the unused-class
+reports as a by-product
+"""
+
+import argparse
+import glob
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from build_cache import CACHE_DIR, BuildCache, file_hash, hash_bytes
+
+# Stylesheets that get purged copies (relative to the site root)
+SOURCE_SHEETS = ['css/main.css', 'css/components.css', 'css/rtl.css']
+PURGED_DIR = 'css/purged'
+
+# Pages that link the stylesheets; they are scanned and rewritten
+PAGE_PATTERNS = [
+    '*.html',
+    'blog/*.html',
+    'series/*.html',
+    'hebrew-home/*.html',
+    'hebrew-home/blog/*.html',
+    'hebrew-home/series/*.html'
+]
+
+# Scanned for class names only
+SCRIPT_PATTERNS = ['js/*.js', 'hebrew-home/js/*.js']
+CONTENT_PATTERNS = ['templates/*.html', 'data/blog_posts.json', 'hebrew-home/data/blog_posts.json']
+
+REPORT_PATH = 'reports/unused_css_classes.txt'
+TRULY_UNUSED_REPORT_PATH = 'reports/truly_unused_css_classes.txt'
+
+CRITICAL_START = '<!-- critical-css:start -->'
+CRITICAL_END = '<!-- critical-css:end -->'
+CRITICAL_BLOCK_PATTERN = re.compile(r'[ \t]*' + re.escape(CRITICAL_START) + r'.*?' + re.escape(CRITICAL_END) + r'\n?', re.DOTALL)
+
+CLASS_ATTR_PATTERN = re.compile(r'\bclass\s*=\s*(?:"([^"]*)"|\'([^\']*)\')')
+SCRIPT_BLOCK_PATTERN = re.compile(r'<script\b[^>]*>(.*?)</script>', re.DOTALL | re.IGNORECASE)
+TOKEN_PATTERN = re.compile(r'-?[_a-zA-Z][\w-]*')
+CSS_STRING_PATTERN = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')')
+SELECTOR_CLASS_PATTERN = re.compile(r'\.(-?[_a-zA-Z][\w-]*)')
+STYLESHEET_LINK_PATTERN = re.compile(r'[ \t]*<link rel="stylesheet" href="(?:\.\./)*css/')
+SHEET_HREF_PATTERN = re.compile(r'href="((?:\.\./)*)css/(main|components|rtl)\.css"')
+# Purged sheet links (possibly fingerprinted by asset_fingerprint.py); group 2 is the sheet name
+PURGED_LINK_PATTERN = re.compile(r'<link rel="stylesheet" href="((?:\.\./)*css/purged/(main|components|rtl)(?:\.[0-9a-f]+)?\.css)">')
+DEFERRED_LINK = ('<link rel="preload" href="\\1" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+                 '<noscript><link rel="stylesheet" href="\\1"></noscript>')
+DEFERRED_LINK_PATTERN = re.compile(r'<link rel="preload" href="([^"]+)" as="style" onload="[^"]*">'
+                                   r'<noscript><link rel="stylesheet" href="\1"></noscript>')
+
+# Above the fold: the body up to its second <section> (header, navigation and the first section)
+SECTION_PATTERN = re.compile(r'<section\b', re.IGNORECASE)
+# Statements left to the full sheets: animations can start once they load
+DEFERRED_STATEMENTS = ('@keyframes', '@-webkit-keyframes')
+
+# Grouping at-rules whose children are ordinary rules that can be purged
+GROUPING_AT_RULES = ('@media', '@supports', '@layer', '@container', '@document')
+
+def expand(patterns, root="."):
+    """Expand glob patterns into a sorted list of site-relative paths"""
+    files = set()
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(root, pattern)):
+            if os.path.isfile(path):
+                files.add(os.path.relpath(path, root).replace(os.sep, '/'))
+    return sorted(files)
+
+def strip_comments(css):
+    """Remove /* */ comments, leaving string literals alone"""
+    out = []
+    i = 0
+    quote = None
+    while i < len(css):
+        char = css[i]
+        if quote:
+            out.append(char)
+            if char == '\\' and i + 1 < len(css):
+                out.append(css[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+            out.append(char)
+        elif css.startswith('/*', i):
+            end = css.find('*/', i + 2)
+            i = len(css) if end == -1 else end + 2
+            continue
+        else:
+            out.append(char)
+        i += 1
+    return ''.join(out)
+
+def find_block_end(css, start):
+    """Index of the '}' closing the block whose '{' is just before start"""
+    depth = 1
+    i = start
+    quote = None
+    while i < len(css):
+        char = css[i]
+        if quote:
+            if char == '\\':
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    raise ValueError("Unbalanced braces in stylesheet")
+
+def parse_css(css):
+    """Parse comment-free CSS into a list of nodes.
+
+    Nodes are ('rule', prelude, body), ('group', prelude, children) for
+    @media-style at-rules and ('statement', text) for everything kept verbatim.
+    """
+    nodes = []
+    i = 0
+    while i < len(css):
+        brace = css.find('{', i)
+        semicolon = css.find(';', i)
+        if brace == -1 and semicolon == -1:
+            break
+
+        # Top-level statements such as @import and @charset
+        if semicolon != -1 and (brace == -1 or semicolon < brace) and css[i:semicolon].strip().startswith('@'):
+            nodes.append(('statement', css[i:semicolon + 1].strip()))
+            i = semicolon + 1
+            continue
+
+        prelude = ' '.join(css[i:brace].split())
+        end = find_block_end(css, brace + 1)
+        body = css[brace + 1:end]
+
+        if prelude.startswith(GROUPING_AT_RULES):
+            nodes.append(('group', prelude, parse_css(body)))
+        elif prelude.startswith('@'):
+            nodes.append(('statement', f"{prelude} {{{body}}}"))
+        else:
+            nodes.append(('rule', prelude, body))
+        i = end + 1
+    return nodes
+
+def split_selectors(prelude):
+    """Split a selector list on top-level commas"""
+    selectors = []
+    depth = 0
+    current = []
+    for char in prelude:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == ',' and depth == 0:
+            selectors.append(''.join(current).strip())
+            current = []
+        else:
+            current.append(char)
+    selectors.append(''.join(current).strip())
+    return [selector for selector in selectors if selector]
+
+def selector_classes(selector):
+    """Classes a selector needs on the page; :not()/:is()-style arguments and attribute tests don't count"""
+    simplified = re.sub(r'\[[^\]]*\]', '', selector)
+    while True:
+        reduced = re.sub(r':[\w-]+\([^()]*\)', '', simplified)
+        if reduced == simplified:
+            break
+        simplified = reduced
+    return set(SELECTOR_CLASS_PATTERN.findall(simplified))
+
+def stylesheet_classes(nodes):
+    """Every class name used in the selectors of a parsed stylesheet"""
+    classes = set()
+    for node in nodes:
+        if node[0] == 'rule':
+            for selector in split_selectors(node[1]):
+                classes.update(selector_classes(selector))
+        elif node[0] == 'group':
+            classes.update(stylesheet_classes(node[2]))
+    return classes
+
+def purge_nodes(nodes, used):
+    """Drop selectors that need a class nobody uses, then rules and groups left empty"""
+    kept = []
+    for node in nodes:
+        if node[0] == 'rule':
+            selectors = [selector for selector in split_selectors(node[1]) if selector_classes(selector) <= used]
+            if selectors:
+                kept.append(('rule', ', '.join(selectors), node[2]))
+        elif node[0] == 'group':
+            children = purge_nodes(node[2], used)
+            if children:
+                kept.append(('group', node[1], children))
+        else:
+            kept.append(node)
+    return kept
+
+def critical_nodes(nodes, classes):
+    """The rules of a parsed sheet that markup using only these classes needs for its first paint"""
+    return [node for node in purge_nodes(nodes, classes)
+            if not (node[0] == 'statement' and node[1].startswith(DEFERRED_STATEMENTS))]
+
+def serialize_css(nodes, indent=''):
+    """Write parsed nodes back out, keeping declaration bodies as authored"""
+    lines = []
+    for node in nodes:
+        if node[0] == 'rule':
+            body = '\n'.join(indent + '  ' + line.strip() for line in node[2].strip().splitlines() if line.strip())
+            lines.append(f"{indent}{node[1]} {{\n{body}\n{indent}}}")
+        elif node[0] == 'group':
+            lines.append(f"{indent}{node[1]} {{\n{serialize_css(node[2], indent + '  ')}\n{indent}}}")
+        else:
+            lines.append(indent + node[1])
+    return '\n\n'.join(lines)
+
+def minify_css(css):
+    """Collapse a stylesheet onto one line, leaving string literals untouched"""
+    parts = CSS_STRING_PATTERN.split(strip_comments(css))
+    for i in range(0, len(parts), 2):
+        text = re.sub(r'\s+', ' ', parts[i])
+        text = re.sub(r'\s*([{};,>])\s*', r'\1', text)
+        # Only the space after a colon can go: '.a :hover' differs from '.a:hover'
+        parts[i] = re.sub(r':\s+', ':', text)
+    return ''.join(parts).replace(';}', '}').strip()
+
+def markup_classes(html):
+    """Class names in the class attributes of some markup"""
+    classes = set()
+    for double_quoted, single_quoted in CLASS_ATTR_PATTERN.findall(html):
+        classes.update((double_quoted or single_quoted).split())
+    return classes
+
+def above_the_fold(html):
+    """The markup a visitor sees before scrolling, approximated by sections"""
+    body = html[max(html.find('<body'), 0):]
+    sections = [match.start() for match in SECTION_PATTERN.finditer(body)]
+    return body[:sections[1]] if len(sections) > 1 else body
+
+def detect_encoding(data):
+    """Encoding of a text file from its byte-order mark (some pages are saved as UTF-16)"""
+    if data.startswith((b'\xff\xfe', b'\xfe\xff')):
+        return 'utf-16'
+    if data.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    return 'utf-8'
+
+def read_text(file_path):
+    """Decode a file as-is (line endings included); returns (text, encoding)"""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    encoding = detect_encoding(data)
+    return data.decode(encoding), encoding
+
+def write_if_changed(file_path, content, encoding='utf-8'):
+    """Write a file only if its bytes differ, so unchanged files keep their mtime"""
+    data = content.encode(encoding)
+    try:
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                return False
+    except FileNotFoundError:
+        pass
+
+    directory = os.path.dirname(file_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+
+    with open(file_path, 'wb') as f:
+        f.write(data)
+    return True
+
+class CssPurger:
+    """Purges the site stylesheets against the classes pages and scripts reference"""
+
+    def __init__(self, root=".", dry_run=False, force=False, max_workers=None):
+        self.root = root
+        self.dry_run = dry_run
+        self.force = force
+        self.max_workers = max_workers
+        self.cache = BuildCache('css_purge', cache_dir=os.path.join(root, CACHE_DIR))
+        self.markup_classes = set()
+        self.used_classes = set()
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def read(self, relative_path):
+        return read_text(self.path(relative_path))
+
+    def scan(self):
+        """Collect class names from markup (class attributes) and from scripts (any identifier-like token)"""
+        markup = set()
+        scripted = set()
+
+        for relative_path in expand(PAGE_PATTERNS + CONTENT_PATTERNS, self.root):
+            text, _ = self.read(relative_path)
+            if relative_path.endswith('.json'):
+                text = text.replace('\\"', '"')
+            markup.update(markup_classes(text))
+            # Inline scripts can build class names the same way js/*.js does
+            for script in SCRIPT_BLOCK_PATTERN.findall(text):
+                scripted.update(TOKEN_PATTERN.findall(script))
+
+        # Scripts toggle and compose class names at runtime, so every token counts
+        for relative_path in expand(SCRIPT_PATTERNS, self.root):
+            scripted.update(TOKEN_PATTERN.findall(self.read(relative_path)[0]))
+
+        self.markup_classes = markup
+        self.used_classes = markup | scripted
+        return self.used_classes
+
+    def purge_sheet(self, relative_path, used_hash):
+        """Write the purged copy of one stylesheet; returns (path, classes, written, before, after)"""
+        source_hash = file_hash(self.path(relative_path))
+        output_path = f"{PURGED_DIR}/{os.path.basename(relative_path)}"
+        signature = f"{source_hash}:{used_hash}"
+
+        nodes = parse_css(strip_comments(self.read(relative_path)[0]))
+        classes = stylesheet_classes(nodes)
+        before = os.path.getsize(self.path(relative_path))
+
+        cached = self.cache.get(relative_path) or {}
+        if not self.force and cached.get('signature') == signature and os.path.exists(self.path(output_path)):
+            return output_path, classes, False, before, os.path.getsize(self.path(output_path))
+
+        purged = "/* Generated by css_purge.py from " + relative_path + " - do not edit */\n\n"
+        purged += serialize_css(purge_nodes(nodes, self.used_classes)) + "\n"
+        after = len(purged.encode('utf-8'))
+
+        if self.dry_run:
+            return output_path, classes, False, before, after
+
+        written = write_if_changed(self.path(output_path), purged)
+        self.cache.set(relative_path, {'signature': signature})
+        return output_path, classes, written, before, after
+
+    def purged_nodes(self, relative_path):
+        """Parsed rules of a stylesheet's purged copy"""
+        return purge_nodes(parse_css(strip_comments(self.read(relative_path)[0])), self.used_classes)
+
+    def process_page(self, relative_path, sheet_nodes):
+        """Point a page at the purged stylesheets, inline its critical CSS and defer the sheets; returns True if it changed"""
+        original, encoding = self.read(relative_path)
+        html = CRITICAL_BLOCK_PATTERN.sub('', original)
+        html = DEFERRED_LINK_PATTERN.sub(r'<link rel="stylesheet" href="\1">', html)
+
+        if not SHEET_HREF_PATTERN.search(html) and 'css/purged/' not in html:
+            return False
+
+        html = SHEET_HREF_PATTERN.sub(r'href="\1css/purged/\2.css"', html)
+
+        # Only the rules this page's own header and first section use, from each sheet it links, in order
+        fold = markup_classes(above_the_fold(html))
+        critical = ''.join(minify_css(serialize_css(critical_nodes(sheet_nodes[name], fold)))
+                           for _, name in PURGED_LINK_PATTERN.findall(html))
+
+        if critical:
+            # The critical styles go right before the first stylesheet so they apply first
+            match = STYLESHEET_LINK_PATTERN.search(html)
+            insert_at = match.start() if match else html.find('</head>')
+            if insert_at == -1:
+                return False
+            block = f"    {CRITICAL_START}\n    <style>{critical}</style>\n    {CRITICAL_END}\n"
+            html = html[:insert_at] + block + html[insert_at:]
+            # With the first paint covered, the full sheets no longer block rendering
+            html = PURGED_LINK_PATTERN.sub(DEFERRED_LINK, html)
+
+        if html == original:
+            return False
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would update {relative_path}")
+            return True
+        return write_if_changed(self.path(relative_path), html, encoding)
+
+    def write_reports(self, all_classes):
+        """Regenerate the unused-class reports"""
+        potentially_unused = sorted(all_classes - self.markup_classes)
+        truly_unused = sorted(all_classes - self.used_classes)
+
+        report = f"Total CSS classes found: {len(all_classes)}\n"
+        report += f"Potentially unused classes: {len(potentially_unused)}\n\n"
+        report += ''.join(name + '\n' for name in potentially_unused)
+
+        if self.dry_run:
+            return len(potentially_unused), len(truly_unused)
+
+        write_if_changed(self.path(REPORT_PATH), report)
+        write_if_changed(self.path(TRULY_UNUSED_REPORT_PATH), ''.join(name + '\n' for name in truly_unused))
+        return len(potentially_unused), len(truly_unused)
+
+    def run(self):
+        """Purge stylesheets, update pages and reports"""
+        print("✂️  Purging unused CSS..." + (" (DRY RUN)" if self.dry_run else ""))
+        used = self.scan()
+        used_hash = hash_bytes('\n'.join(sorted(used)).encode('utf-8'))
+
+        pages = expand(PAGE_PATTERNS, self.root)
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            sheets = list(pool.map(lambda sheet: self.purge_sheet(sheet, used_hash), SOURCE_SHEETS))
+            sheet_nodes = dict(zip((os.path.splitext(os.path.basename(sheet))[0] for sheet in SOURCE_SHEETS),
+                                   pool.map(self.purged_nodes, SOURCE_SHEETS)))
+            updated_pages = sum(pool.map(lambda page: self.process_page(page, sheet_nodes), pages))
+
+        all_classes = set()
+        for output_path, classes, written, before, after in sheets:
+            all_classes.update(classes)
+            status = "written" if written else "unchanged"
+            print(f"   {output_path}: {before / 1024:.1f}KB → {after / 1024:.1f}KB ({status})")
+
+        potentially_unused, truly_unused = self.write_reports(all_classes)
+
+        if not self.dry_run:
+            self.cache.prune(SOURCE_SHEETS)
+            self.cache.save()
+
+        print(f"✅ CSS: {len(used)} referenced names, {truly_unused} of {len(all_classes)} classes unused "
+              f"({potentially_unused} not in markup); {updated_pages} of {len(pages)} pages updated")
+        return True
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Purge unused CSS and inline each page's critical styles")
+    parser.add_argument('--force', action='store_true', help='Rebuild purged stylesheets even if up to date')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    parser.add_argument('--root', default='.', help='Site root directory')
+    return parser.parse_args()
+
+def main():
+    """Purge the site stylesheets"""
+    args = parse_arguments()
+
+    try:
+        CssPurger(root=args.root, dry_run=args.dry_run, force=args.force).run()
+    except (OSError, ValueError) as e:
+        print(f"❌ CSS purge failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -7,6 +7,7 @@ Converts Spotify API episode data to match existing JSON format
 import json
 import re
 from datetime import datetime
+from run_metrics import metrics
 from spotify_auth import load_config
 
 class EpisodeFormatter:
@@ -141,13 +142,16 @@ class EpisodeFormatter:
                 "file_path": self.generate_file_path(series_name)
             }
 
-    def format_multiple_episodes(self, spotify_episodes, series_name, existing_episodes=None):
-        """Format multiple episodes and assign proper episode numbers"""
+    def format_multiple_episodes(self, spotify_episodes, series_name, existing_episodes=None, max_episode_number=None):
+        """Format multiple episodes and assign proper episode numbers (after max_episode_number, if known)"""
         if existing_episodes is None:
             existing_episodes = []
 
         # Determine starting episode number
-        next_episode_num = self.determine_episode_number(series_name, existing_episodes)
+        if max_episode_number is not None:
+            next_episode_num = max_episode_number + 1
+        else:
+            next_episode_num = self.determine_episode_number(series_name, existing_episodes)
 
         formatted_episodes = []
 
@@ -158,12 +162,19 @@ class EpisodeFormatter:
             reverse=True
         )
 
-        for spotify_episode in sorted_episodes:
-            formatted = self.format_episode(spotify_episode, series_name, next_episode_num)
-            if formatted:
-                formatted_episodes.append(formatted)
-            # Always increment episode number, even if formatting failed
-            next_episode_num += 1
+        with metrics.timed('format', help="Time to format a batch of new episodes", series=series_name):
+            for spotify_episode in sorted_episodes:
+                formatted = self.format_episode(spotify_episode, series_name, next_episode_num)
+                if formatted:
+                    formatted_episodes.append(formatted)
+                # Always increment episode number, even if formatting failed
+                next_episode_num += 1
+
+        metrics.inc('episodes_formatted_total', len(formatted_episodes), help="New episodes formatted for the catalog",
+                    series=series_name)
+        if len(formatted_episodes) < len(sorted_episodes):
+            metrics.inc('episodes_format_failed_total', len(sorted_episodes) - len(formatted_episodes),
+                        help="New episodes that could not be formatted", series=series_name)
 
         return formatted_episodes
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Data Manifest Generator
+Writes data/manifest.json mapping each data file to its content hash so the
+front end can request content-addressed URLs instead of cache-busting every visit
+"""
+
+import glob
+import json
+import os
+import shutil
+from build_cache import file_hash
+
+MANIFEST_NAME = "manifest.json"
+HASHED_DIR_NAME = "v"
+
+class DataManifest:
+    """Builds the content-hash manifest for the JSON files in the data directory"""
+
+    def __init__(self, data_dir="data", hashed_filenames=True, dry_run=False):
+        self.data_dir = data_dir
+        self.hashed_filenames = hashed_filenames
+        self.dry_run = dry_run
+        self.manifest_path = os.path.join(data_dir, MANIFEST_NAME)
+        self.hashed_dir = os.path.join(data_dir, HASHED_DIR_NAME)
+
+    def list_data_files(self):
+        """List the data files covered by the manifest"""
+        files = []
+        for path in sorted(glob.glob(os.path.join(self.data_dir, '*.json'))):
+            if os.path.basename(path) != MANIFEST_NAME:
+                files.append(path)
+        return files
+
+    def hashed_name(self, file_name, content_hash):
+        """Generate the content-addressed filename: name.json → name.<hash>.json"""
+        stem, ext = os.path.splitext(file_name)
+        return f"{stem}.{content_hash}{ext}"
+
+    def build_entries(self):
+        """Hash every data file and build its manifest entry"""
+        entries = {}
+
+        for path in self.list_data_files():
+            file_name = os.path.basename(path)
+            content_hash = file_hash(path)
+
+            if self.hashed_filenames:
+                url = f"{HASHED_DIR_NAME}/{self.hashed_name(file_name, content_hash)}"
+            else:
+                url = f"{file_name}?v={content_hash}"
+
+            entries[file_name] = {
+                "hash": content_hash,
+                "size": os.path.getsize(path),
+                "url": url
+            }
+
+        return entries
+
+    def load_manifest(self):
+        """Load the currently published manifest, if any"""
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def write_hashed_copies(self, entries):
+        """Copy each data file to its hashed name and prune stale copies"""
+        if not os.path.exists(self.hashed_dir):
+            os.makedirs(self.hashed_dir)
+
+        wanted = set()
+        for file_name, entry in entries.items():
+            hashed_name = os.path.basename(entry['url'])
+            wanted.add(hashed_name)
+            target = os.path.join(self.hashed_dir, hashed_name)
+            if not os.path.exists(target):
+                shutil.copy2(os.path.join(self.data_dir, file_name), target)
+                print(f"📦 Wrote hashed copy: {target}")
+
+        for path in glob.glob(os.path.join(self.hashed_dir, '*.json')):
+            if os.path.basename(path) not in wanted:
+                os.remove(path)
+                print(f"🧹 Removed stale hashed copy: {path}")
+
+    def write(self):
+        """Write the manifest (and hashed copies) if anything changed"""
+        entries = self.build_entries()
+        manifest = {"version": 1, "files": entries}
+
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would write manifest for {len(entries)} data files to {self.manifest_path}")
+            return manifest
+
+        if self.hashed_filenames:
+            self.write_hashed_copies(entries)
+        elif os.path.isdir(self.hashed_dir):
+            shutil.rmtree(self.hashed_dir)
+            print(f"🧹 Removed hashed copies directory: {self.hashed_dir}")
+
+        if self.load_manifest() == manifest:
+            print(f"📋 Data manifest unchanged: {self.manifest_path}")
+            return manifest
+
+        # Write to a temporary file first so readers never see a partial manifest
+        temp_path = self.manifest_path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, self.manifest_path)
+
+        print(f"🗂️  Wrote data manifest for {len(entries)} files: {self.manifest_path}")
+        return manifest
+
+def main():
+    """Regenerate the data manifest for the current data directory"""
+    try:
+        manifest = DataManifest().write()
+        for file_name, entry in manifest['files'].items():
+            print(f"   {file_name}: {entry['hash']} ({entry['size']:,} bytes)")
+    except Exception as e:
+        print(f"❌ Data manifest generation failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
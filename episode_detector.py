@@ -4,46 +4,63 @@ Core Episode Detection Engine
 Fetches episodes from Spotify API, filters trailers, and identifies new episodes
 """
 
-import json
 import os
 from datetime import datetime
+from episode_index import EpisodeIndex, index_path
+from episode_journal import EpisodeJournal
+from episode_store import EpisodeStore
+from run_metrics import FAST_BUCKETS, metrics
 from spotify_auth import SpotifyAuth, load_config
 
 class EpisodeDetector:
     """Main class for detecting new podcast episodes"""
 
-    def __init__(self, config):
+    def __init__(self, config, auth=None):
         self.config = config
-        self.auth = SpotifyAuth(
+        # Several configs can share one authenticated client (see tenant_runner.py)
+        self.auth = auth or SpotifyAuth(
             config['spotify']['client_id'],
             config['spotify']['client_secret']
         )
         self.trailer_keywords = config['settings']['trailer_keywords']
+        catalog_db = config['settings'].get('catalog_db')
+        self.store = EpisodeStore(catalog_db, self.get_episode_key) if catalog_db else None
 
     def is_trailer(self, episode):
         """Determine if an episode is a trailer based on various criteria"""
-        # Handle None or invalid episode data
-        if not episode or not isinstance(episode, dict):
-            print("⚠️  Invalid episode data received")
-            return True
+        with metrics.timed('trailer_check', buckets=FAST_BUCKETS, help="Time spent classifying one episode"):
+            # Handle None or invalid episode data
+            if not episode or not isinstance(episode, dict):
+                print("⚠️  Invalid episode data received")
+                metrics.inc('episodes_filtered_total', help="Fetched episodes dropped as trailers or invalid",
+                            reason='invalid')
+                return True
 
-        title = episode.get('name', '').lower()
+            title = episode.get('name', '').lower()
 
-        # Check for trailer keywords in title
-        for keyword in self.trailer_keywords:
-            if keyword in title:
-                print(f"🚫 Filtering trailer: '{episode.get('name')}' (keyword: {keyword})")
-                return True
+            # Check for trailer keywords in title
+            for keyword in self.trailer_keywords:
+                if keyword in title:
+                    print(f"🚫 Filtering trailer: '{episode.get('name')}' (keyword: {keyword})")
+                    metrics.inc('episodes_filtered_total', help="Fetched episodes dropped as trailers or invalid",
+                                reason=keyword)
+                    return True
 
-        return False
+            return False
 
-    def fetch_show_episodes(self, show_id, limit=50):
-        """Fetch episodes for a specific show from Spotify API"""
+    def fetch_show_episodes(self, show_id, limit=50, raise_errors=False):
+        """Fetch episodes for a specific show from Spotify API
+
+        A failed fetch returns [] (the show is skipped) unless raise_errors is
+        set, for callers that must not mistake a failure for "nothing new"
+        """
         print(f"📡 Fetching episodes for show: {show_id}")
 
         # Validate show_id format
         if not show_id or len(show_id) != 22:
             print(f"❌ Invalid show ID format: {show_id}")
+            if raise_errors:
+                raise Exception(f"Invalid show ID format: {show_id}")
             return []
 
         try:
@@ -58,14 +75,21 @@ class EpisodeDetector:
 
             # Add a check to ensure the response is valid
             if not episodes_data or not isinstance(episodes_data, dict):
+                if raise_errors:
+                    raise Exception("Invalid or empty response from Spotify API")
                 print(f"⚠️  Invalid or empty response from Spotify API for show {show_id}. Skipping.")
                 return []
 
             # Check if we got a valid response with items
             if 'items' not in episodes_data:
+                if raise_errors:
+                    raise Exception("No 'items' field in the Spotify API response")
                 print(f"⚠️  No 'items' field in response for show {show_id}. Response: {episodes_data}")
                 return []
 
+            metrics.inc('episodes_fetched_total', len(episodes_data.get('items', [])),
+                        help="Episodes returned by Spotify, before filtering", show=show_id)
+
             episodes = []
             for episode in episodes_data.get('items', []):
                 if not self.is_trailer(episode):
@@ -85,6 +109,8 @@ class EpisodeDetector:
                 print(f"💡 This usually means the API response was None")
             else:
                 print(f"❌ Failed to fetch episodes for show {show_id}: {error_msg}")
+            if raise_errors:
+                raise
             return []
 
     def load_existing_episodes(self, series_name):
@@ -92,20 +118,48 @@ class EpisodeDetector:
         filename = f"data/{series_name}_episodes.json"
 
         try:
+            if self.store:
+                self.store.sync(series_name, filename)
+                episodes = self.store.episodes(series_name)
+                print(f"📂 Loaded {len(episodes)} existing episodes from the catalog database")
+                return episodes
+
+            # Episodes journaled by an interrupted run count as existing
+            episodes, _, replayed = EpisodeJournal(self.get_episode_key).load(filename)
+            if replayed:
+                print(f"📓 Replayed {replayed} uncompacted journal change(s) for {filename}")
             if os.path.exists(filename):
-                with open(filename, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
-                    episodes = data.get('episodes', [])
-                    print(f"📂 Loaded {len(episodes)} existing episodes from {filename}")
-                    return episodes
+                print(f"📂 Loaded {len(episodes)} existing episodes from {filename}")
             else:
                 print(f"📂 No existing file found: {filename}")
-                return []
+            return episodes
 
         except Exception as e:
             print(f"❌ Error loading existing episodes from {filename}: {e}")
             return []
 
+    def load_known_keys(self, series_name):
+        """Episode keys a series already has, from its ID index instead of the full catalog when it is current"""
+        filename = f"data/{series_name}_episodes.json"
+
+        index = EpisodeIndex.load(filename)
+        if index is None:
+            print(f"📂 No current ID index for {series_name}, reading the full catalog")
+            return EpisodeIndex.from_episodes(self.load_existing_episodes(series_name), self.get_episode_key)
+
+        # Episodes journaled by an interrupted run count as existing; journal records carry their key
+        records = EpisodeJournal(self.get_episode_key).read(filename)
+        index.add([record.get('key') for record in records], [record.get('episode') for record in records])
+        print(f"📇 Loaded {len(index)} episode IDs from {index_path(filename)}")
+        return index
+
+    def highest_episode_number(self, series_name, known_keys=None):
+        """Highest integer episode number of a series, from its ID index (or the catalog database)"""
+        if self.store:
+            self.store.sync(series_name, f"data/{series_name}_episodes.json")
+            return self.store.max_episode_number(series_name)
+        return (known_keys or self.load_known_keys(series_name)).max_episode_number
+
     def get_episode_key(self, episode):
         """Generate a unique key for episode comparison"""
         # Handle None or invalid episode data
@@ -122,10 +176,18 @@ class EpisodeDetector:
                 return url.split('/episode/')[-1]
         return None
 
-    def find_new_episodes(self, spotify_episodes, existing_episodes):
-        """Compare Spotify episodes with existing data to find new ones"""
-        existing_keys = {self.get_episode_key(ep) for ep in existing_episodes if self.get_episode_key(ep) is not None}
-        print(f"📊 Found {len(existing_keys)} existing episode keys")
+    def find_new_episodes(self, spotify_episodes, existing_episodes, series_name=None, known_keys=None):
+        """Compare Spotify episodes with existing data (or known_keys, e.g. an EpisodeIndex) to find new ones"""
+        if self.store and series_name:
+            # Indexed lookup of just the fetched IDs instead of a scan of the catalog
+            existing_keys = self.store.known_keys(series_name, [self.get_episode_key(ep) for ep in spotify_episodes])
+            print(f"📊 {len(existing_keys)} of {len(spotify_episodes)} fetched episodes already in the catalog")
+        elif known_keys is not None:
+            existing_keys = known_keys
+            print(f"📊 Found {len(existing_keys)} existing episode keys")
+        else:
+            existing_keys = {self.get_episode_key(ep) for ep in existing_episodes if self.get_episode_key(ep) is not None}
+            print(f"📊 Found {len(existing_keys)} existing episode keys")
 
         new_episodes = []
         for episode in spotify_episodes:
@@ -145,8 +207,8 @@ class EpisodeDetector:
         print(f"✅ Total new episodes: {len(new_episodes)}")
         return new_episodes
 
-    def check_all_shows(self):
-        """Check all shows for new episodes"""
+    def check_all_shows(self, fetched=None):
+        """Check all shows for new episodes (fetched: {series: episodes} already retrieved from Spotify)"""
         print("🔍 Starting episode detection for all shows...\n")
 
         all_new_episodes = {}
@@ -154,14 +216,23 @@ class EpisodeDetector:
         for series_name, show_id in self.config['shows'].items():
             print(f"🎙️  Checking series: {series_name}")
 
-            # Fetch latest episodes from Spotify
-            spotify_episodes = self.fetch_show_episodes(show_id)
+            with metrics.timed('show_check', help="Time to fetch and compare one show", series=series_name):
+                # Fetch latest episodes from Spotify
+                if fetched is not None:
+                    spotify_episodes = fetched.get(series_name, [])
+                else:
+                    spotify_episodes = self.fetch_show_episodes(show_id)
+
+                # Known episode IDs only; the catalogs themselves are loaded later, and only for series with new episodes
+                known_keys = None if self.store else self.load_known_keys(series_name)
+                if self.store:
+                    self.store.sync(series_name, f"data/{series_name}_episodes.json")
 
-            # Load existing episodes
-            existing_episodes = self.load_existing_episodes(series_name)
+                # Find new episodes
+                new_episodes = self.find_new_episodes(spotify_episodes, [], series_name, known_keys)
 
-            # Find new episodes
-            new_episodes = self.find_new_episodes(spotify_episodes, existing_episodes)
+            metrics.inc('episodes_new_total', len(new_episodes), help="Fetched episodes not yet in the catalog",
+                        series=series_name)
 
             if new_episodes:
                 all_new_episodes[series_name] = new_episodes
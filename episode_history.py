@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Episode History Index
+Per-episode fingerprints for every snapshot in backups/ (plus the live data
+files), maintained incrementally in .build-cache so "when did this episode
+appear or change?" and "what changed between two runs?" are answered without
+re-parsing the backups. Also verifies that an update run only added episodes.
+"""
+
+import argparse
+import glob
+import json
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from build_cache import CACHE_DIR, BuildCache, FileHashIndex, hash_bytes
+
+BACKUP_NAME_PATTERN = re.compile(r'^(?P<series>.+)_episodes_backup_(?P<stamp>\d{8}_\d{6})\.json$')
+DATA_NAME_PATTERN = re.compile(r'^(?P<series>.+)_episodes\.json$')
+
+def fingerprint(episode):
+    """Content hash of one episode, independent of key order"""
+    return hash_bytes(json.dumps(episode, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+def describe(path):
+    """(series, datetime taken or None for a live data file) for a snapshot path, or None"""
+    name = os.path.basename(path)
+    match = BACKUP_NAME_PATTERN.match(name)
+    if match:
+        return match.group('series'), datetime.strptime(match.group('stamp'), '%Y%m%d_%H%M%S')
+    match = DATA_NAME_PATTERN.match(name)
+    if match:
+        return match.group('series'), None
+    return None
+
+class EpisodeHistory:
+    """Fingerprint index over the episode snapshots"""
+
+    def __init__(self, key_func, backup_dir="backups", data_dir="data", cache_dir=CACHE_DIR, max_workers=None):
+        self.key_func = key_func
+        self.backup_dir = backup_dir
+        self.data_dir = data_dir
+        self.max_workers = max_workers
+        self.cache = BuildCache('episode_history', cache_dir=cache_dir)
+        self.hashes = FileHashIndex(cache_dir=cache_dir)
+
+    def snapshot_paths(self):
+        backups = glob.glob(os.path.join(self.backup_dir, '*_episodes_backup_*.json'))
+        live = glob.glob(os.path.join(self.data_dir, '*_episodes.json'))
+        return sorted(path.replace(os.sep, '/') for path in backups + live if describe(path))
+
+    def index_snapshot(self, path):
+        """Index entry for one snapshot, re-reading it only if its content changed"""
+        content_hash = self.hashes.hash(path)
+        entry = self.cache.get(path)
+        if entry and entry['hash'] == content_hash:
+            return entry
+
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            data = json.load(f)
+        episodes = {}
+        for position, episode in enumerate(data.get('episodes', [])):
+            key = self.key_func(episode) or f"#{position}"
+            episodes[key] = [fingerprint(episode), episode.get('title', '')]
+
+        series_name, taken = describe(path) or (os.path.splitext(os.path.basename(path))[0], None)
+        entry = {'hash': content_hash, 'series': series_name,
+                 'taken': taken.isoformat() if taken else None, 'episodes': episodes}
+        self.cache.set(path, entry)
+        return entry
+
+    def update(self, paths=None):
+        """Bring the index up to date with the snapshots on disk; returns {path: entry}"""
+        paths = self.snapshot_paths() if paths is None else [path.replace(os.sep, '/') for path in paths]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            entries = dict(zip(paths, pool.map(self.index_snapshot, paths)))
+        return entries
+
+    def save(self, prune=True):
+        if prune:
+            self.cache.prune(self.snapshot_paths())
+        self.cache.save()
+        self.hashes.save()
+
+    def snapshots(self, series_name=None):
+        """[(path, entry)] oldest first; the live data file comes last"""
+        entries = self.update()
+        ordered = sorted(entries.items(), key=lambda item: (item[1]['series'], item[1]['taken'] is None,
+                                                           item[1]['taken'] or ''))
+        return [(path, entry) for path, entry in ordered if series_name in (None, entry['series'])]
+
+    def diff(self, old_path, new_path):
+        """{'added', 'removed', 'changed': [(key, title)]} between two snapshots"""
+        old, new = (self.index_snapshot(path.replace(os.sep, '/')) for path in (old_path, new_path))
+        old_episodes, new_episodes = old['episodes'], new['episodes']
+        return {
+            'added': [(key, new_episodes[key][1]) for key in new_episodes if key not in old_episodes],
+            'removed': [(key, old_episodes[key][1]) for key in old_episodes if key not in new_episodes],
+            'changed': [(key, new_episodes[key][1]) for key in new_episodes
+                        if key in old_episodes and old_episodes[key][0] != new_episodes[key][0]]
+        }
+
+    def timeline(self, episode_key):
+        """[(path, entry, event)] where an episode appeared, changed or disappeared"""
+        events = []
+        previous = {}
+        for path, entry in self.snapshots():
+            series_name = entry['series']
+            current = entry['episodes'].get(episode_key)
+            before = previous.get(series_name)
+            if current and not before:
+                events.append((path, entry, 'appeared'))
+            elif current and before and current[0] != before[0]:
+                events.append((path, entry, 'changed'))
+            elif before and not current:
+                events.append((path, entry, 'removed'))
+            previous[series_name] = current
+        return events
+
+    def verify_update(self, backup_path, file_path, expected_keys=None):
+        """Check that file_path differs from its pre-update backup only by added episodes; returns (ok, diff)"""
+        diff = self.diff(backup_path, file_path)
+        ok = not diff['removed'] and not diff['changed']
+        if expected_keys is not None:
+            ok = ok and {key for key, _ in diff['added']} <= set(expected_keys)
+        return ok, diff
+
+def snapshot_label(path, entry):
+    return f"{entry['taken'].replace('T', ' ')} ({os.path.basename(path)})" if entry['taken'] else f"current ({path})"
+
+def resolve_snapshot(history, reference):
+    """A snapshot path from a path, a backup file name or a series name (its live data file)"""
+    if os.path.exists(reference):
+        return reference
+    for path, entry in history.snapshots():
+        if os.path.basename(path) == reference or (entry['taken'] is None and entry['series'] == reference):
+            return path
+    raise FileNotFoundError(f"No snapshot matches '{reference}'")
+
+def print_diff(diff):
+    for kind, symbol in (('added', '+'), ('removed', '-'), ('changed', '~')):
+        for key, title in diff[kind]:
+            print(f"   {symbol} {key}  {title}")
+    print(f"📊 {len(diff['added'])} added, {len(diff['removed'])} removed, {len(diff['changed'])} changed")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Query the history of the episode catalogs across backups")
+    parser.add_argument('--series', type=str, help='Limit the listing or --changes to one series')
+    parser.add_argument('--episode', type=str, metavar='EPISODE_ID', help='When an episode appeared, changed or disappeared')
+    parser.add_argument('--diff', nargs=2, metavar=('OLD', 'NEW'),
+                        help='Compare two snapshots (backup file name, path, or a series name for its current file)')
+    parser.add_argument('--changes', action='store_true', help='What changed at each snapshot of --series')
+    parser.add_argument('--verify', action='store_true',
+                        help='Check that each series only gained episodes since its latest backup')
+    return parser.parse_args()
+
+def main():
+    """Update the history index and answer a query"""
+    from file_updater import FileUpdater
+
+    args = parse_arguments()
+    history = EpisodeHistory(FileUpdater().get_episode_key)
+    status = 0
+
+    try:
+        if args.episode:
+            events = history.timeline(args.episode)
+            for path, entry, event in events:
+                print(f"   {entry['series']}: {event} in {snapshot_label(path, entry)}")
+            print(f"🔎 {len(events)} event(s) for {args.episode}")
+        elif args.diff:
+            print_diff(history.diff(*(resolve_snapshot(history, reference) for reference in args.diff)))
+        elif args.changes:
+            if not args.series:
+                print("❌ --changes needs --series")
+                return 2
+            snapshots = history.snapshots(args.series)
+            for (old_path, _), (new_path, entry) in zip(snapshots, snapshots[1:]):
+                diff = history.diff(old_path, new_path)
+                print(f"🕒 {snapshot_label(new_path, entry)}: +{len(diff['added'])} -{len(diff['removed'])} ~{len(diff['changed'])}")
+        elif args.verify:
+            latest = {}
+            for path, entry in history.snapshots(args.series):
+                if entry['taken']:
+                    latest[entry['series']] = path
+                elif entry['series'] in latest:
+                    ok, diff = history.verify_update(latest[entry['series']], path)
+                    print(f"{'✅' if ok else '❌'} {entry['series']}: +{len(diff['added'])} -{len(diff['removed'])} "
+                          f"~{len(diff['changed'])} since {os.path.basename(latest[entry['series']])}")
+                    if not ok:
+                        status = 1
+        else:
+            counts = {}
+            for path, entry in history.snapshots(args.series):
+                counts.setdefault(entry['series'], []).append(entry)
+            for series_name, entries in counts.items():
+                backups = [entry for entry in entries if entry['taken']]
+                since = f" since {backups[0]['taken'][:10]}" if backups else ""
+                print(f"   {series_name}: {len(backups)} backup(s){since}, {len(entries[-1]['episodes'])} episodes now")
+    except (OSError, ValueError) as e:
+        print(f"❌ History query failed: {e}")
+        return 2
+    finally:
+        history.save()
+
+    return status
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Episode ID Index
+Compact sidecar per catalog (data/index/<series>_episodes.ids.json) holding the
+sorted episode IDs and the highest episode number, so detecting and numbering
+new episodes never has to parse the full catalogs
+"""
+
+import argparse
+import glob
+import json
+import os
+from bisect import bisect_left
+from build_cache import file_hash
+
+INDEX_DIR_NAME = "index"
+INDEX_VERSION = 3
+
+def index_path(data_path):
+    """data/dating_episodes.json → data/index/dating_episodes.ids.json"""
+    directory, file_name = os.path.split(data_path)
+    return os.path.join(directory, INDEX_DIR_NAME, os.path.splitext(file_name)[0] + '.ids.json')
+
+def highest_number(episodes):
+    """Highest integer episode_number, as EpisodeFormatter numbers from; 0 if there is none"""
+    numbers = [episode.get('episode_number') for episode in episodes if episode]
+    return max([number for number in numbers if isinstance(number, int)], default=0)
+
+class EpisodeIndex:
+    """Sorted episode IDs of one catalog, with binary-search membership"""
+
+    def __init__(self, ids, max_episode_number=0, source_hash=None):
+        self.ids = sorted(set(ids))
+        self.max_episode_number = max_episode_number
+        self.source_hash = source_hash
+        # Keys not in the data file yet (e.g. an uncompacted journal)
+        self.pending = set()
+
+    def __contains__(self, key):
+        if key in self.pending:
+            return True
+        position = bisect_left(self.ids, key)
+        return position < len(self.ids) and self.ids[position] == key
+
+    def __len__(self):
+        return len(self.ids) + len(self.pending.difference(self.ids))
+
+    def add(self, keys, episodes=()):
+        """Count keys (and the numbers of their episodes, if given) that are not in the data file yet"""
+        self.pending.update(key for key in keys if key)
+        self.max_episode_number = max(self.max_episode_number, highest_number(episodes))
+
+    @classmethod
+    def from_episodes(cls, episodes, key_func, source_hash=None):
+        return cls(
+            [key for key in map(key_func, episodes) if key],
+            max_episode_number=highest_number(episodes),
+            source_hash=source_hash
+        )
+
+    @classmethod
+    def load(cls, data_path):
+        """The index for a data file, or None if it is missing, unreadable or out of date"""
+        try:
+            with open(index_path(data_path), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Hashing the raw bytes is far cheaper than parsing the catalog
+            source_hash = file_hash(data_path)
+        except (OSError, ValueError):
+            return None
+
+        # Every writer goes through FileUpdater, so a hash mismatch means a hand edit
+        if data.get('version') != INDEX_VERSION or data.get('source_hash') != source_hash:
+            return None
+        return cls(data.get('ids', []), data.get('max_episode_number', 0), source_hash)
+
+    def write(self, data_path):
+        """Write the index next to its data file atomically"""
+        path = index_path(data_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        data = {
+            'version': INDEX_VERSION,
+            'source_hash': self.source_hash,
+            'count': len(self.ids),
+            'max_episode_number': self.max_episode_number,
+            'ids': self.ids
+        }
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(json.dumps(data, separators=(',', ':')) + '\n')
+        os.replace(path + '.tmp', path)
+        return path
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Check or rebuild the per-series episode ID indexes")
+    parser.add_argument('--rebuild', action='store_true', help='Rewrite every index from its data file')
+    return parser.parse_args()
+
+def main():
+    """Report stale indexes, optionally rebuilding them"""
+    from file_updater import FileUpdater
+
+    args = parse_arguments()
+    updater = FileUpdater()
+    stale = 0
+
+    for data_path in sorted(glob.glob('data/*_episodes.json')):
+        index = EpisodeIndex.load(data_path)
+        if args.rebuild or index is None:
+            if not args.rebuild:
+                print(f"⚠️  {index_path(data_path)} is missing or out of date")
+                stale += 1
+                continue
+            if not updater.update_index(data_path):
+                return 1
+            index = EpisodeIndex.load(data_path)
+        print(f"📇 {data_path}: {len(index)} IDs, highest number {index.max_episode_number}")
+
+    if stale:
+        print(f"❌ {stale} stale index(es); run python episode_index.py --rebuild")
+        return 1
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Episode Change Journal
+Write-ahead log (JSON lines, one file per catalog) of new and changed episodes.
+Updates append to the journal; compaction folds it into the published JSON
+atomically, and readers replay whatever has not been compacted yet.
+"""
+
+import argparse
+import glob
+import json
+import os
+from datetime import datetime
+from run_metrics import metrics
+
+JOURNAL_DIR_NAME = "journal"
+
+def journal_path(data_path):
+    """data/dating_episodes.json → data/journal/dating_episodes.jsonl"""
+    directory, file_name = os.path.split(data_path)
+    return os.path.join(directory, JOURNAL_DIR_NAME, os.path.splitext(file_name)[0] + '.jsonl')
+
+def sort_episodes(episodes):
+    """Same order as FileUpdater.merge_episodes: episode number, newest first"""
+    episodes.sort(key=lambda x: x.get('episode_number', 0), reverse=True)
+    return episodes
+
+def write_json_atomic(file_path, data):
+    """Write JSON to a temp file and swap it in, so readers never see a partial file"""
+    temp_path = file_path + '.tmp'
+    with metrics.timed('file_save', help="Time to write one catalog file"):
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, file_path)
+    metrics.inc('bytes_written_total', os.path.getsize(file_path), help="Bytes of catalog JSON written")
+
+class EpisodeJournal:
+    """Appends episode upserts per catalog and folds them into the catalog on compaction"""
+
+    def __init__(self, key_func, dry_run=False):
+        self.key_func = key_func
+        self.dry_run = dry_run
+
+    def read(self, data_path):
+        """Journal records not yet compacted into data_path"""
+        path = journal_path(data_path)
+        if not os.path.exists(path):
+            return []
+
+        records = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line_number, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # A run that died mid-append leaves a torn last line; everything before it is intact
+                    print(f"⚠️  Ignoring unreadable journal line {line_number} in {path}")
+        return records
+
+    def append(self, data_path, episodes):
+        """Record episodes as upserts; O(len(episodes)) regardless of catalog size"""
+        records = []
+        for episode in episodes:
+            key = self.key_func(episode)
+            if key:
+                records.append({'op': 'upsert', 'key': key, 'at': datetime.now().isoformat(timespec='seconds'),
+                                'episode': episode})
+        if not records:
+            return 0
+
+        path = journal_path(data_path)
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would journal {len(records)} episode(s) to {path}")
+            return len(records)
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+
+        print(f"📓 Journaled {len(records)} episode(s) to {path}")
+        return len(records)
+
+    def replay(self, episodes, records):
+        """Apply journal records to a list of episodes (replaying twice is harmless)"""
+        if not records:
+            return episodes
+
+        episodes = list(episodes)
+        positions = {self.key_func(episode): index for index, episode in enumerate(episodes)}
+        for record in records:
+            if record.get('op') != 'upsert' or not record.get('episode'):
+                continue
+            key = record.get('key')
+            if key in positions:
+                episodes[positions[key]] = record['episode']
+            else:
+                positions[key] = len(episodes)
+                episodes.append(record['episode'])
+        return sort_episodes(episodes)
+
+    def load(self, data_path):
+        """(episodes, data, replayed record count) for a catalog with its journal applied"""
+        if os.path.exists(data_path):
+            with open(data_path, 'r', encoding='utf-8-sig') as f:
+                data = json.load(f)
+        else:
+            data = {"episodes": []}
+
+        records = self.read(data_path)
+        if records:
+            data['episodes'] = self.replay(data.get('episodes', []), records)
+        return data.get('episodes', []), data, len(records)
+
+    def compact(self, data_path):
+        """Fold the journal into the catalog atomically, then drop the journal"""
+        path = journal_path(data_path)
+        if not os.path.exists(path):
+            return True
+
+        episodes, data, replayed = self.load(data_path)
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would compact {replayed} journaled change(s) into {data_path}")
+            return True
+
+        if replayed:
+            write_json_atomic(data_path, data)
+        # A crash before this line only means the same upserts are replayed again
+        os.remove(path)
+        print(f"🗜️  Compacted {replayed} journaled change(s) into {data_path} ({len(episodes)} episodes)")
+        return True
+
+    def pending(self, data_dir="data"):
+        """{catalog path: uncompacted record count} for every journal on disk"""
+        pending = {}
+        for path in sorted(glob.glob(os.path.join(data_dir, JOURNAL_DIR_NAME, '*.jsonl'))):
+            data_path = os.path.join(data_dir, os.path.basename(path)[:-len('.jsonl')] + '.json')
+            pending[data_path] = len(self.read(data_path))
+        return pending
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Show or compact the episode change journals")
+    parser.add_argument('series', nargs='*', help='Series to compact (default: every series with a journal)')
+    parser.add_argument('--compact', action='store_true', help='Fold journals into the episode files')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would be compacted without writing')
+    return parser.parse_args()
+
+def main():
+    """List pending journal records, optionally compacting them"""
+    from file_updater import FileUpdater
+
+    args = parse_arguments()
+    updater = FileUpdater(dry_run=args.dry_run)
+    journal = updater.journal
+
+    pending = journal.pending()
+    if args.series:
+        pending = {f"data/{name}_episodes.json": len(journal.read(f"data/{name}_episodes.json")) for name in args.series}
+
+    if not any(pending.values()):
+        print("📓 No uncompacted journal entries")
+        return 0
+
+    for data_path, count in pending.items():
+        print(f"📓 {data_path}: {count} uncompacted change(s)")
+
+    if not args.compact:
+        return 0
+
+    if not updater.compact_journals([data_path for data_path, count in pending.items() if count]):
+        return 1
+
+    # Published derivatives (manifest, search, feeds, series pages) follow the catalogs
+    updater.updated_files = [{'series': os.path.basename(data_path).replace('_episodes.json', '')}
+                             for data_path, count in pending.items() if count]
+    updater.refresh_site_files()
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+SQLite Episode Catalog
+Optional indexed store for the episode catalogs. The JSON files stay the
+published format (and the source of truth in git); the database mirrors them,
+answers lookups without loading whole files and exports the JSON layout unchanged.
+"""
+
+import argparse
+import glob
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from build_cache import file_hash
+from episode_journal import EpisodeJournal, journal_path, write_json_atomic
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS catalogs (
+    series TEXT PRIMARY KEY,
+    layout TEXT NOT NULL,
+    source_signature TEXT
+);
+CREATE TABLE IF NOT EXISTS episodes (
+    series TEXT NOT NULL,
+    episode_key TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    episode_number,
+    date_ordinal INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (series, episode_key)
+);
+CREATE INDEX IF NOT EXISTS idx_episodes_key ON episodes (episode_key);
+CREATE INDEX IF NOT EXISTS idx_episodes_series_position ON episodes (series, position);
+CREATE INDEX IF NOT EXISTS idx_episodes_series_date ON episodes (series, date_ordinal);
+CREATE INDEX IF NOT EXISTS idx_episodes_date ON episodes (date_ordinal);
+"""
+
+def date_ordinal(date_str):
+    """DD-MM-YY → proleptic Gregorian ordinal, or None for missing/odd dates"""
+    try:
+        return datetime.strptime(date_str, '%d-%m-%y').toordinal()
+    except (TypeError, ValueError):
+        return None
+
+def series_file(series_name):
+    return f"data/{series_name}_episodes.json"
+
+class EpisodeStore:
+    """SQLite mirror of data/<series>_episodes.json with indexed queries and JSON export"""
+
+    def __init__(self, db_path, key_func, dry_run=False):
+        self.db_path = db_path
+        self.key_func = key_func
+        self.dry_run = dry_run
+        self.journal = EpisodeJournal(key_func)
+        self.lock = threading.Lock()
+
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def row_key(self, episode, position):
+        # Episodes without a Spotify ID still need a stable row
+        return self.key_func(episode) or f"#{position}"
+
+    def episode_row(self, series_name, episode, position):
+        return (series_name, self.row_key(episode, position), position, episode.get('episode_number'),
+                date_ordinal(episode.get('date')), json.dumps(episode, ensure_ascii=False))
+
+    def source_signature(self, file_path):
+        """Hash of the JSON file plus any uncompacted journal"""
+        parts = [file_hash(path) for path in (file_path, journal_path(file_path)) if os.path.exists(path)]
+        return ':'.join(parts) or None
+
+    def sync(self, series_name, file_path=None):
+        """Re-import a catalog if its JSON (or journal) changed since the last import; returns True if it did"""
+        file_path = file_path or series_file(series_name)
+        signature = self.source_signature(file_path)
+
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT source_signature FROM catalogs WHERE series = ?', (series_name,)).fetchone()
+            if row and row[0] == signature:
+                return False
+
+            episodes, data, _ = self.journal.load(file_path)
+            layout = dict(data, episodes=None)
+            with self.connection:
+                self.connection.execute('DELETE FROM episodes WHERE series = ?', (series_name,))
+                self.connection.executemany(
+                    'INSERT OR REPLACE INTO episodes VALUES (?, ?, ?, ?, ?, ?)',
+                    [self.episode_row(series_name, episode, position) for position, episode in enumerate(episodes)])
+                self.connection.execute(
+                    'INSERT OR REPLACE INTO catalogs VALUES (?, ?, ?)',
+                    (series_name, json.dumps(layout, ensure_ascii=False), signature))
+
+        print(f"🗃️  Imported {len(episodes)} episodes for {series_name} into {self.db_path}")
+        return True
+
+    def episodes(self, series_name):
+        """Every episode of a series, in published order"""
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT data FROM episodes WHERE series = ? ORDER BY position', (series_name,)).fetchall()
+        return [json.loads(data) for data, in rows]
+
+    def count(self, series_name):
+        with self.lock:
+            return self.connection.execute(
+                'SELECT COUNT(*) FROM episodes WHERE series = ?', (series_name,)).fetchone()[0]
+
+    def known_keys(self, series_name, keys):
+        """Which of the given episode keys the series already has"""
+        keys = [key for key in keys if key]
+        known = set()
+        with self.lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(keys), 500):
+                chunk = keys[start:start + 500]
+                rows = self.connection.execute(
+                    f"SELECT episode_key FROM episodes WHERE series = ? AND episode_key IN ({','.join('?' * len(chunk))})",
+                    [series_name] + chunk).fetchall()
+                known.update(key for key, in rows)
+        return known
+
+    def max_episode_number(self, series_name):
+        with self.lock:
+            row = self.connection.execute(
+                "SELECT MAX(episode_number) FROM episodes WHERE series = ? AND typeof(episode_number) = 'integer'",
+                (series_name,)).fetchone()
+        return row[0] or 0
+
+    def find(self, episode_key):
+        """[(series, episode)] for an episode key across every series"""
+        with self.lock:
+            rows = self.connection.execute(
+                'SELECT series, data FROM episodes WHERE episode_key = ?', (episode_key,)).fetchall()
+        return [(series_name, json.loads(data)) for series_name, data in rows]
+
+    def episodes_between(self, start_date, end_date, series_name=None):
+        """[(series, episode)] dated between two DD-MM-YY dates (inclusive), oldest first"""
+        query = 'SELECT series, data FROM episodes WHERE date_ordinal BETWEEN ? AND ?'
+        params = [date_ordinal(start_date), date_ordinal(end_date)]
+        if series_name:
+            query += ' AND series = ?'
+            params.append(series_name)
+        with self.lock:
+            rows = self.connection.execute(query + ' ORDER BY date_ordinal, series, position', params).fetchall()
+        return [(series, json.loads(data)) for series, data in rows]
+
+    def add_episodes(self, series_name, episodes, replace=False):
+        """Insert (or with replace=True, upsert) episodes in one transaction; returns the number added or changed"""
+        if not episodes:
+            return 0
+
+        with self.lock:
+            try:
+                next_position = self.connection.execute(
+                    'SELECT COALESCE(MAX(position) + 1, 0) FROM episodes WHERE series = ?', (series_name,)).fetchone()[0]
+                rows = [self.episode_row(series_name, episode, next_position + offset)
+                        for offset, episode in enumerate(episodes)]
+                before = self.connection.total_changes
+                if replace:
+                    self.connection.executemany(
+                        'INSERT INTO episodes VALUES (?, ?, ?, ?, ?, ?) ON CONFLICT (series, episode_key) DO UPDATE SET '
+                        'episode_number = excluded.episode_number, date_ordinal = excluded.date_ordinal, data = excluded.data',
+                        rows)
+                else:
+                    self.connection.executemany('INSERT OR IGNORE INTO episodes VALUES (?, ?, ?, ?, ?, ?)', rows)
+                changed = self.connection.total_changes - before
+
+                if changed:
+                    self.reorder(series_name)
+
+                if self.dry_run:
+                    self.connection.rollback()
+                else:
+                    self.connection.commit()
+            except sqlite3.Error:
+                self.connection.rollback()
+                raise
+        return changed
+
+    def reorder(self, series_name):
+        """Renumber positions like FileUpdater.merge_episodes: stable sort, highest episode number first"""
+        rows = self.connection.execute(
+            'SELECT episode_key, episode_number FROM episodes WHERE series = ? ORDER BY position',
+            (series_name,)).fetchall()
+        rows.sort(key=lambda row: row[1] if row[1] is not None else 0, reverse=True)
+        self.connection.executemany(
+            'UPDATE episodes SET position = ? WHERE series = ? AND episode_key = ?',
+            [(position, series_name, key) for position, (key, _) in enumerate(rows)])
+
+    def export(self, series_name, file_path=None):
+        """Write the series back to its JSON file in the published layout"""
+        file_path = file_path or series_file(series_name)
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT layout FROM catalogs WHERE series = ?', (series_name,)).fetchone()
+        data = json.loads(row[0]) if row else {'episodes': None}
+        data['episodes'] = self.episodes(series_name)
+
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would export {len(data['episodes'])} episodes to {file_path}")
+            return True
+
+        write_json_atomic(file_path, data)
+        # The database now holds everything the journal had
+        if os.path.exists(journal_path(file_path)):
+            os.remove(journal_path(file_path))
+
+        with self.lock, self.connection:
+            self.connection.execute(
+                'UPDATE catalogs SET source_signature = ? WHERE series = ?',
+                (self.source_signature(file_path), series_name))
+        print(f"💾 Exported {len(data['episodes'])} episodes to {file_path}")
+        return True
+
+def list_series():
+    return sorted(os.path.basename(path).replace('_episodes.json', '') for path in glob.glob('data/*_episodes.json'))
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Query or rebuild the SQLite episode catalog")
+    parser.add_argument('--db', type=str, help='Database path (default: settings.catalog_db in the config)')
+    parser.add_argument('--config', type=str, default='episode_detector_config.json', help='Path to configuration file')
+    parser.add_argument('--find', type=str, metavar='EPISODE_ID', help='Show which series contain an episode')
+    parser.add_argument('--between', nargs=2, metavar=('FROM', 'TO'), help='List episodes dated FROM..TO (DD-MM-YY)')
+    parser.add_argument('--series', type=str, help='Limit --between to one series')
+    parser.add_argument('--export', action='store_true', help='Write every catalog back to its JSON file')
+    return parser.parse_args()
+
+def main():
+    """Sync the catalog from the JSON files and answer a query"""
+    from file_updater import FileUpdater
+
+    args = parse_arguments()
+    db_path = args.db
+    if not db_path:
+        with open(args.config, 'r', encoding='utf-8') as f:
+            db_path = json.load(f).get('settings', {}).get('catalog_db')
+    if not db_path:
+        print("❌ No catalog database configured (set settings.catalog_db or pass --db)")
+        return 2
+
+    store = EpisodeStore(db_path, FileUpdater().get_episode_key)
+    try:
+        for series_name in list_series():
+            store.sync(series_name)
+
+        if args.find:
+            matches = store.find(args.find)
+            for series_name, episode in matches:
+                print(f"   {series_name}: #{episode.get('episode_number')} {episode.get('title')} ({episode.get('date')})")
+            print(f"🔎 {len(matches)} match(es) for {args.find}")
+        elif args.between:
+            matches = store.episodes_between(*args.between, series_name=args.series)
+            for series_name, episode in matches:
+                print(f"   {episode.get('date')}  {series_name}: {episode.get('title')}")
+            print(f"🔎 {len(matches)} episode(s) between {args.between[0]} and {args.between[1]}")
+        elif args.export:
+            for series_name in list_series():
+                store.export(series_name)
+        else:
+            for series_name in list_series():
+                print(f"   {series_name}: {store.count(series_name)} episodes, "
+                      f"highest number {store.max_episode_number(series_name)}")
+    except (sqlite3.Error, OSError) as e:
+        print(f"❌ Catalog database error: {e}")
+        return 1
+    finally:
+        store.close()
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -6,11 +6,20 @@ Orchestrates the complete episode detection and update process
 
 import argparse
 import sys
+import time
 from datetime import datetime
-from episode_detector import EpisodeDetector
-from data_formatter import EpisodeFormatter
-from file_updater import FileUpdater
-from spotify_auth import load_config
+from run_metrics import metrics
+
+# The pipeline modules (and requests) are imported where they are used, so
+# --check and --help start without loading the update and publishing code
+
+# --check exit codes, for the workflow to branch on
+EXIT_NOTHING_NEW = 0
+EXIT_ERROR = 2
+EXIT_UPDATES_AVAILABLE = 10
+
+# Newest episodes per show to compare in --check; Spotify lists newest first
+CHECK_FETCH_LIMIT = 10
 
 def parse_arguments():
     """Parse command line arguments"""
@@ -24,6 +33,9 @@ Examples:
   python episode_update.py --series dating   # Check only dating series
   python episode_update.py --verbose         # Show detailed output
   python episode_update.py --no-backup       # Skip backup creation
+  python episode_update.py --check           # Exit 10 if there is anything new, 0 if not, 2 on error
+  python episode_update.py --metrics-dir /var/lib/node_exporter  # Write run metrics elsewhere
+  python episode_update.py --configs ../site-a/episode_detector_config.json ../site-b/episode_detector_config.json
         """
     )
 
@@ -58,6 +70,40 @@ Examples:
         help='Path to configuration file'
     )
 
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help=f'Only report whether any show has new episodes (exit {EXIT_UPDATES_AVAILABLE} if so, '
+             f'{EXIT_NOTHING_NEW} if not, {EXIT_ERROR} on error); writes nothing'
+    )
+
+    parser.add_argument(
+        '--configs',
+        nargs='+',
+        metavar='CONFIG',
+        help='Update several sites in one run; each config\'s site_root (default: its directory) holds its data'
+    )
+
+    parser.add_argument(
+        '--workers',
+        type=int,
+        default=4,
+        help='Concurrent show fetches in a --configs run (default: 4)'
+    )
+
+    parser.add_argument(
+        '--requests-per-second',
+        type=float,
+        default=5.0,
+        help='Spotify request budget shared by all sites in a --configs run (default: 5)'
+    )
+
+    parser.add_argument(
+        '--metrics-dir',
+        type=str,
+        help='Directory for the Prometheus textfile and run log (default: settings.metrics_dir)'
+    )
+
     return parser.parse_args()
 
 def print_header():
@@ -83,17 +129,40 @@ def print_footer(start_time, success):
     print(f"Total duration: {duration.total_seconds():.1f} seconds")
     print()
 
+def prefetch_embed_metadata(config, formatted_episodes_data):
+    """Attach oEmbed data (artwork, title, player size) to new episodes for the player facades"""
+    settings = config['settings']
+    if not settings.get('prefetch_oembed', True):
+        return
+
+    try:
+        from spotify_oembed import OEmbedPrefetcher
+        prefetcher = OEmbedPrefetcher(endpoint=settings.get('oembed_endpoint'))
+        for episodes in formatted_episodes_data.values():
+            prefetcher.enrich(episodes)
+        prefetcher.save()
+    except Exception as e:
+        # Facades fall back to a plain play button, so this never blocks the update
+        print(f"⚠️  oEmbed prefetch failed: {e}")
+
 def check_single_series(args, config, series_name):
     """Check a single series for new episodes"""
     print(f"🎯 Checking single series: {series_name}")
 
     try:
+        from data_formatter import EpisodeFormatter
+        from episode_detector import EpisodeDetector
+        from file_updater import FileUpdater
+
         # Initialize components
         detector = EpisodeDetector(config)
         formatter = EpisodeFormatter(config)
         updater = FileUpdater(
             backup_enabled=not args.no_backup,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            hashed_data_files=config['settings'].get('hashed_data_files', True),
+            catalog_db=config['settings'].get('catalog_db'),
+            backup_dir=config['settings'].get('backup_dir', 'backups')
         )
 
         # Get show ID
@@ -105,23 +174,22 @@ def check_single_series(args, config, series_name):
         # Fetch episodes from Spotify
         spotify_episodes = detector.fetch_show_episodes(show_id)
 
-        # Load existing episodes
-        existing_episodes = detector.load_existing_episodes(series_name)
-
-        # Find new episodes
-        new_episodes = detector.find_new_episodes(spotify_episodes, existing_episodes)
+        # Find new episodes against the ID index
+        known_keys = None if detector.store else detector.load_known_keys(series_name)
+        new_episodes = detector.find_new_episodes(spotify_episodes, [], series_name, known_keys)
 
         if not new_episodes:
             print(f"📋 No new episodes found for {series_name}")
             return True
 
-        # Format new episodes
+        # Format new episodes, numbering on from the index
         formatted_episodes = formatter.format_multiple_episodes(
-            new_episodes, series_name, existing_episodes
+            new_episodes, series_name, max_episode_number=detector.highest_episode_number(series_name, known_keys)
         )
 
         # Update files
         new_episodes_data = {series_name: formatted_episodes}
+        prefetch_embed_metadata(config, new_episodes_data)
         success = updater.update_all_files(new_episodes_data)
 
         return success
@@ -130,21 +198,28 @@ def check_single_series(args, config, series_name):
         print(f"❌ Error checking series {series_name}: {e}")
         return False
 
-def check_all_series(args, config):
-    """Check all series for new episodes"""
+def check_all_series(args, config, detector=None, fetched=None):
+    """Check all series for new episodes (a multi-config run passes its own detector and the fetched episodes)"""
     print("🔍 Checking all series for new episodes...")
 
     try:
+        from data_formatter import EpisodeFormatter
+        from episode_detector import EpisodeDetector
+        from file_updater import FileUpdater
+
         # Initialize components
-        detector = EpisodeDetector(config)
+        detector = detector or EpisodeDetector(config)
         formatter = EpisodeFormatter(config)
         updater = FileUpdater(
             backup_enabled=not args.no_backup,
-            dry_run=args.dry_run
+            dry_run=args.dry_run,
+            hashed_data_files=config['settings'].get('hashed_data_files', True),
+            catalog_db=config['settings'].get('catalog_db'),
+            backup_dir=config['settings'].get('backup_dir', 'backups')
         )
 
         # Detect new episodes
-        new_episodes_data = detector.check_all_shows()
+        new_episodes_data = detector.check_all_shows(fetched)
 
         if not new_episodes_data:
             print("📋 No new episodes found across any series")
@@ -154,13 +229,13 @@ def check_all_series(args, config):
         formatted_episodes_data = {}
 
         for series_name, spotify_episodes in new_episodes_data.items():
-            existing_episodes = detector.load_existing_episodes(series_name)
             formatted_episodes = formatter.format_multiple_episodes(
-                spotify_episodes, series_name, existing_episodes
+                spotify_episodes, series_name, max_episode_number=detector.highest_episode_number(series_name)
             )
             formatted_episodes_data[series_name] = formatted_episodes
 
         # Update all files
+        prefetch_embed_metadata(config, formatted_episodes_data)
         success = updater.update_all_files(formatted_episodes_data)
 
         return success
@@ -169,21 +244,107 @@ def check_all_series(args, config):
         print(f"❌ Error during episode detection: {e}")
         return False
 
+def check_for_updates(config, series_name=None):
+    """Compare each show's newest episodes with the ID indexes only; returns {series: new episode count}"""
+    from concurrent.futures import ThreadPoolExecutor
+    from episode_detector import EpisodeDetector
+
+    shows = config['shows']
+    if series_name:
+        if series_name not in shows:
+            raise Exception(f"Series '{series_name}' not found in configuration")
+        shows = {series_name: shows[series_name]}
+
+    detector = EpisodeDetector(config)
+    detector.auth.get_access_token()
+
+    def fetch(show_id):
+        return detector.fetch_show_episodes(show_id, limit=CHECK_FETCH_LIMIT, raise_errors=True)
+
+    with ThreadPoolExecutor(max_workers=min(8, len(shows)) or 1) as pool:
+        fetched = dict(zip(shows, pool.map(fetch, shows.values())))
+
+    # Compared on this thread; the catalog database connection is not shared across threads
+    new_counts = {}
+    for name, episodes in fetched.items():
+        keys = [detector.get_episode_key(episode) for episode in episodes]
+        if detector.store:
+            detector.store.sync(name, f"data/{name}_episodes.json")
+            known = detector.store.known_keys(name, keys)
+        else:
+            known = detector.load_known_keys(name)
+        new_counts[name] = sum(1 for key in keys if key and key not in known)
+    return new_counts
+
+def run_check(args):
+    """--check: report whether anything is new and exit with a code the workflow can branch on"""
+    start = time.perf_counter()
+    try:
+        from spotify_auth import load_config
+        config = load_config(args.config)
+        new_counts = check_for_updates(config, args.series)
+    except Exception as e:
+        print(f"❌ Check failed: {e}")
+        return EXIT_ERROR
+
+    pending = {name: count for name, count in new_counts.items() if count}
+    for name, count in pending.items():
+        print(f"🆕 {name}: {count} new episode(s)")
+    print(f"⏱️  Checked {len(new_counts)} show(s) in {time.perf_counter() - start:.2f}s")
+
+    if pending:
+        print(f"📬 Updates available for {len(pending)} series")
+        return EXIT_UPDATES_AVAILABLE
+    print("📋 Nothing new")
+    return EXIT_NOTHING_NEW
+
+def check_tenants(args):
+    """Update every configured site, sharing one HTTP session, token and rate budget"""
+    from tenant_runner import TenantRunner, load_tenants
+
+    tenants = load_tenants(args.configs)
+    print(f"🏠 Multi-config run: {', '.join(tenant['name'] for tenant in tenants)}")
+    print()
+
+    runner = TenantRunner(tenants, workers=args.workers, requests_per_second=args.requests_per_second)
+    reports = runner.run(lambda config, detector, fetched: check_all_series(args, config, detector, fetched))
+    return all(report['success'] for report in reports)
+
+def write_run_metrics(args, config, success):
+    """Export this run's metrics; a failure here never fails the update"""
+    metrics_dir = args.metrics_dir or (config or {}).get('settings', {}).get('metrics_dir', 'metrics')
+    if not metrics_dir:
+        return
+
+    try:
+        metrics.write(metrics_dir, success, extra={
+            'series': args.series,
+            'dry_run': args.dry_run
+        })
+    except OSError as e:
+        print(f"⚠️  Could not write run metrics: {e}")
+
 def main():
     """Main function"""
     start_time = datetime.now()
+    args = None
+    config = None
+    success = False
 
     try:
         # Parse arguments
         args = parse_arguments()
 
+        if args.check:
+            return run_check(args)
+
         # Print header
         print_header()
 
         # Show configuration
         if args.verbose:
             print("⚙️  Configuration:")
-            print(f"   Config file: {args.config}")
+            print(f"   Config file(s): {', '.join(args.configs) if args.configs else args.config}")
             print(f"   Dry run: {args.dry_run}")
             print(f"   Backup enabled: {not args.no_backup}")
             print(f"   Verbose mode: {args.verbose}")
@@ -191,7 +352,16 @@ def main():
                 print(f"   Target series: {args.series}")
             print()
 
+        if args.configs:
+            if args.series:
+                print("❌ --series cannot be combined with --configs")
+                return 1
+            success = check_tenants(args)
+            print_footer(start_time, success)
+            return 0 if success else 1
+
         # Load configuration
+        from spotify_auth import load_config
         print("📋 Loading configuration...")
         config = load_config(args.config)
         print("✅ Configuration loaded successfully")
@@ -214,6 +384,9 @@ def main():
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return 1
+    finally:
+        if args is not None and not args.check:
+            write_run_metrics(args, config, success)
 
 if __name__ == "__main__":
     exit(main())
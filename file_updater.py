@@ -9,15 +9,31 @@ import os
 import shutil
 from datetime import datetime
 from pathlib import Path
+from build_cache import file_hash
+from data_manifest import DataManifest
+from episode_index import EpisodeIndex, index_path
+from episode_journal import EpisodeJournal, sort_episodes
+from episode_store import EpisodeStore
+from run_metrics import metrics
+from search_index import SearchIndexBuilder
+from series_prerender import SeriesPrerenderer
+from site_feeds import SiteFeeds
 
 class FileUpdater:
     """Handles safe updating of episode JSON files with backup support"""
 
-    def __init__(self, backup_enabled=True, dry_run=False):
+    def __init__(self, backup_enabled=True, dry_run=False, hashed_data_files=True, catalog_db=None, backup_dir="backups"):
         self.backup_enabled = backup_enabled
         self.dry_run = dry_run
-        self.backup_dir = "backups"
+        self.backup_dir = backup_dir
         self.updated_files = []
+        self.manifest = DataManifest(hashed_filenames=hashed_data_files, dry_run=dry_run)
+        self.search_index = SearchIndexBuilder(dry_run=dry_run)
+        self.feeds = SiteFeeds(dry_run=dry_run)
+        self.series_pages = SeriesPrerenderer(dry_run=dry_run)
+        self.journal = EpisodeJournal(self.get_episode_key, dry_run=dry_run)
+        # Optional SQLite mirror of the catalogs; the JSON files are still what gets published
+        self.store = EpisodeStore(catalog_db, self.get_episode_key, dry_run=dry_run) if catalog_db else None
 
     def create_backup_dir(self):
         """Create backups directory if it doesn't exist"""
@@ -47,17 +63,17 @@ class FileUpdater:
             return None
 
     def load_existing_data(self, file_path):
-        """Load existing episode data from JSON file"""
+        """Load existing episode data from JSON file, replaying any uncompacted journal"""
         try:
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8-sig') as f:
-                    data = json.load(f)
-                    episodes = data.get('episodes', [])
-                    print(f"📂 Loaded {len(episodes)} existing episodes from {file_path}")
-                    return episodes, data
-            else:
+            if not os.path.exists(file_path):
                 print(f"📂 Creating new file: {file_path}")
-                return [], {"episodes": []}
+
+            episodes, data, replayed = self.journal.load(file_path)
+            if replayed:
+                print(f"📓 Replayed {replayed} uncompacted journal change(s) for {file_path}")
+            if os.path.exists(file_path):
+                print(f"📂 Loaded {len(episodes)} existing episodes from {file_path}")
+            return episodes, data
 
         except Exception as e:
             print(f"❌ Error loading {file_path}: {e}")
@@ -79,19 +95,17 @@ class FileUpdater:
                 return url.split('/episode/')[-1]
         return None
 
-    def merge_episodes(self, existing_episodes, new_episodes):
-        """Merge new episodes with existing ones, avoiding duplicates"""
-        # Create a set of existing episode keys for quick lookup
-        existing_keys = {self.get_episode_key(ep) for ep in existing_episodes if self.get_episode_key(ep) is not None}
-
-        # Filter out duplicates from new episodes
+    def unique_new_episodes(self, known_keys, new_episodes):
+        """New episodes whose keys are not in known_keys (a set or an EpisodeIndex) or earlier in the batch"""
         unique_new_episodes = []
+        seen = set()
         duplicates_found = 0
 
         for episode in new_episodes:
             episode_key = self.get_episode_key(episode)
-            if episode_key and episode_key not in existing_keys:
+            if episode_key and episode_key not in known_keys and episode_key not in seen:
                 unique_new_episodes.append(episode)
+                seen.add(episode_key)
             else:
                 duplicates_found += 1
                 if episode_key:
@@ -99,6 +113,13 @@ class FileUpdater:
 
         if duplicates_found > 0:
             print(f"🚫 Skipped {duplicates_found} duplicate episodes")
+        return unique_new_episodes
+
+    def merge_episodes(self, existing_episodes, new_episodes):
+        """Merge new episodes with existing ones, avoiding duplicates"""
+        # Create a set of existing episode keys for quick lookup
+        existing_keys = {self.get_episode_key(ep) for ep in existing_episodes if self.get_episode_key(ep) is not None}
+        unique_new_episodes = self.unique_new_episodes(existing_keys, new_episodes)
 
         # Combine and sort episodes by episode number (descending - newest first)
         all_episodes = existing_episodes + unique_new_episodes
@@ -117,51 +138,89 @@ class FileUpdater:
                 print(f"🔍 DRY RUN: Would save {len(data.get('episodes', []))} episodes to {file_path}")
                 return True
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            with metrics.timed('file_save', help="Time to write one catalog file"):
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    json.dump(data, f, indent=2, ensure_ascii=False)
+            metrics.inc('bytes_written_total', os.path.getsize(file_path), help="Bytes of catalog JSON written")
 
             print(f"💾 Saved {len(data.get('episodes', []))} episodes to {file_path}")
+            self.update_index(file_path, data.get('episodes', []))
             return True
 
         except Exception as e:
             print(f"❌ Failed to save {file_path}: {e}")
             return False
 
+    def update_index(self, file_path, episodes=None):
+        """Rewrite the episode ID index of a data file after it changes"""
+        if self.dry_run:
+            return True
+
+        try:
+            if episodes is None:
+                episodes, _, _ = self.journal.load(file_path)
+            index = EpisodeIndex.from_episodes(episodes, self.get_episode_key, source_hash=file_hash(file_path))
+            index.write(file_path)
+            return True
+        except (OSError, ValueError) as e:
+            # Detection falls back to reading the full catalog
+            print(f"⚠️  Failed to update {index_path(file_path)}: {e}")
+            return False
+
+    def load_known_keys(self, file_path):
+        """Episode keys of a data file and its journal, from the ID index; None if the index is not current"""
+        index = EpisodeIndex.load(file_path)
+        if index is None:
+            return None
+        index.add([record.get('key') for record in self.journal.read(file_path)])
+        return index
+
     def update_series_file(self, series_name, new_episodes):
         """Update a single series JSON file with new episodes"""
+        if self.store:
+            return self.update_series_store(series_name, new_episodes)
+
         file_path = f"data/{series_name}_episodes.json"
 
         print(f"\n🔄 Updating {series_name}...")
 
-        # Load existing data
-        existing_episodes, file_data = self.load_existing_data(file_path)
-
         if not new_episodes:
             print(f"📋 No new episodes to add for {series_name}")
             return True
 
+        # Duplicates are checked against the ID index; the catalog is only parsed when it has none
+        known_keys = self.load_known_keys(file_path)
+        if known_keys is None:
+            existing_episodes, _ = self.load_existing_data(file_path)
+            known_keys = EpisodeIndex.from_episodes(existing_episodes, self.get_episode_key)
+        else:
+            print(f"📇 Checking against {len(known_keys)} indexed episode IDs for {file_path}")
+
         # Create backup if file exists
         if os.path.exists(file_path):
             backup_path = self.create_backup(file_path)
         else:
             backup_path = None
 
-        # Merge episodes
-        merged_episodes = self.merge_episodes(existing_episodes, new_episodes)
-
-        # Update file data
-        file_data['episodes'] = merged_episodes
+        added_episodes = sort_episodes(self.unique_new_episodes(known_keys, new_episodes))
 
-        # Save file
-        success = self.save_file(file_path, file_data)
+        # Only the additions are written now; compaction rewrites the file once per run
+        try:
+            self.journal.append(file_path, added_episodes)
+            success = True
+        except OSError as e:
+            print(f"❌ Failed to journal {file_path}: {e}")
+            success = False
 
         if success:
+            metrics.inc('episodes_written_total', len(added_episodes), help="Episodes added to the catalogs",
+                        series=series_name)
             self.updated_files.append({
                 'series': series_name,
                 'file_path': file_path,
                 'backup_path': backup_path,
                 'new_episodes': len(new_episodes),
-                'total_episodes': len(merged_episodes)
+                'total_episodes': len(known_keys) + len(added_episodes)
             })
             print(f"✅ Successfully updated {series_name}")
         else:
@@ -169,10 +228,59 @@ class FileUpdater:
 
         return success
 
+    def update_series_store(self, series_name, new_episodes):
+        """Add new episodes to the catalog database; the JSON file is exported at the end of the run"""
+        file_path = f"data/{series_name}_episodes.json"
+
+        print(f"\n🔄 Updating {series_name} (catalog database)...")
+        self.store.sync(series_name, file_path)
+
+        if not new_episodes:
+            print(f"📋 No new episodes to add for {series_name}")
+            return True
+
+        backup_path = self.create_backup(file_path) if os.path.exists(file_path) else None
+
+        # Duplicates are skipped by the primary key, in one transaction, without loading the catalog
+        try:
+            added = self.store.add_episodes(series_name, new_episodes)
+        except Exception as e:
+            print(f"❌ Failed to update {series_name} in the catalog database: {e}")
+            return False
+
+        metrics.inc('episodes_written_total', added, help="Episodes added to the catalogs", series=series_name)
+        skipped = len(new_episodes) - added
+        if skipped:
+            print(f"🚫 Skipped {skipped} duplicate episodes")
+
+        self.updated_files.append({
+            'series': series_name,
+            'file_path': file_path,
+            'backup_path': backup_path,
+            'new_episodes': len(new_episodes),
+            'total_episodes': self.store.count(series_name) + (added if self.dry_run else 0)
+        })
+        print(f"✅ Successfully updated {series_name}")
+        return True
+
+    def export_catalogs(self, series_names):
+        """Write the database's catalogs back to their JSON files"""
+        success = True
+        for series_name in series_names:
+            try:
+                self.store.export(series_name)
+                self.update_index(f"data/{series_name}_episodes.json", self.store.episodes(series_name))
+            except Exception as e:
+                print(f"❌ Failed to export {series_name}: {e}")
+                success = False
+        return success
+
     def update_all_files(self, new_episodes_data):
         """Update all series files with their new episodes"""
         print("🔄 Starting file updates..." + (" (DRY RUN)" if self.dry_run else ""))
 
+        self.resume_interrupted_updates()
+
         success_count = 0
         total_files = len(new_episodes_data)
 
@@ -180,6 +288,13 @@ class FileUpdater:
             if self.update_series_file(series_name, episodes):
                 success_count += 1
 
+        # Fold this run's journal entries into the published files before anything reads them
+        compacted = self.compact_journals([update['file_path'] for update in self.updated_files])
+        if self.store:
+            compacted = self.export_catalogs(list(dict.fromkeys(update['series'] for update in self.updated_files))) and compacted
+
+        verified = self.verify_updates(new_episodes_data)
+
         print(f"\n📊 Update Summary:")
         print(f"   Files processed: {total_files}")
         print(f"   Files updated: {success_count}")
@@ -190,7 +305,108 @@ class FileUpdater:
             for update in self.updated_files:
                 print(f"   {update['series']}: +{update['new_episodes']} episodes ({update['total_episodes']} total)")
 
-        return success_count == total_files
+            self.refresh_site_files()
+
+        return success_count == total_files and compacted and verified
+
+    def verify_updates(self, new_episodes_data):
+        """Compare each rewritten file with its pre-update backup: only this run's new episodes may differ"""
+        checked = [update for update in self.updated_files if update.get('backup_path')]
+        if self.dry_run or not checked:
+            return True
+
+        from episode_history import EpisodeHistory
+        history = EpisodeHistory(self.get_episode_key, backup_dir=self.backup_dir)
+        verified = True
+        for update in checked:
+            expected = {self.get_episode_key(episode) for episode in new_episodes_data.get(update['series'], [])}
+            try:
+                ok, diff = history.verify_update(update['backup_path'], update['file_path'], expected)
+            except (OSError, ValueError) as e:
+                print(f"⚠️  Could not verify {update['file_path']}: {e}")
+                continue
+            if ok:
+                print(f"🔏 Verified {update['file_path']}: +{len(diff['added'])} against {update['backup_path']}")
+            else:
+                print(f"❌ {update['file_path']} changed beyond this run's additions "
+                      f"({len(diff['removed'])} removed, {len(diff['changed'])} changed, "
+                      f"{len([key for key, _ in diff['added'] if key not in expected])} unexpected)")
+                verified = False
+        history.save()
+        return verified
+
+    def resume_interrupted_updates(self):
+        """Compact journals an earlier run wrote but never folded in"""
+        for file_path, count in self.journal.pending().items():
+            if not count:
+                continue
+            print(f"📓 Resuming interrupted update of {file_path} ({count} journaled change(s))")
+            if self.compact_journals([file_path]):
+                episodes, _ = self.load_existing_data(file_path)
+                self.updated_files.append({
+                    'series': os.path.basename(file_path).replace('_episodes.json', ''),
+                    'file_path': file_path,
+                    'backup_path': None,
+                    'new_episodes': count,
+                    'total_episodes': len(episodes)
+                })
+
+    def compact_journals(self, file_paths):
+        """Atomically fold the journals of the given data files into them"""
+        success = True
+        for file_path in file_paths:
+            try:
+                self.journal.compact(file_path)
+                self.update_index(file_path)
+            except (OSError, ValueError) as e:
+                # The journal stays on disk; the next run replays and compacts it
+                print(f"❌ Failed to compact journal for {file_path}: {e}")
+                success = False
+        return success
+
+    def refresh_site_files(self):
+        """Regenerate everything derived from the data files updated in this run"""
+        # Refresh content hashes so clients pick up the new data files
+        self.update_manifest()
+        self.update_search_index()
+        self.update_feeds()
+        self.update_series_pages()
+
+    def update_manifest(self):
+        """Regenerate data/manifest.json after data files change"""
+        try:
+            self.manifest.write()
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to update data manifest: {e}")
+            return False
+
+    def update_search_index(self):
+        """Re-index the catalogs that changed in this run"""
+        try:
+            self.search_index.build()
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to update search index: {e}")
+            return False
+
+    def update_feeds(self):
+        """Regenerate the feeds of the series updated in this run, plus the sitemap"""
+        try:
+            self.feeds.update([update['series'] for update in self.updated_files])
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to update sitemap and feeds: {e}")
+            return False
+
+    def update_series_pages(self):
+        """Re-render the pre-rendered episode cards of the series updated in this run"""
+        try:
+            self.series_pages.update([update['series'] for update in self.updated_files])
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to pre-render series pages: {e}")
+            return False
 
     def get_update_summary(self):
         """Get a summary of all updates made"""
@@ -1,205 +1,313 @@
+import argparse
 import json
 import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from build_cache import BuildCache, hash_bytes
+from site_templates import Template, load_template
 
-def create_blog_post_pages():
-    # Load the JSON data
+HEBREW_MONTHS = [
+    'ינואר', 'פברואר', 'מרץ', 'אפריל', 'מאי', 'יוני',
+    'יולי', 'אוגוסט', 'ספטמבר', 'אוקטובר', 'נובמבר', 'דצמבר'
+]
+
+def format_hebrew_date(date_str):
+    """Convert 'September 17, 2025' to '17 בספטמבר 2025' (as Intl he-IL shows it)"""
+    try:
+        date = datetime.strptime(date_str, '%B %d, %Y')
+    except (TypeError, ValueError):
+        return date_str
+    return f"{date.day} ב{HEBREW_MONTHS[date.month - 1]} {date.year}"
+
+# Every locale is built in the same run; each has its own data file, template,
+# output directory and page slug suffix
+LOCALES = [
+    {
+        'code': 'en',
+        'data_path': 'data/blog_posts.json',
+        'index_path': 'data/blog_index.json',
+        'content_dir': os.path.join('data', 'blog'),
+        # HTML template based on week-1-the-core-of-judaism.html
+        'template': os.path.join('templates', 'blog_post.html'),
+        'output_dir': 'blog',
+        'slug_suffix': '',
+        'nav_title': Template('{{ week_number }}: {{ title }}'),
+        'labels': {
+            'prev': 'Previous Week',
+            'next': 'Next Week',
+            'first': 'This is the first post',
+            'last': 'This is the last post'
+        },
+        'format_date': None
+    },
+    {
+        'code': 'he',
+        'data_path': 'hebrew-home/data/blog_posts.json',
+        'index_path': 'hebrew-home/data/blog_index.json',
+        'content_dir': os.path.join('hebrew-home', 'data', 'blog'),
+        'template': os.path.join('templates', 'blog_post_he.html'),
+        'output_dir': os.path.join('hebrew-home', 'blog'),
+        'slug_suffix': '-he',
+        'nav_title': Template('{{ title }}'),
+        'labels': {
+            'prev': 'הקודם',
+            'next': 'הבא',
+            'first': 'זהו הפוסט הראשון',
+            'last': 'זהו הפוסט האחרון'
+        },
+        'format_date': format_hebrew_date
+    }
+]
+
+# Post fields baked into a neighbour's prev/next navigation link
+NAV_FIELDS = ('slug', 'title', 'week_number')
+
+# Post fields the blog listing pages need; full_content lives in per-post files
+INDEX_FIELDS = ('slug', 'title', 'excerpt', 'date', 'read_time', 'week_number')
+
+NAV_LINK = Template(
+    '<a href="{{ href }}" class="premium-post-nav-link {{ classes }}">'
+    '<div class="nav-label">{{ label }}</div><div class="nav-title">{{ title }}</div></a>'
+)
+
+def nav_summary(post):
+    """The parts of a post that appear in its neighbours' nav links"""
+    if post is None:
+        return None
+    return {field: post.get(field, '') for field in NAV_FIELDS}
+
+def page_fingerprint(post, prev_post, next_post, template_hash):
+    """Hash of everything that goes into a post's page"""
+    payload = json.dumps({
+        'post': post,
+        'prev': nav_summary(prev_post),
+        'next': nav_summary(next_post),
+        'template': template_hash
+    }, sort_keys=True, ensure_ascii=False)
+    return hash_bytes(payload.encode('utf-8'))
+
+def page_slug(post, locale):
+    """Page file name (without .html) for a post in a locale"""
+    slug = post['slug']
+    suffix = locale['slug_suffix']
+    return slug if slug.endswith(suffix) else slug + suffix
+
+def build_nav_link(post, locale, direction):
+    """Render a prev/next link, or a disabled one at either end of the series"""
+    labels = locale['labels']
+    label = labels[direction]
+    if post is None:
+        fallback_title = labels['first'] if direction == 'prev' else labels['last']
+        return NAV_LINK.render(href='#', classes=f"{direction} disabled", label=label, title=fallback_title)
+    return NAV_LINK.render(
+        href=f"{page_slug(post, locale)}.html",
+        classes=direction,
+        label=label,
+        title=locale['nav_title'].render(week_number=post.get('week_number', ''), title=post.get('title', ''))
+    )
+
+def write_if_changed(file_path, content):
+    """Write a page only if its bytes differ, so unchanged files keep their mtime"""
+    data = content.encode('utf-8')
     try:
-        with open('data/blog_posts.json', 'r', encoding='utf-8') as f:
-            posts = json.load(f)
+        with open(file_path, 'rb') as f:
+            if f.read() == data:
+                return False
     except FileNotFoundError:
-        print("Error: data/blog_posts.json not found.")
-        return
+        pass
+
+    with open(file_path, 'wb') as f:
+        f.write(data)
+    return True
+
+def build_page(job):
+    """Render and write one page, timing each step"""
+    locale, template, post, prev_post, next_post, file_path = job
+    result = {'key': f"{locale['code']}:{post['slug']}", 'file_path': file_path, 'written': False, 'error': None}
+    format_date = locale['format_date']
+
+    start = time.perf_counter()
+    html = template.render(
+        title=post.get('title', ''),
+        excerpt=post.get('excerpt', ''),
+        week_number=post.get('week_number', ''),
+        slug=page_slug(post, locale),
+        date=format_date(post.get('date', '')) if format_date else post.get('date', ''),
+        read_time=post.get('read_time', ''),
+        full_content=post.get('full_content', ''),
+        prev_post_link=build_nav_link(prev_post, locale, 'prev'),
+        next_post_link=build_nav_link(next_post, locale, 'next')
+    )
+    rendered = time.perf_counter()
+
+    try:
+        result['written'] = write_if_changed(file_path, html)
+    except IOError as e:
+        result['error'] = e
+    finished = time.perf_counter()
+
+    result['render_ms'] = (rendered - start) * 1000
+    result['write_ms'] = (finished - rendered) * 1000
+    return result
+
+def compact_json(data):
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+
+def write_post_data(locale, posts, cache, force):
+    """Write the listing index and one content file per post; returns (cache keys, files written, unchanged)"""
+    written = 0
+    skipped = 0
+    keys = []
+
+    index = [{field: post.get(field, '') for field in INDEX_FIELDS} for post in posts]
+    if write_if_changed(locale['index_path'], compact_json(index)):
+        written += 1
+        print(f"Successfully created {locale['index_path']}")
+
+    content_dir = locale['content_dir']
+    os.makedirs(content_dir, exist_ok=True)
+    wanted = set()
+
+    for post in posts:
+        file_name = f"{post['slug']}.json"
+        file_path = os.path.join(content_dir, file_name)
+        key = f"{locale['code']}:data:{post['slug']}"
+        payload = compact_json(post)
+        content_hash = hash_bytes(payload.encode('utf-8'))
+        keys.append(key)
+        wanted.add(file_name)
+
+        if not force and cache.is_fresh(key, content_hash) and os.path.exists(file_path):
+            skipped += 1
+            continue
+        if write_if_changed(file_path, payload):
+            written += 1
+        else:
+            skipped += 1
+        cache.set(key, content_hash)
+
+    # Content files of posts that were removed or renamed
+    for file_name in os.listdir(content_dir):
+        if file_name.endswith('.json') and file_name not in wanted:
+            os.remove(os.path.join(content_dir, file_name))
+            print(f"Removed stale {os.path.join(content_dir, file_name)}")
+
+    return keys, written, skipped
+
+def load_posts(data_path):
+    """Load a locale's blog posts, or None if the data file is unusable"""
+    try:
+        with open(data_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        print(f"Error: {data_path} not found.")
     except json.JSONDecodeError:
-        print("Error: Could not decode JSON from data/blog_posts.json.")
-        return
-
-    # Create the blog directory if it doesn't exist
-    if not os.path.exists('blog'):
-        os.makedirs('blog')
-
-    # HTML template based on week-1-the-core-of-judaism.html
-    html_template = """<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{title} - Building Your Jewish Home</title>
-    <meta name="description" content="{excerpt}">
-    <meta name="keywords" content="Building Your Jewish Home, {week_number}, {title}">
-
-    <!-- Google Fonts - Inter -->
-    <link rel="preconnect" href="https://fonts.googleapis.com">
-    <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-    <link href="https://fonts.googleapis.com/css2?family=Poppins:wght@300;400;500;600;700;800&family=Inter:wght@300;400;500;600;700&display=swap" rel="stylesheet">
-
-    <!-- Favicon -->
-    <link rel="icon" type="image/x-icon" href="../images/favicon.ico">
-
-    <!-- Stylesheets -->
-    <link rel="stylesheet" href="../css/main.css">
-    <link rel="stylesheet" href="../css/components.css">
-
-    <!-- Open Graph Meta Tags -->
-    <meta property="og:title" content="{title} - Building Your Jewish Home">
-    <meta property="og:description" content="{excerpt}">
-    <meta property="og:image" content="../images/profile.png">
-    <meta property="og:url" content="https://real-judaism.com/blog/{slug}">
-    <meta property="og:type" content="article">
-</head>
-<body>
-
-    <!-- Navigation -->
-    <header class="site-header">
-        <nav class="main-navigation">
-            <div class="nav-container">
-                <div class="nav-brand-left">
-                    <a href="../index.html" class="brand-link">
-                        <span class="tagline">Real Judaism</span>
-                    </a>
-                </div>
-                <ul class="nav-menu">
-                    <li><a href="../index.html" class="nav-link">Home</a></li>
-                    <li class="nav-dropdown">
-                        <a href="#" class="nav-link dropdown-toggle">Podcast <span class="dropdown-icon">▼</span></a>
-                        <ul class="dropdown-menu">
-                            <li><a href="../index.html" class="dropdown-link">All Podcasts</a></li>
-                            <li><a href="../series/dating.html" class="dropdown-link">Dating</a></li>
-                            <li><a href="../series/shalom-bayis.html" class="dropdown-link">Shalom Bayis</a></li>
-                            <li><a href="../series/shmiras-einayim.html" class="dropdown-link">Shmiras Einayim</a></li>
-                            <li><a href="../series/shmiras-halashon.html" class="dropdown-link">Shmiras Halashon</a></li>
-                            <li><a href="../series/shabbos.html" class="dropdown-link">Shabbos Malkesa</a></li>
-                            <li><a href="../series/mesilas-yesharim.html" class="dropdown-link">Mesilas Yesharim</a></li>
-                        </ul>
-                    </li>
-                    <li><a href="../blog.html" class="nav-link active">Blog</a></li>
-                    <li><a href="../about.html" class="nav-link">About</a></li>
-                    <li><a href="../hebrew-home/index.html" class="nav-link hebrew-link">הבית הישראלי</a></li>
-                </ul>
-                <button class="mobile-menu-btn" aria-label="Toggle mobile menu">☰</button>
-            </div>
-        </nav>
-    </header>
-
-    <main class="main-content" id="main-content">
-        <!-- Article Header -->
-        <section class="article-header">
-            <div class="container">
-                <nav class="hero-breadcrumbs">
-                    <a href="../blog.html" class="breadcrumb-link">Building Your Jewish Home</a>
-                    <span class="breadcrumb-separator">></span>
-                    <span class="breadcrumb-item">{week_number}</span>
-                </nav>
-                <h1 class="article-title">{title}</h1>
-                <div class="article-meta">
-                    <span class="article-category">Building Your Jewish Home - {week_number}</span>
-                    <span class="article-date">{date}</span>
-                    <span class="article-read-time">{read_time}</span>
-                </div>
-            </div>
-        </section>
-
-        <!-- Article Content -->
-        <section class="article-content">
-            <div class="container">
-                <div class="premium-article-body">
-                    {full_content}
-                    <!-- Navigation between posts -->
-                    <div class="premium-post-navigation">
-                        {prev_post_link}
-                        {next_post_link}
-                    </div>
-                    <!-- Back to Blog -->
-                    <div class="back-to-blog">
-                        <a href="../blog.html" class="btn-secondary">
-                            <span class="btn-icon">←</span>
-                            Back to Blog Homepage
-                        </a>
-                    </div>
-                </div>
-            </div>
-        </section>
-    </main>
-
-    <!-- Footer -->
-    <footer class="site-footer">
-        <div class="footer-container">
-            <div class="footer-content">
-                <div class="footer-about">
-                    <h3 class="footer-section-title">Real Judaism</h3>
-                    <div class="footer-contact-info">
-                        <p class="contact-label">📧 Contact:</p>
-                        <p><a href="mailto:rabbiariklapper@gmail.com" class="footer-email">rabbiariklapper@gmail.com</a></p>
-                        <p class="contact-label">🛠️ Technical Support:</p>
-                        <p><a href="mailto:eli@elipodcastproductions.com" class="footer-email">eli@elipodcastproductions.com</a></p>
-                    </div>
-                </div>
-                <div class="footer-explore">
-                    <h4 class="footer-section-title">Explore</h4>
-                    <ul class="footer-links">
-                        <li><a href="../index.html" class="footer-link">All Podcast Series</a></li>
-                        <li><a href="../about.html" class="footer-link">About Rabbi Klapper</a></li>
-                        <li><a href="#contact" class="footer-link">Contact</a></li>
-                        <li><a href="../blog.html" class="footer-link">Blog</a></li>
-                    </ul>
-                </div>
-                <div class="footer-legal">
-                    <h4 class="footer-section-title">Information</h4>
-                    <ul class="footer-links">
-                        <li><a href="../privacy-policy.html" class="footer-link">Privacy Policy</a></li>
-                        <li><a href="../terms-of-service.html" class="footer-link">Terms of Service</a></li>
-                    </ul>
-                </div>
-            </div>
-            <div class="footer-bottom">
-                 <p class="footer-credit-centered">Website & Podcast Design: <a href="https://elipodcastproductions.com" target="_blank" rel="noopener" class="footer-credit-link"><strong>Eli Podcast Productions</strong></a></p>
-                <p>&copy; 2025 Real Judaism. All rights reserved.</p>
-            </div>
-        </div>
-    </footer>
-
-    <script src="../js/main.js"></script>
-    <script src="../js/blog-post.js"></script>
-
-</body>
-</html>
-    """
+        print(f"Error: Could not decode JSON from {data_path}.")
+    return None
+
+def plan_locale(locale, posts, cache, force):
+    """Work out which pages of a locale are stale; returns (jobs, fingerprints, keys, skipped)"""
+    # Create the output directory if it doesn't exist
+    if not os.path.exists(locale['output_dir']):
+        os.makedirs(locale['output_dir'])
+
+    template = load_template(locale['template'])
+    jobs = []
+    fingerprints = {}
+    keys = []
+    skipped = 0
 
     for i, post in enumerate(posts):
-        # Previous post link
-        if i == 0:
-            prev_post_link = '<a href="#" class="premium-post-nav-link prev disabled"><div class="nav-label">Previous Week</div><div class="nav-title">This is the first post</div></a>'
-        else:
-            prev_post = posts[i - 1]
-            prev_post_link = f'<a href="{prev_post["slug"]}.html" class="premium-post-nav-link prev"><div class="nav-label">Previous Week</div><div class="nav-title">{prev_post["week_number"]}: {prev_post["title"]}</div></a>'
+        prev_post = posts[i - 1] if i > 0 else None
+        next_post = posts[i + 1] if i < len(posts) - 1 else None
+        file_path = os.path.join(locale['output_dir'], f"{page_slug(post, locale)}.html")
+        key = f"{locale['code']}:{post['slug']}"
+        fingerprint = page_fingerprint(post, prev_post, next_post, template.hash)
+        keys.append(key)
+
+        if not force and cache.is_fresh(key, fingerprint) and os.path.exists(file_path):
+            skipped += 1
+            continue
+
+        fingerprints[key] = fingerprint
+        jobs.append((locale, template, post, prev_post, next_post, file_path))
 
-        # Next post link
-        if i == len(posts) - 1:
-            next_post_link = '<a href="#" class="premium-post-nav-link next disabled"><div class="nav-label">Next Week</div><div class="nav-title">This is the last post</div></a>'
+    return jobs, fingerprints, keys, skipped
+
+def create_blog_post_pages(force=False, max_workers=None, locales=None):
+    build_start = time.perf_counter()
+    locales = locales or LOCALES
+
+    # Pages are only regenerated when their own data, a neighbour's nav fields
+    # or the template changed since the last build. All locales share one cache.
+    cache = BuildCache('blog_posts')
+    jobs = []
+    fingerprints = {}
+    all_keys = []
+    skipped = 0
+    failed_locales = []
+    data_written = 0
+    data_skipped = 0
+
+    for locale in locales:
+        posts = load_posts(locale['data_path'])
+        if posts is None:
+            failed_locales.append(locale['code'])
+            continue
+        locale_jobs, locale_fingerprints, locale_keys, locale_skipped = plan_locale(locale, posts, cache, force)
+        jobs.extend(locale_jobs)
+        fingerprints.update(locale_fingerprints)
+        all_keys.extend(locale_keys)
+        skipped += locale_skipped
+
+        # Listing pages fetch the small index; full content is split out per post
+        data_keys, written_files, skipped_files = write_post_data(locale, posts, cache, force)
+        all_keys.extend(data_keys)
+        data_written += written_files
+        data_skipped += skipped_files
+
+    # Render and write the stale pages of every locale concurrently
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        results = list(pool.map(build_page, jobs))
+
+    written = 0
+    for result in results:
+        if result['error']:
+            print(f"Error writing to file {result['file_path']}: {result['error']}")
+            continue
+
+        cache.set(result['key'], fingerprints[result['key']])
+        if result['written']:
+            written += 1
+            print(f"Successfully created {result['file_path']} "
+                  f"(render {result['render_ms']:.2f}ms, write {result['write_ms']:.2f}ms)")
         else:
-            next_post = posts[i + 1]
-            next_post_link = f'<a href="{next_post["slug"]}.html" class="premium-post-nav-link next"><div class="nav-label">Next Week</div><div class="nav-title">{next_post["week_number"]}: {next_post["title"]}</div></a>'
-
-        # Format the template with post data
-        formatted_html = html_template.format(
-            title=post.get('title', ''),
-            excerpt=post.get('excerpt', ''),
-            week_number=post.get('week_number', ''),
-            slug=post.get('slug', ''),
-            date=post.get('date', ''),
-            read_time=post.get('read_time', ''),
-            full_content=post.get('full_content', ''),
-            prev_post_link=prev_post_link,
-            next_post_link=next_post_link
-        )
-
-        # Write the formatted HTML to a file
-        file_path = os.path.join('blog', f"{post['slug']}.html")
-        try:
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(formatted_html)
-            print(f"Successfully created {file_path}")
-        except IOError as e:
-            print(f"Error writing to file {file_path}: {e}")
+            skipped += 1
+
+    # Only prune within the locales actually built; others keep their entries
+    built_codes = {locale['code'] for locale in locales if locale['code'] not in failed_locales}
+    cache.prune(all_keys + [key for key in list(cache.entries) if key.split(':', 1)[0] not in built_codes])
+    cache.save()
+
+    total_ms = (time.perf_counter() - build_start) * 1000
+    locale_codes = ', '.join(locale['code'] for locale in locales if locale['code'] not in failed_locales)
+    print(f"Blog pages ({locale_codes}): {written} written, {skipped} unchanged in {total_ms:.1f}ms")
+    print(f"Blog data ({locale_codes}): {data_written} files written, {data_skipped} unchanged")
+    if results:
+        render_total = sum(result['render_ms'] for result in results)
+        write_total = sum(result['write_ms'] for result in results)
+        print(f"  Rendered {len(results)} pages: render {render_total:.1f}ms total "
+              f"({render_total / len(results):.2f}ms avg), write {write_total:.1f}ms total")
+
+    return not failed_locales
 
 if __name__ == '__main__':
-    create_blog_post_pages()
+    parser = argparse.ArgumentParser(description="Generate blog post pages for every locale")
+    parser.add_argument('--force', action='store_true', help='Regenerate every page, ignoring the build cache')
+    parser.add_argument('--workers', type=int, default=None, help='Number of render/write threads')
+    parser.add_argument('--locale', action='append', help='Only build the given locale code (repeatable)')
+    args = parser.parse_args()
+
+    selected = [locale for locale in LOCALES if not args.locale or locale['code'] in args.locale]
+    create_blog_post_pages(force=args.force, max_workers=args.workers, locales=selected)
@@ -23,7 +23,8 @@ function initializeBlogPage() {
  */
 async function loadBlogPosts() {
     try {
-        const response = await fetch('../hebrew-home/data/blog_posts.json');
+        // The listing index has no full_content, so it is a fraction of blog_posts.json
+        const response = await fetch('../hebrew-home/data/blog_index.json');
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
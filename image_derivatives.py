@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Responsive Image Derivatives
+Writes resized WebP copies of the site artwork at a few widths, keyed on the
+source hash so only changed images are reprocessed, and points the pages'
+<img> tags at them through srcset
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
+from build_cache import CACHE_DIR, BuildCache, file_hash, hash_bytes
+from css_purge import PAGE_PATTERNS, expand, read_text, write_if_changed
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+SOURCE_PATTERNS = ['images/*.png', 'images/*.jpg', 'images/*.jpeg']
+DERIVED_DIR = 'images/derived'
+DERIVED_MANIFEST = 'images/derived/manifest.json'
+OUTPUT_PATTERNS = ['images/derived/*.webp', DERIVED_MANIFEST]
+
+# Card thumbnails render at ~400 CSS px, so these cover 1x-2x screens
+WIDTHS = (320, 640, 960)
+WEBP_QUALITY = 80
+
+# Changing any of these invalidates every derivative
+SETTINGS_HASH = hash_bytes(json.dumps({'widths': WIDTHS, 'quality': WEBP_QUALITY}).encode('utf-8'))
+
+# Used when the tag has no width attribute to derive sizes from
+DEFAULT_SIZES = '(max-width: 640px) 100vw, 640px'
+
+IMG_TAG_PATTERN = re.compile(r'<img\b[^>]*>', re.IGNORECASE)
+IMG_SOURCE_PATTERN = re.compile(r'\s(data-src|src)="((?:\.\./)*)(images/[^"]+)"')
+WIDTH_ATTR_PATTERN = re.compile(r'\swidth="(\d+)"')
+DERIVED_NAME_PATTERN = re.compile(r'^images/derived/(.+)-\d+\.webp$')
+
+def missing_dependency():
+    """Why the derivatives cannot be built here, or None"""
+    if Image is None:
+        return "Pillow is not installed (pip install -r requirements-build.txt)"
+    return None
+
+def derived_path(source, width):
+    """images/dating.png → images/derived/dating-640.webp"""
+    stem = posixpath.splitext(posixpath.basename(source))[0]
+    return f"{DERIVED_DIR}/{stem}-{width}.webp"
+
+def target_widths(source_width):
+    """Configured widths smaller than the source, or the source width if it is smaller than all of them"""
+    widths = [width for width in WIDTHS if width < source_width]
+    return widths or [source_width]
+
+def srcset_attributes(entry, prefix, sizes):
+    """src/srcset/sizes attributes for a manifest entry, relative to the page"""
+    variants = sorted(entry['variants'], key=lambda variant: variant['width'])
+    # Mid-size fallback for the rare browser that ignores srcset
+    fallback = [variant for variant in variants if variant['width'] <= 640][-1:] or variants[:1]
+    srcset = ', '.join(f"{prefix}{variant['path']} {variant['width']}w" for variant in variants)
+    return f' src="{prefix}{fallback[0]["path"]}" srcset="{srcset}" sizes="{sizes}"'
+
+class ImageDeriver:
+    """Builds the derivatives and rewrites the pages that use the source images"""
+
+    def __init__(self, root=".", dry_run=False, force=False, max_workers=None):
+        self.root = root
+        self.dry_run = dry_run
+        self.force = force
+        self.max_workers = max_workers
+        self.cache = BuildCache('image_derivatives', cache_dir=os.path.join(root, CACHE_DIR))
+        self.manifest = self.load_manifest()
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def load_manifest(self):
+        try:
+            with open(self.path(DERIVED_MANIFEST), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {}
+
+    def is_up_to_date(self, source, signature):
+        entry = self.manifest.get(source)
+        return (self.cache.is_fresh(source, signature) and entry is not None
+                and all(os.path.exists(self.path(variant['path'])) for variant in entry['variants']))
+
+    def derive(self, source):
+        """Write every derivative of one source; returns (source, manifest entry, written count)"""
+        signature = f"{file_hash(self.path(source))}:{SETTINGS_HASH}"
+        if not self.force and self.is_up_to_date(source, signature):
+            return source, self.manifest[source], 0
+
+        with Image.open(self.path(source)) as image:
+            image.load()
+            if image.mode not in ('RGB', 'RGBA'):
+                image = image.convert('RGBA' if 'A' in image.mode or 'transparency' in image.info else 'RGB')
+
+            variants = []
+            for width in target_widths(image.width):
+                height = max(1, round(image.height * width / image.width))
+                output = derived_path(source, width)
+                variants.append({'width': width, 'path': output})
+                if self.dry_run:
+                    continue
+                resized = image if width == image.width else image.resize((width, height), Image.LANCZOS)
+                os.makedirs(self.path(DERIVED_DIR), exist_ok=True)
+                resized.save(self.path(output), 'WEBP', quality=WEBP_QUALITY, method=6)
+
+            entry = {'width': image.width, 'height': image.height, 'variants': variants}
+
+        if not self.dry_run:
+            self.cache.set(source, signature)
+        return source, entry, len(variants)
+
+    def remove_stale(self, wanted):
+        """Delete derivatives no source produces any more"""
+        removed = 0
+        for path in expand([f"{DERIVED_DIR}/*.webp"], self.root):
+            if path not in wanted:
+                if not self.dry_run:
+                    os.remove(self.path(path))
+                removed += 1
+        return removed
+
+    def rewrite_page(self, page):
+        """Point a page's <img> tags at the derivatives; returns True if it changed"""
+        original, encoding = read_text(self.path(page))
+        stems = {posixpath.splitext(posixpath.basename(source))[0]: source for source in self.manifest}
+
+        def resolve(image_path):
+            # Source images and (possibly outdated) derivatives both map back to their source
+            if image_path in self.manifest:
+                return image_path
+            match = DERIVED_NAME_PATTERN.match(image_path)
+            return stems.get(match.group(1)) if match else None
+
+        def rewrite_tag(match):
+            tag = match.group(0)
+            found = IMG_SOURCE_PATTERN.search(tag)
+            source = resolve(found.group(3)) if found else None
+            if not source:
+                return tag
+
+            width = WIDTH_ATTR_PATTERN.search(tag)
+            sizes = f"(max-width: 480px) 100vw, {width.group(1)}px" if width else DEFAULT_SIZES
+            tag = re.sub(r'\s(?:srcset|sizes)="[^"]*"', '', tag)
+            tag = IMG_SOURCE_PATTERN.sub(lambda m: srcset_attributes(self.manifest[source], m.group(2), sizes), tag, count=1)
+            # data-src was the script-driven lazy load; the browser's own takes over
+            if found.group(1) == 'data-src' and 'loading=' not in tag:
+                tag = tag[:-1].rstrip('/').rstrip() + ' loading="lazy">'
+            return tag
+
+        updated = IMG_TAG_PATTERN.sub(rewrite_tag, original)
+        if updated == original:
+            return False
+        if not self.dry_run:
+            write_if_changed(self.path(page), updated, encoding)
+        return True
+
+    def run(self):
+        """Derive changed images and rewrite the pages"""
+        reason = missing_dependency()
+        if reason:
+            # Not a success: nothing was derived (build.py checks first and leaves the stage out instead)
+            print(f"❌ {reason}; cannot derive images")
+            return False
+
+        sources = [path for path in expand(SOURCE_PATTERNS, self.root) if not path.startswith(DERIVED_DIR + '/')]
+        print(f"🖼️  Deriving responsive images for {len(sources)} sources" + (" (DRY RUN)" if self.dry_run else ""))
+
+        manifest = {}
+        written = 0
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for source, entry, count in pool.map(self.derive, sources):
+                manifest[source] = entry
+                written += count
+        self.manifest = manifest
+
+        wanted = {variant['path'] for entry in manifest.values() for variant in entry['variants']}
+        removed = self.remove_stale(wanted)
+
+        if not self.dry_run:
+            write_if_changed(self.path(DERIVED_MANIFEST), json.dumps(manifest, indent=2, sort_keys=True) + '\n')
+            self.cache.prune(sources)
+            self.cache.save()
+
+        pages = expand(PAGE_PATTERNS, self.root)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            changed = sum(pool.map(self.rewrite_page, pages))
+
+        print(f"✅ Images: {written} derivatives written, {removed} stale removed; {changed} of {len(pages)} pages updated")
+        return True
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Build resized WebP derivatives and srcset attributes for site images")
+    parser.add_argument('--force', action='store_true', help='Reprocess every image, ignoring the cache')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    return parser.parse_args()
+
+def main():
+    """Run the image derivative stage"""
+    args = parse_arguments()
+
+    try:
+        success = ImageDeriver(dry_run=args.dry_run, force=args.force).run()
+    except Exception as e:
+        print(f"❌ Image derivatives failed: {e}")
+        return 1
+
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    exit(main())
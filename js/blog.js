@@ -14,6 +14,9 @@ let filteredPosts = [];
 let currentFilter = 'all';
 let currentSort = 'newest';
 let currentSearch = '';
+// Slugs the site search index matched for currentSearch (full text), or null until it answers
+let searchMatches = null;
+let searchRequest = 0;
 
 /**
  * Initialize blog page functionality
@@ -24,6 +27,10 @@ function initializeBlogPage() {
     initializePostFilters();
     initializeLoadMore();
     initializeBlogFiltering();
+
+    if (typeof SiteSearch !== 'undefined') {
+        SiteSearch.init('../data/search/');
+    }
 }
 
 /**
@@ -31,7 +38,8 @@ function initializeBlogPage() {
  */
 async function loadBlogPosts() {
     try {
-        const response = await fetch('../data/blog_posts.json');
+        // The listing index has no full_content, so it is a fraction of blog_posts.json
+        const response = await fetch(await getDataFileUrl('../data/', 'blog_index.json'));
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
@@ -493,8 +501,23 @@ function applyFilter(filter) {
  */
 function applySearch(searchTerm) {
     currentSearch = searchTerm.toLowerCase();
+    searchMatches = null;
     updateActiveFilters();
     applyAllFilters();
+
+    // Widen the title/excerpt matches with full-text hits from the search index
+    if (currentSearch && typeof SiteSearch !== 'undefined') {
+        const request = ++searchRequest;
+        SiteSearch.search(currentSearch, 200)
+            .then(results => {
+                if (request !== searchRequest) return;
+                searchMatches = new Set(results
+                    .filter(result => result.type === 'blog' && result.lang === 'en')
+                    .map(result => result.id.slice(2)));
+                applyAllFilters();
+            })
+            .catch(error => console.warn('Search index unavailable, matching titles and excerpts only:', error));
+    }
 }
 
 /**
@@ -546,7 +569,8 @@ function applyAllFilters() {
         filteredPosts = filteredPosts.filter(post => {
             const title = post.title.toLowerCase();
             const excerpt = post.excerpt.toLowerCase();
-            return title.includes(currentSearch) || excerpt.includes(currentSearch);
+            return title.includes(currentSearch) || excerpt.includes(currentSearch) ||
+                (searchMatches !== null && searchMatches.has(post.slug));
         });
     }
 
@@ -657,6 +681,8 @@ function updateActiveFilters() {
 function clearFilters() {
     currentFilter = 'all';
     currentSearch = '';
+    searchMatches = null;
+    searchRequest++;
     currentSort = 'newest';
 
     // Reset UI elements
@@ -0,0 +1,30 @@
+document.addEventListener('DOMContentLoaded',function(){initializeCookieConsent();});function initializeCookieConsent(){const consent=localStorage.getItem('cookie-consent');if(!consent){showCookieBanner();}else{if(consent==='accepted'&&typeof gtag!=='undefined'){gtag('config','GA_MEASUREMENT_ID',{'anonymize_ip':true,'allow_google_signals':false,'allow_ad_features':false
+});}
+}
+}
+function showCookieBanner(){const banner=document.createElement('div');banner.id='cookie-consent-banner';banner.className='cookie-consent-banner';banner.innerHTML=`
+        <div class="cookie-consent-content">
+            <div class="cookie-consent-text">
+                <h3>Cookie Preferences</h3>
+                <p>We use cookies and similar technologies to enhance your browsing experience, analyze site traffic, and personalize content. By clicking "Accept All", you consent to our use of cookies for these purposes.</p>
+            </div>
+            <div class="cookie-consent-buttons">
+                <button id="cookie-reject" class="btn btn-utility">Reject All</button>
+                <button id="cookie-accept" class="btn btn-primary">Accept All</button>
+            </div>
+        </div>
+    `;document.body.appendChild(banner);document.getElementById('cookie-accept').addEventListener('click',function(){acceptCookies();hideCookieBanner();});document.getElementById('cookie-reject').addEventListener('click',function(){rejectCookies();hideCookieBanner();});setTimeout(()=>{banner.classList.add('show');},100);}
+function hideCookieBanner(){const banner=document.getElementById('cookie-consent-banner');if(banner){banner.classList.remove('show');setTimeout(()=>{banner.remove();},300);}
+}
+function acceptCookies(){localStorage.setItem('cookie-consent','accepted');if(typeof gtag!=='undefined'){gtag('config','GA_MEASUREMENT_ID',{'anonymize_ip':true,'allow_google_signals':false,'allow_ad_features':false
+});gtag('event','cookie_consent_accepted',{event_category:'privacy',event_label:'cookie_banner',page_location:window.location.href
+});}
+window.dispatchEvent(new CustomEvent('cookie-consent-changed',{detail:{consent:'accepted'}
+}));}
+function rejectCookies(){localStorage.setItem('cookie-consent','rejected');if(typeof gtag!=='undefined'){gtag('event','cookie_consent_rejected',{event_category:'privacy',event_label:'cookie_banner',page_location:window.location.href
+});}
+window.dispatchEvent(new CustomEvent('cookie-consent-changed',{detail:{consent:'rejected'}
+}));}
+function getCookieConsent(){return localStorage.getItem('cookie-consent');}
+function resetCookieConsent(){localStorage.removeItem('cookie-consent');location.reload();}
+window.resetCookieConsent=resetCookieConsent;window.getCookieConsent=getCookieConsent;
@@ -0,0 +1,116 @@
+let allEpisodes=[];let episodeData=null;let currentSeries='all';let episodesPerPage=12;let currentPage=1;document.addEventListener('DOMContentLoaded',function(){const episodesGrid=document.getElementById('episodesGrid');const seriesGrid=document.getElementById('seriesGrid');const isPodcastPage=window.location.pathname.includes('index.html')||window.location.pathname.endsWith('/');if((episodesGrid||seriesGrid)&&!isPodcastPage){loadEpisodeData();initializeSeriesFilters();initializeHomepageEpisodeCounts();}
+});async function loadEpisodeData(){try{const currentPath=window.location.pathname;let dataPath;if(currentPath.includes('/hebrew-home/')||currentPath.includes('/series/')){dataPath='../data/';}else{dataPath='data/';}
+console.log('Loading episodes from individual series files in:',dataPath);const seriesFiles=['dating_episodes.json','shalom-bayis_episodes.json','shalom-bayis-hebrew_episodes.json','shmiras-einayim_episodes.json','shmiras-einayim-hebrew_episodes.json','shmiras-halashon_episodes.json','shabbos_episodes.json','mesilas-yesharim_episodes.json'
+];allEpisodes=[];let totalSeries=0;for(const fileName of seriesFiles){try{const response=await fetch(await getDataFileUrl(dataPath,fileName));if(response.ok){const seriesData=await response.json();const episodes=seriesData.episodes||[];episodes.forEach(episode=>{if(!episode.series){episode.series=fileName.replace('_episodes.json','');}
+});allEpisodes.push(...episodes);totalSeries++;console.log(`✅ Loaded ${episodes.length} episodes from ${fileName}`);}else{console.warn(`⚠️ Failed to load ${fileName}: ${response.status}`);}
+}catch(fileError){console.warn(`⚠️ Error loading ${fileName}:`,fileError.message);}
+}
+allEpisodes.sort((a,b)=>{const dateA=new Date(a.date.split('-').reverse().join('-'));const dateB=new Date(b.date.split('-').reverse().join('-'));return dateB - dateA;});console.log(`✅ Loaded ${allEpisodes.length} total episodes from ${totalSeries} series`);const seriesData={};allEpisodes.forEach(episode=>{const seriesName=episode.series;if(!seriesData[seriesName]){seriesData[seriesName]={episodes:[]
+};}
+seriesData[seriesName].episodes.push(episode);});episodeData={episodes:allEpisodes,series:seriesData,series_count:totalSeries
+};displayEpisodes(allEpisodes);displaySeries();updateEpisodeCounts();updateHomepageImages();}catch(error){console.error('❌ Error loading episode data:',error);console.error('Error details:',error.message);displayError('Failed to load episode data. Please try again later.');}
+}
+function displayEpisodes(episodes,resetPage=true){let container=document.getElementById('episodesGrid')||
+document.getElementById('episodes-grid');if(!container)return;container.style.display='';if(resetPage){currentPage=1;}
+if(resetPage){container.innerHTML='';}
+if(episodes.length===0){container.innerHTML='<p class="no-episodes">No episodes found for this series.</p>';return;}
+const startIndex=0;const endIndex=currentPage*episodesPerPage;const episodesToShow=episodes.slice(startIndex,endIndex);const startFrom=resetPage?0:(currentPage - 1)*episodesPerPage;episodesToShow.slice(startFrom).forEach((episode,index)=>{const episodeCard=createEpisodeCard(episode,startFrom + index + 1);container.appendChild(episodeCard);});if(episodes.length>endIndex){addLoadMoreButton(episodes.length - endIndex);}else if(document.querySelector('.load-more-btn')){document.querySelector('.load-more-btn').remove();}
+}
+function createEpisodeCard(episode,episodeNumber){const card=document.createElement('div');card.className='episode-card';const title=episode.title||'Untitled Episode';const description=episode.description||'No description available';const duration=episode.length||episode.duration||'N/A';const series=episode.series||'General';const spotifyUrl=episode.spotify_embed_url||'#';card.innerHTML=`
+        <div class="episode-header">
+            <span class="episode-number">Episode ${episode.episode_number||episodeNumber}</span>
+        </div>
+        <h3 class="episode-title">${title}</h3>
+        <p class="episode-description">${truncateText(description,150)}</p>
+        <div class="episode-footer">
+            <div class="episode-duration">
+                <span class="duration-icon">⏱️</span>
+                ${duration}
+            </div>
+            <button class="episode-play-btn" onclick="playEpisode('${spotifyUrl}')">
+                <span class="play-icon">▶️</span>
+                Play Episode
+            </button>
+        </div>
+        <div class="episode-series">
+            <span class="badge badge-primary">${series}</span>
+        </div>
+    `;return card;}
+function displaySeries(){const container=document.getElementById('seriesGrid');if(!container||!episodeData)return;container.style.display='';container.innerHTML='';Object.keys(episodeData.series).forEach(seriesName=>{const seriesInfo=episodeData.series[seriesName];const seriesCard=createSeriesCard(seriesName,seriesInfo.episodes);container.appendChild(seriesCard);});}
+function createSeriesCard(seriesName,episodes){const card=document.createElement('div');card.className='series-card';card.onclick=()=>filterBySeries(seriesName);const episodeCount=episodes.length;const latestEpisode=episodes.length>0?episodes[0]:null;const description=generateSeriesDescription(seriesName);card.innerHTML=`
+        <div class="series-image">
+            <img src="${getSeriesImage(seriesName)}" alt="${seriesName}" loading="lazy">
+            <div class="series-overlay">
+                <button class="series-play-btn">
+                    <span class="series-play-icon">▶️</span>
+                </button>
+            </div>
+        </div>
+        <div class="series-content">
+            <h3 class="series-title">${seriesName.replace('-',' ').replace(/\b\w/g,l=>l.toUpperCase())}</h3>
+            <p class="series-description">${description}</p>
+            <div class="series-stats">
+                <div class="series-episodes">
+                    <span class="episodes-icon">🎧</span>
+                    ${episodeCount} episodes
+                </div>
+            </div>
+        </div>
+    `;return card;}
+function initializeSeriesFilters(){const seriesSection=document.querySelector('.series-section');if(seriesSection&&!document.querySelector('.series-filters')&&episodeData){const filterContainer=document.createElement('div');filterContainer.className='series-filters';let filterButtons=`<button class="filter-btn active" onclick="filterBySeries('all')">All Series</button>`;Object.keys(episodeData.series).forEach(seriesName=>{const displayName=seriesName.replace('-',' ').replace(/\b\w/g,l=>l.toUpperCase());filterButtons +=`<button class="filter-btn" onclick="filterBySeries('${seriesName}')">${displayName}</button>`;});filterContainer.innerHTML=filterButtons;seriesSection.insertBefore(filterContainer,seriesSection.querySelector('.container'));}
+}
+function initializeHomepageEpisodeCounts(){if(!document.querySelector('.series-showcase'))return;if(!episodeData){setTimeout(initializeHomepageEpisodeCounts,100);return;}
+updateHomepageEpisodeCounts();}
+function updateHomepageEpisodeCounts(){if(!episodeData)return;const seriesCards=document.querySelectorAll('.series-card-main');seriesCards.forEach(card=>{const seriesName=getSeriesNameFromCard(card);if(seriesName&&episodeData.series[seriesName]){const episodeCount=episodeData.series[seriesName].episode_count||episodeData.series[seriesName].episodes.length;addEpisodeCountToCard(card,episodeCount);}
+});}
+function getSeriesNameFromCard(card){const link=card.querySelector('a');if(link){const href=link.getAttribute('href');if(href){const match=href.match(/\/series\/(.+)/);return match?match[1]:null;}
+}
+return null;}
+function addEpisodeCountToCard(card,count){const existingCount=card.querySelector('.card-episode-count');if(existingCount){existingCount.textContent=`${count} Episodes`;return;}
+const countElement=document.createElement('p');countElement.className='card-episode-count';countElement.textContent=`${count} Episodes`;const cardContent=card.querySelector('.card-content-main');if(cardContent){cardContent.appendChild(countElement);}
+}
+function addLoadMoreButton(remainingCount){const existingButton=document.querySelector('.load-more-btn');if(existingButton){existingButton.remove();}
+const container=document.getElementById('episodesGrid')||
+document.getElementById('episodes-grid');if(!container)return;const loadMoreContainer=document.createElement('div');loadMoreContainer.className='load-more-container';loadMoreContainer.innerHTML=`
+        <button class="load-more-btn" onclick="loadMoreEpisodes()">
+            Load More Episodes (${remainingCount} remaining)
+        </button>
+    `;container.appendChild(loadMoreContainer);}
+function loadMoreEpisodes(){currentPage++;let episodesToLoad;if(currentSeries==='all'){episodesToLoad=allEpisodes;}else{episodesToLoad=episodeData.series[currentSeries]?.episodes||[];}
+displayEpisodes(episodesToLoad,false);}
+function filterBySeries(seriesName){currentSeries=seriesName;const filterButtons=document.querySelectorAll('.filter-btn');filterButtons.forEach(btn=>{btn.classList.remove('active');if((seriesName==='all'&&btn.textContent==='All Series')||
+btn.textContent.toLowerCase().replace(/\s+/g,'-')===seriesName.toLowerCase()){btn.classList.add('active');}
+});let filteredEpisodes;if(seriesName==='all'){filteredEpisodes=allEpisodes;}else{filteredEpisodes=episodeData.series[seriesName]?.episodes||[];}
+displayEpisodes(filteredEpisodes,true);}
+function formatDate(dateString){if(!dateString)return 'Date not available';try{const date=new Date(dateString);return date.toLocaleDateString('en-US',{year:'numeric',month:'short',day:'numeric'
+});}catch(error){return dateString;}
+}
+function truncateText(text,maxLength){if(text.length<=maxLength)return text;return text.substr(0,maxLength)+ '...';}
+function getSeriesImage(seriesName){const imageMap={'dating':'images/dating.png','mesilas-yesharim':'images/mesilas-yesharim.png','shabbos':'images/shabbos.png','shalom-bayis':'images/shalom-bayis.png','shmiras-halashon':'images/shmiras-halashon.png','shmiras-einayim':'images/shmiras-einayim.png','shalom-bayis-hebrew':'images/shalom-bayis-heb.png'
+};return imageMap[seriesName]||'images/profile_2.jpg';}
+function generateSeriesDescription(seriesName){const descriptions={'dating':'Insights and guidance on Jewish dating, relationships, and finding your bashert.','mesilas-yesharim':'Exploring the path of the righteous through the teachings of the Mesilas Yesharim.','shabbos':'Deep dive into Shabbos laws, customs, and spiritual significance.','shalom-bayis':'Building and maintaining peace and harmony in the Jewish home.','shmiras-halashon':'Guarding your speech and the power of words in Jewish thought.','shmiras-einayim':'Guarding the eyes and maintaining purity in vision and thought.','shalom-bayis-hebrew':'בניית שלום ואושר בבית היהודי בעברית.'
+};return descriptions[seriesName]||'A collection of teachings and insights on this important topic.';}
+function playEpisode(audioUrl){if(audioUrl==='#'){alert('Audio file not available for this episode.');return;}
+if(audioUrl.includes('spotify.com')){window.open(audioUrl,'_blank');}else{window.open(audioUrl,'_blank');}
+}
+function updateEpisodeCounts(){if(!episodeData||!episodeData.series)return;Object.keys(episodeData.series).forEach(seriesName=>{const series=episodeData.series[seriesName];const episodeCount=series.episodes?series.episodes.length:(series.episode_count||0);updateAccordionCount(seriesName,episodeCount);});}
+function updateHomepageImages(){if(!document.querySelector('.hero-section'))return;const seriesCards=document.querySelectorAll('.series-card-main[data-series]');seriesCards.forEach(card=>{const seriesName=card.getAttribute('data-series');if(seriesName){const imageElement=card.querySelector('.card-image-main');if(imageElement){const correctImagePath=getSeriesImage(seriesName);if(correctImagePath&&imageElement.src!==correctImagePath){imageElement.src=correctImagePath;console.log(`✅ Updated ${seriesName} image to: ${correctImagePath}`);}
+}
+}
+});}
+function updateAccordionCount(seriesName,count){const seriesMap={'dating':'.accordion-item[data-category="relationships"] .accordion-episodes','shalom-bayis':'.accordion-item[data-category="marriage"] .accordion-episodes','shmiras-einayim':'.accordion-item[data-category="purity"] .accordion-episodes','shmiras-halashon':'.accordion-item[data-category="speech"] .accordion-episodes','shabbos':'.accordion-item[data-category="shabbos"] .accordion-episodes','mesilas-yesharim':'.accordion-item[data-category="character"] .accordion-episodes'
+};const selector=seriesMap[seriesName];if(selector){const countElement=document.querySelector(selector);if(countElement){countElement.textContent=`${count} episodes`;console.log(`✅ Updated ${seriesName} count to ${count}`);}
+}
+}
+function displayError(message){const container=document.getElementById('episodesGrid')||
+document.getElementById('episodes-grid')||
+document.getElementById('seriesGrid');if(container){container.innerHTML=`
+            <div class="error-state">
+                <div class="error-icon">⚠️</div>
+                <h3>Couldn't load episodes</h3>
+                <p>Please <button onclick="location.reload()">try again</button> or check your connection</p>
+            </div>
+        `;const loadingElement=document.getElementById('episodes-loading');if(loadingElement){loadingElement.style.display='none';}
+}else{console.error('Error:',message);}
+}
+window.filterBySeries=filterBySeries;window.playEpisode=playEpisode;window.loadMoreEpisodes=loadMoreEpisodes;
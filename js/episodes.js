@@ -64,7 +64,7 @@ async function loadEpisodeData() {
         // Load each series file and combine episodes
         for (const fileName of seriesFiles) {
             try {
-                const response = await fetch(dataPath + fileName + '?v=' + Date.now());
+                const response = await fetch(await getDataFileUrl(dataPath, fileName));
                 if (response.ok) {
                     const seriesData = await response.json();
                     const episodes = seriesData.episodes || [];
@@ -0,0 +1,51 @@
+document.addEventListener('DOMContentLoaded',function(){initializeRatingStars();initializeFeedbackForm();});function initializeRatingStars(){const starLabels=document.querySelectorAll('.star-label');const ratingLabels=document.querySelectorAll('.rating-label');const starRadios=document.querySelectorAll('.star-radio');starLabels.forEach((label,index)=>{label.addEventListener('click',function(){const rating=index + 1;updateStarDisplay(rating);updateRatingText(rating);starRadios[index].checked=true;});label.addEventListener('mouseenter',function(){const hoverRating=index + 1;updateStarDisplay(hoverRating,true);updateRatingText(hoverRating,true);});label.addEventListener('mouseleave',function(){const checkedRadio=document.querySelector('.star-radio:checked');if(checkedRadio){const selectedRating=parseInt(checkedRadio.value);updateStarDisplay(selectedRating);updateRatingText(selectedRating);}else{resetStarDisplay();}
+});});}
+function updateStarDisplay(rating,isHover=false){const starLabels=document.querySelectorAll('.star-label');starLabels.forEach((label,index)=>{if(index<rating){label.classList.add('active');if(isHover){label.classList.add('hover');}
+}else{label.classList.remove('active','hover');}
+});}
+function updateRatingText(rating,isHover=false){const ratingLabels=document.querySelectorAll('.rating-label');ratingLabels.forEach(label=>{const labelRating=parseInt(label.getAttribute('data-rating'));if(labelRating===rating){label.classList.add('active');if(isHover){label.classList.add('hover');}
+}else{label.classList.remove('active','hover');}
+});}
+function resetStarDisplay(){const starLabels=document.querySelectorAll('.star-label');const ratingLabels=document.querySelectorAll('.rating-label');starLabels.forEach(label=>{label.classList.remove('active','hover');});ratingLabels.forEach(label=>{label.classList.remove('active','hover');});}
+function initializeFeedbackForm(){const feedbackForm=document.querySelector('.feedback-form');if(feedbackForm){feedbackForm.addEventListener('submit',function(e){const name=this.querySelector('#name');const email=this.querySelector('#email');const rating=this.querySelector('input[name="rating"]:checked');const likes=this.querySelector('#likes');const improvements=this.querySelector('#improvements');const bugs=this.querySelector('#bugs');const submitBtn=this.querySelector('button[type="submit"]');const hasContent=((name.value.trim()!=='')||
+(email.value.trim()!=='')||
+rating||
+(likes.value.trim()!=='')||
+(improvements.value.trim()!=='')||
+(bugs.value.trim()!=='')
+);if(!hasContent){e.preventDefault();showFeedbackError('Please fill out at least one field to submit your feedback.');return;}
+if(email.value.trim()!==''){const emailRegex=/^[^\s@]+@[^\s@]+\.[^\s@]+$/;if(!emailRegex.test(email.value)){e.preventDefault();showFeedbackError('Please enter a valid email address.');email.focus();return;}
+}
+trackFormSubmission('feedback_form',{form_name:'feedback',form_location:window.location.pathname,has_rating:!!rating,has_likes:likes.value.trim()!=='',has_improvements:improvements.value.trim()!=='',has_bugs:bugs.value.trim()!=='',rating_value:rating?rating.value:null
+});if(submitBtn){submitBtn.disabled=true;submitBtn.textContent='Submitting...';submitBtn.classList.add('loading');}
+});const inputs=feedbackForm.querySelectorAll('input, textarea');inputs.forEach(input=>{input.addEventListener('blur',function(){validateFeedbackField(this);});input.addEventListener('input',function(){if(this.classList.contains('error')){this.classList.remove('error');const errorMsg=this.parentNode.querySelector('.field-error');if(errorMsg){errorMsg.remove();}
+}
+});});}
+}
+function validateFeedbackField(field){const value=field.value.trim();const existingError=field.parentNode.querySelector('.field-error');if(existingError){existingError.remove();}
+if(field.type==='email'&&value){const emailRegex=/^[^\s@]+@[^\s@]+\.[^\s@]+$/;if(!emailRegex.test(value)){showFieldError(field,'Please enter a valid email address.');return false;}
+}
+field.classList.remove('error');return true;}
+function showFeedbackError(message){const existingError=document.querySelector('.feedback-error-message');if(existingError){existingError.remove();}
+const errorDiv=document.createElement('div');errorDiv.className='feedback-error-message';errorDiv.style.cssText=`
+        background-color: rgba(229, 62, 62, 0.1);
+        border: 1px solid rgba(229, 62, 62, 0.2);
+        color: #c53030;
+        padding: 12px;
+        border-radius: 8px;
+        margin-bottom: 16px;
+        font-size: 14px;
+        font-weight: 500;
+        text-align: center;
+    `;errorDiv.textContent=message;const feedbackForm=document.querySelector('.feedback-form');feedbackForm.insertBefore(errorDiv,feedbackForm.firstChild);setTimeout(()=>{if(errorDiv.parentNode){errorDiv.remove();}
+},5000);}
+function showFieldError(field,message){field.classList.add('error');const errorDiv=document.createElement('div');errorDiv.className='field-error';errorDiv.textContent=message;errorDiv.style.cssText=`
+        color: #e53e3e;
+        font-size: 14px;
+        margin-top: 4px;
+        font-weight: 500;
+    `;field.parentNode.insertBefore(errorDiv,field.nextSibling);}
+function trackFormSubmission(formType,additionalData={}){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){gtag('event','form_submit',{event_category:'engagement',event_label:formType,page_location:window.location.href,...additionalData
+});}
+}
+function debounce(func,wait){let timeout;return function executedFunction(...args){const later=()=>{clearTimeout(timeout);func(...args);};clearTimeout(timeout);timeout=setTimeout(later,wait);};}
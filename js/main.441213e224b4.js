@@ -0,0 +1,195 @@
+document.addEventListener('DOMContentLoaded',function(){document.body.classList.add('page-loading');setTimeout(()=>{document.body.classList.remove('page-loading');document.body.classList.add('page-loaded');},100);});document.addEventListener('DOMContentLoaded',function(){initializeNavigation();initializeSmoothScrolling();initializeMobileMenu();initializeScrollEffects();initializeDropdowns();initializeContactForm();initializeLazyLoading();initializeCardHoverEffects();initializeCardStaggerAnimation();initializeQuoteOverlayAnimation();initializeButtonRippleEffects();initializeFormValidation();initializePerformanceOptimizations();});function initializeNavigation(){const navLinks=document.querySelectorAll('.nav-link');navLinks.forEach(link=>{link.addEventListener('click',function(e){trackNavigationClick(this.href,this.textContent.trim());navLinks.forEach(l=>l.classList.remove('active'));this.classList.add('active');const mobileMenu=document.querySelector('.mobile-menu');if(mobileMenu&&mobileMenu.classList.contains('active')){toggleMobileMenu();}
+});});}
+function initializeSmoothScrolling(){const links=document.querySelectorAll('a[href^="#"]');links.forEach(link=>{link.addEventListener('click',function(e){const targetId=this.getAttribute('href');const targetElement=document.querySelector(targetId);if(targetElement){e.preventDefault();const headerHeight=document.querySelector('.site-header').offsetHeight;const targetPosition=targetElement.offsetTop - headerHeight - 20;targetElement.scrollIntoView({behavior:'smooth',block:'start',inline:'nearest'
+});window.scrollTo({top:targetPosition,behavior:'smooth'
+});}
+});});}
+function initializeMobileMenu(){if(window.innerWidth<=768&&!document.querySelector('.mobile-menu-btn')){const navContainer=document.querySelector('.nav-container');const navMenu=document.querySelector('.nav-menu');const mobileBtn=document.createElement('button');mobileBtn.className='mobile-menu-btn';mobileBtn.innerHTML='☰';mobileBtn.setAttribute('aria-label','Toggle mobile menu');mobileBtn.setAttribute('aria-expanded','false');const mobileDrawer=document.createElement('div');mobileDrawer.className='mobile-menu-drawer';mobileDrawer.innerHTML=`
+            <div class="mobile-drawer-header">
+                <button class="mobile-drawer-close" aria-label="Close menu">✕</button>
+            </div>
+            <nav class="mobile-drawer-nav">
+                <a href="index.html" class="mobile-drawer-link">
+                    <span class="mobile-drawer-text">Home</span>
+                </a>
+                <a href="series/dating.html" class="mobile-drawer-link">
+                    <span class="mobile-drawer-text">Podcast Series</span>
+                </a>
+                <a href="about.html" class="mobile-drawer-link">
+                    <span class="mobile-drawer-text">About Rabbi Klapper</span>
+                </a>
+                <a href="blog.html" class="mobile-drawer-link">
+                    <span class="mobile-drawer-text">Blog</span>
+                </a>
+                <div class="mobile-drawer-series">
+                    <h4 class="mobile-drawer-subtitle">Series</h4>
+                    <a href="series/dating.html" class="mobile-drawer-link">
+                        <span class="mobile-drawer-text">Dating</span>
+                    </a>
+                    <a href="series/shalom-bayis.html" class="mobile-drawer-link">
+                        <span class="mobile-drawer-text">Shalom Bayis</span>
+                    </a>
+                    <a href="series/shmiras-einayim.html" class="mobile-drawer-link">
+                        <span class="mobile-drawer-text">Shmiras Einayim</span>
+                    </a>
+                    <a href="series/shmiras-halashon.html" class="mobile-drawer-link">
+                        <span class="mobile-drawer-text">Shmiras Halashon</span>
+                    </a>
+                    <a href="series/shabbos.html" class="mobile-drawer-link">
+                        <span class="mobile-drawer-text">Shabbos</span>
+                    </a>
+                    <a href="series/mesilas-yesharim.html" class="mobile-drawer-link">
+                        <span class="mobile-drawer-text">Mesilas Yesharim</span>
+                    </a>
+                </div>
+            </nav>
+        `;const backdrop=document.createElement('div');backdrop.className='mobile-drawer-backdrop';navContainer.appendChild(mobileBtn);document.body.appendChild(mobileDrawer);document.body.appendChild(backdrop);mobileBtn.addEventListener('click',()=>toggleMobileDrawer(true));backdrop.addEventListener('click',()=>toggleMobileDrawer(false));mobileDrawer.querySelector('.mobile-drawer-close').addEventListener('click',()=>toggleMobileDrawer(false));mobileDrawer.querySelectorAll('.mobile-drawer-link').forEach(link=>{link.addEventListener('click',()=>toggleMobileDrawer(false));});}
+}
+function toggleMobileDrawer(open){const mobileBtn=document.querySelector('.mobile-menu-btn');const mobileDrawer=document.querySelector('.mobile-menu-drawer');const backdrop=document.querySelector('.mobile-drawer-backdrop');if(mobileBtn&&mobileDrawer&&backdrop){const isOpen=mobileDrawer.classList.contains('is-open');if(open===undefined){open=!isOpen;}
+if(open){mobileDrawer.classList.add('is-open');backdrop.classList.add('is-visible');mobileBtn.innerHTML='✕';mobileBtn.setAttribute('aria-expanded','true');document.body.style.overflow='hidden';}else{mobileDrawer.classList.remove('is-open');backdrop.classList.remove('is-visible');mobileBtn.innerHTML='☰';mobileBtn.setAttribute('aria-expanded','false');document.body.style.overflow='';}
+}
+}
+function initializeScrollEffects(){const header=document.querySelector('.site-header');let scrollDepthTracked={25:false,50:false,75:false,90:false};window.addEventListener('scroll',debounce(function(){const scrollTop=window.scrollY;const docHeight=document.documentElement.scrollHeight - window.innerHeight;const scrollPercent=Math.round((scrollTop / docHeight)*100);if(window.scrollY>100){header.classList.add('scrolled');}else{header.classList.remove('scrolled');}
+Object.keys(scrollDepthTracked).forEach(threshold=>{if(!scrollDepthTracked[threshold]&&scrollPercent>=parseInt(threshold)){trackScrollDepth(parseInt(threshold));scrollDepthTracked[threshold]=true;}
+});},100));}
+function initializeDropdowns(){const dropdowns=document.querySelectorAll('.nav-dropdown');dropdowns.forEach(dropdown=>{const toggle=dropdown.querySelector('.dropdown-toggle');const menu=dropdown.querySelector('.dropdown-menu');if(toggle&&menu){toggle.addEventListener('click',function(e){if(window.innerWidth<=768){e.preventDefault();menu.classList.toggle('active');}
+});document.addEventListener('click',function(e){if(!dropdown.contains(e.target)){menu.classList.remove('active');}
+});}
+});}
+function initializeContactForm(){const contactForm=document.querySelector('.contact-form');if(contactForm){contactForm.addEventListener('submit',function(e){const name=this.querySelector('#name');const email=this.querySelector('#email');const message=this.querySelector('#message');const submitBtn=this.querySelector('button[type="submit"]');if(!name.value.trim()){e.preventDefault();showFormError('Please enter your name.');name.focus();return;}
+if(!email.value.trim()){e.preventDefault();showFormError('Please enter your email address.');email.focus();return;}
+const emailRegex=/^[^\s@]+@[^\s@]+\.[^\s@]+$/;if(!emailRegex.test(email.value)){e.preventDefault();showFormError('Please enter a valid email address.');email.focus();return;}
+if(!message.value.trim()){e.preventDefault();showFormError('Please enter your message.');message.focus();return;}
+trackFormSubmission('contact_form',{form_name:'contact',form_location:window.location.pathname,message_length:message.value.length
+});if(submitBtn){submitBtn.disabled=true;submitBtn.textContent='Sending...';submitBtn.classList.add('loading');}
+});const inputs=contactForm.querySelectorAll('input, textarea');inputs.forEach(input=>{input.addEventListener('blur',function(){validateField(this);});input.addEventListener('input',function(){if(this.classList.contains('error')){this.classList.remove('error');}
+});});}
+}
+function showFormError(message){const existingError=document.querySelector('.form-error-message');if(existingError){existingError.remove();}
+const errorDiv=document.createElement('div');errorDiv.className='form-error-message';errorDiv.style.cssText=`
+        background-color: rgba(229, 62, 62, 0.1);
+        border: 1px solid rgba(229, 62, 62, 0.2);
+        color: #c53030;
+        padding: 12px;
+        border-radius: 8px;
+        margin-bottom: 16px;
+        font-size: 14px;
+        font-weight: 500;
+    `;errorDiv.textContent=message;const contactForm=document.querySelector('.contact-form');contactForm.insertBefore(errorDiv,contactForm.firstChild);setTimeout(()=>{if(errorDiv.parentNode){errorDiv.remove();}
+},5000);}
+function validateField(field){const value=field.value.trim();if(field.hasAttribute('required')&&!value){field.classList.add('error');return false;}
+if(field.type==='email'&&value){const emailRegex=/^[^\s@]+@[^\s@]+\.[^\s@]+$/;if(!emailRegex.test(value)){field.classList.add('error');return false;}
+}
+field.classList.remove('error');return true;}
+function initializeLazyLoading(){const imageObserver=new IntersectionObserver((entries,observer)=>{entries.forEach(entry=>{if(entry.isIntersecting){const img=entry.target;loadImage(img);observer.unobserve(img);}
+});},{rootMargin:'50px 0px',threshold:0.01
+});const lazyImages=document.querySelectorAll('img[data-src]');lazyImages.forEach(img=>{img.classList.add('lazy-loading');imageObserver.observe(img);});}
+function loadImage(img){const src=img.getAttribute('data-src');if(!src)return;const newImg=new Image();newImg.onload=function(){img.src=src;img.classList.remove('lazy-loading');img.classList.add('loaded');img.style.opacity='1';console.log('Image loaded:',src);};newImg.onerror=function(){console.error('Failed to load image:',src);img.classList.remove('lazy-loading');img.classList.add('error');};newImg.src=src;}
+function initializeCardHoverEffects(){const seriesCards=document.querySelectorAll('.series-card-main');seriesCards.forEach(card=>{card.addEventListener('mouseenter',handleCardHover);card.addEventListener('mouseleave',handleCardLeave);card.addEventListener('click',handleSeriesCardClick);});}
+function initializeCardStaggerAnimation(){const cardSelectors=['.series-card-main','.episode-card-series','.featured-card','.series-card','.podcast-card','.blog-post-card','.popular-card','.quick-link-card'
+];const cardGrids=['.series-grid-main','.episodes-grid','.series-grid','.podcast-grid','.blog-grid','.popular-grid'
+];let cards=[];cardSelectors.forEach(selector=>{const foundCards=document.querySelectorAll(selector);if(foundCards.length>0){cards=[...cards,...foundCards];}
+});if(cards.length===0)return;const observerOptions={threshold:0.01,rootMargin:'50px 0px'
+};const cardObserver=new IntersectionObserver((entries)=>{entries.forEach((entry)=>{if(entry.isIntersecting){const card=entry.target;let grid=null;let cardIndex=0;for(const gridSelector of cardGrids){const potentialGrid=card.closest(gridSelector);if(potentialGrid){grid=potentialGrid;break;}
+}
+if(!grid){cardIndex=Array.from(cards).indexOf(card);}else{const cardsInGrid=Array.from(grid.querySelectorAll(cardSelectors.join(', ')));cardIndex=cardsInGrid.indexOf(card);}
+const delay=cardIndex*50;setTimeout(()=>{card.style.opacity='1';card.style.transform='translateY(0)';},delay);cardObserver.unobserve(entry.target);}
+});},observerOptions);cards.forEach(card=>{cardObserver.observe(card);});}
+function initializeQuoteOverlayAnimation(){const quoteOverlays=document.querySelectorAll('.photo-quote-overlay');if(quoteOverlays.length===0)return;const observerOptions={threshold:0.3,rootMargin:'0px 0px -50px 0px'
+};const quoteObserver=new IntersectionObserver((entries)=>{entries.forEach(entry=>{if(entry.isIntersecting){entry.target.classList.add('show');quoteObserver.unobserve(entry.target);}
+});},observerOptions);quoteOverlays.forEach(overlay=>{quoteObserver.observe(overlay);});}
+function initializeButtonRippleEffects(){const buttonSelectors=['.btn-primary','.btn-secondary'
+];const buttons=document.querySelectorAll(buttonSelectors.join(', '));if(buttons.length===0)return;buttons.forEach(button=>{button.addEventListener('mousedown',function(e){this.classList.remove('ripple');const rect=this.getBoundingClientRect();const x=e.clientX - rect.left;const y=e.clientY - rect.top;this.style.setProperty('--ripple-x',`${x}px`);this.style.setProperty('--ripple-y',`${y}px`);this.classList.add('ripple');setTimeout(()=>{this.classList.remove('ripple');},600);});});}
+function initializeFormValidation(){initializeNewsletterValidation();const contactForm=document.querySelector('.contact-form:not(.newsletter-signup)');if(contactForm){initializeContactFormValidation(contactForm);}
+}
+function initializeNewsletterValidation(){const newsletterForms=document.querySelectorAll('.newsletter-form');newsletterForms.forEach(form=>{const emailInput=form.querySelector('input[type="email"]');const submitButton=form.querySelector('button[type="submit"]');if(emailInput){emailInput.addEventListener('input',function(){validateEmailField(this);});emailInput.addEventListener('focus',function(){clearFieldValidation(this);});}
+if(form){form.addEventListener('submit',function(e){if(!validateNewsletterForm(this)){e.preventDefault();if(submitButton){submitButton.classList.add('btn-shake');setTimeout(()=>{submitButton.classList.remove('btn-shake');},500);}
+}
+});}
+});}
+function initializeContactFormValidation(form){const emailInput=form.querySelector('input[type="email"]');const messageTextarea=form.querySelector('textarea');const submitButton=form.querySelector('button[type="submit"]');if(emailInput){emailInput.addEventListener('input',function(){validateEmailField(this);});emailInput.addEventListener('focus',function(){clearFieldValidation(this);});}
+if(messageTextarea){const counterElement=document.createElement('div');counterElement.className='character-counter';messageTextarea.parentNode.appendChild(counterElement);messageTextarea.addEventListener('input',function(){updateCharacterCounter(this,counterElement);});updateCharacterCounter(messageTextarea,counterElement);}
+if(form){form.addEventListener('submit',function(e){if(!validateContactForm(this)){e.preventDefault();if(submitButton){submitButton.classList.add('btn-shake');setTimeout(()=>{submitButton.classList.remove('btn-shake');},500);}
+}
+});}
+}
+function validateEmailField(input){const container=input.closest('.input-container');const icon=container?container.querySelector('.validation-icon'):null;const email=input.value.trim();const isValid=/^[^\s@]+@[^\s@]+\.[^\s@]+$/.test(email);input.classList.remove('valid','invalid');if(email.length===0){if(icon)icon.style.display='none';return false;}
+if(isValid){input.classList.add('valid');if(icon){icon.textContent='✓';icon.style.color='#10b981';icon.style.display='block';}
+}else{input.classList.add('invalid');if(icon){icon.textContent='✕';icon.style.color='#ef4444';icon.style.display='block';}
+}
+return isValid;}
+function clearFieldValidation(input){const container=input.closest('.input-container');const icon=container?container.querySelector('.validation-icon'):null;input.classList.remove('valid','invalid');if(icon){icon.style.display='none';}
+}
+function updateCharacterCounter(textarea,counterElement){const maxLength=500;const currentLength=textarea.value.length;const remaining=maxLength - currentLength;counterElement.textContent=`${currentLength}/${maxLength} characters`;if(remaining<0){counterElement.style.color='#ef4444';textarea.classList.add('invalid');}else if(remaining<50){counterElement.style.color='#f59e0b';textarea.classList.remove('invalid');}else{counterElement.style.color='var(--color-gray)';textarea.classList.remove('invalid');}
+}
+function validateNewsletterForm(form){const emailInput=form.querySelector('input[type="email"]');let isValid=true;if(emailInput){if(!validateEmailField(emailInput)){showFieldError(emailInput,'Please enter a valid email address');isValid=false;}else{clearFieldError(emailInput);}
+}
+return isValid;}
+function validateContactForm(form){const emailInput=form.querySelector('input[type="email"]');const messageTextarea=form.querySelector('textarea');let isValid=true;if(emailInput){if(!validateEmailField(emailInput)){showFieldError(emailInput,'Please enter a valid email address');isValid=false;}else{clearFieldError(emailInput);}
+}
+if(messageTextarea){const message=messageTextarea.value.trim();if(message.length===0){showFieldError(messageTextarea,'Please enter your message');isValid=false;}else if(message.length>500){showFieldError(messageTextarea,'Message must be 500 characters or less');isValid=false;}else{clearFieldError(messageTextarea);}
+}
+return isValid;}
+function showFieldError(field,message){clearFieldError(field);field.classList.add('invalid');const errorDiv=document.createElement('div');errorDiv.className='field-error';errorDiv.textContent=message;field.parentNode.insertBefore(errorDiv,field.nextSibling);}
+function clearFieldError(field){field.classList.remove('invalid');const errorElement=field.parentNode.querySelector('.field-error');if(errorElement){errorElement.remove();}
+}
+function handleCardHover(e){const card=e.currentTarget;const image=card.querySelector('.card-image-main');const overlay=card.querySelector('.card-overlay');const playIcon=card.querySelector('.card-play-icon');card.style.transform='translateY(-6px) scale(1.02)';card.style.boxShadow='0 25px 50px rgba(0, 0, 0, 0.2)';if(image){image.style.transform='scale(1.1)';}
+if(overlay){overlay.style.opacity='1';}
+if(playIcon){playIcon.style.transform='scale(1.3)';playIcon.style.animation='pulse 2s infinite';}
+}
+function handleCardLeave(e){const card=e.currentTarget;const image=card.querySelector('.card-image-main');const overlay=card.querySelector('.card-overlay');const playIcon=card.querySelector('.card-play-icon');card.style.transform='';card.style.boxShadow='';if(image){image.style.transform='';}
+if(overlay){overlay.style.opacity='';overlay.style.background='';}
+if(playIcon){playIcon.style.transform='';playIcon.style.animation='';}
+}
+function handleGenericCardHover(e){const card=e.currentTarget;card.style.transform='translateY(-3px)';card.style.boxShadow='0 15px 30px rgba(0, 0, 0, 0.15)';}
+function handleGenericCardLeave(e){const card=e.currentTarget;card.style.transform='';card.style.boxShadow='';}
+function handleSeriesCardClick(e){const card=e.currentTarget;const titleElement=card.querySelector('.card-title-main');if(titleElement){const seriesName=titleElement.textContent.trim();trackSeriesCardClick(seriesName,'main');}
+}
+function initializePerformanceOptimizations(){const passiveOptions={passive:true};const scrollElements=document.querySelectorAll('[data-scroll]');scrollElements.forEach(element=>{element.addEventListener('scroll',handleScroll,passiveOptions);});preloadCriticalResources();addResourceHints();optimizeForRepaint();}
+function preloadCriticalResources(){const heroImage=document.querySelector('.hero-bg-image');if(heroImage){const link=document.createElement('link');link.rel='preload';link.as='image';link.href=heroImage.src;document.head.appendChild(link);}
+}
+function addResourceHints(){const dnsPrefetchDomains=['https://fonts.googleapis.com','https://fonts.gstatic.com'
+];dnsPrefetchDomains.forEach(domain=>{const link=document.createElement('link');link.rel='dns-prefetch';link.href=domain;document.head.appendChild(link);});}
+function optimizeForRepaint(){const animatedElements=document.querySelectorAll('.series-card-main, .episode-card, .blog-card');animatedElements.forEach(element=>{element.style.willChange='transform';element.style.backfaceVisibility='hidden';});setTimeout(()=>{animatedElements.forEach(element=>{element.style.willChange='auto';});},1000);}
+function handleScroll(e){clearTimeout(e.target.scrollTimeout);e.target.scrollTimeout=setTimeout(()=>{updateScrollEffects();},16);}
+function updateScrollEffects(){const scrolled=window.pageYOffset;const rate=scrolled*-0.5;const heroBg=document.querySelector('.hero-background');if(heroBg){heroBg.style.transform=`translateY(${rate}px)`;}
+}
+function showDropdown(menu){menu.style.opacity='1';menu.style.visibility='visible';menu.style.transform='translateY(0)';}
+function hideDropdown(menu){menu.style.opacity='0';menu.style.visibility='hidden';menu.style.transform='translateY(-10px)';}
+function clearFormErrors(){const errorElements=document.querySelectorAll('.field-error');errorElements.forEach(element=>element.remove());}
+function showFieldError(field,message){const existingError=field.parentNode.querySelector('.field-error');if(existingError){existingError.remove();}
+field.classList.add('error');const errorDiv=document.createElement('div');errorDiv.className='field-error';errorDiv.textContent=message;errorDiv.style.cssText=`
+        color: #e53e3e;
+        font-size: 14px;
+        margin-top: 4px;
+        font-weight: 500;
+    `;field.parentNode.insertBefore(errorDiv,field.nextSibling);}
+function setLoadingState(button,isLoading){if(isLoading){button.disabled=true;button.dataset.originalText=button.textContent;button.innerHTML='<span class="loading-spinner">⟳</span> Sending...';button.style.opacity='0.7';}else{button.disabled=false;button.textContent=button.dataset.originalText||'Send Message';button.style.opacity='';}
+}
+function trackFormSubmission(formType,additionalData={}){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){gtag('event','form_submit',{event_category:'engagement',event_label:formType,page_location:window.location.href,...additionalData
+});}
+}
+function trackNavigationClick(href,linkText){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){let destination='unknown';if(href.includes('#')){destination='same_page_anchor';}else if(href.includes('http')&&!href.includes(window.location.hostname)){destination='external_link';}else{destination=href.replace(window.location.origin,'').split('/')[1]||'unknown';}
+gtag('event','navigation_click',{event_category:'navigation',event_label:linkText,page_location:window.location.href,link_url:href,navigation_destination:destination
+});}
+}
+function trackSeriesCardClick(seriesName,cardType='main'){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){gtag('event','series_card_click',{event_category:'engagement',event_label:seriesName,page_location:window.location.href,card_type:cardType
+});}
+}
+function trackScrollDepth(percentage){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){gtag('event','scroll_depth',{event_category:'engagement',event_label:`${percentage}%`,page_location:window.location.href,scroll_percentage:percentage
+});}
+}
+function debounce(func,wait){let timeout;return function executedFunction(...args){const later=()=>{clearTimeout(timeout);func(...args);};clearTimeout(timeout);timeout=setTimeout(later,wait);};}
+const dataManifestRequests={};function getDataFileUrl(dataPath,fileName){if(!dataManifestRequests[dataPath]){dataManifestRequests[dataPath]=fetch(dataPath + 'manifest.json')
+.then(response=>response.ok?response.json():null)
+.catch(()=>null);}
+return dataManifestRequests[dataPath].then(manifest=>{const entry=manifest&&manifest.files?manifest.files[fileName]:null;return dataPath +(entry?entry.url:fileName);});}
+function isInViewport(element){const rect=element.getBoundingClientRect();return(rect.top>=0&&
+rect.left>=0&&
+rect.bottom<=(window.innerHeight||document.documentElement.clientHeight)&&
+rect.right<=(window.innerWidth||document.documentElement.clientWidth)
+);}
+function animateOnScroll(){const animatedElements=document.querySelectorAll('.animate-on-scroll');animatedElements.forEach(element=>{if(isInViewport(element)){element.classList.add('animated');}
+});}
+const animatedElements=document.querySelectorAll('.animate-on-scroll');if(animatedElements.length>0){window.addEventListener('scroll',debounce(animateOnScroll,50));animateOnScroll();}
+window.addEventListener('resize',debounce(function(){initializeMobileMenu();},250));window.addEventListener('error',function(e){console.error('JavaScript Error:',e.error);});if('serviceWorker' in navigator){window.addEventListener('load',function(){});}
@@ -1239,6 +1239,26 @@ function debounce(func, wait) {
     };
 }
 
+/**
+ * Resolve a data file to its content-addressed URL using data/manifest.json.
+ * The manifest is fetched once per data path; if it is missing the plain
+ * file URL is returned so pages keep working.
+ */
+const dataManifestRequests = {};
+
+function getDataFileUrl(dataPath, fileName) {
+    if (!dataManifestRequests[dataPath]) {
+        dataManifestRequests[dataPath] = fetch(dataPath + 'manifest.json')
+            .then(response => response.ok ? response.json() : null)
+            .catch(() => null);
+    }
+
+    return dataManifestRequests[dataPath].then(manifest => {
+        const entry = manifest && manifest.files ? manifest.files[fileName] : null;
+        return dataPath + (entry ? entry.url : fileName);
+    });
+}
+
 /**
  * Check if element is in viewport
  */
@@ -0,0 +1,45 @@
+document.addEventListener('DOMContentLoaded',function(){initializeSearch();initializeFilters();initializeAccordion();initializeLazyLoading();});function initializeSearch(){const searchInput=document.getElementById('search-input');const seriesCards=document.querySelectorAll('.series-card');const accordionItems=document.querySelectorAll('.accordion-item');if(!searchInput)return;let searchTimeout;searchInput.addEventListener('input',function(){clearTimeout(searchTimeout);searchTimeout=setTimeout(()=>{performSearch(this.value.toLowerCase());},300);});function performSearch(query){let visibleCount=0;seriesCards.forEach(card=>{const title=card.querySelector('.card-title').textContent.toLowerCase();const description=card.querySelector('.card-description').textContent.toLowerCase();if(title.includes(query)||description.includes(query)){card.style.display='';card.style.opacity='0';card.style.transform='translateY(20px)';card.offsetHeight;card.style.transition='opacity 0.3s ease, transform 0.3s ease';card.style.opacity='1';card.style.transform='translateY(0)';visibleCount++;}else{card.style.transition='opacity 0.3s ease, transform 0.3s ease';card.style.opacity='0';card.style.transform='translateY(-20px)';setTimeout(()=>{card.style.display='none';},300);}
+});accordionItems.forEach(accordion=>{const title=accordion.querySelector('.accordion-title').textContent.toLowerCase();const hook=accordion.querySelector('.accordion-hook').textContent.toLowerCase();const description=accordion.querySelector('.accordion-description')?.textContent.toLowerCase()||'';if(title.includes(query)||hook.includes(query)||description.includes(query)){accordion.style.display='';accordion.style.opacity='0';accordion.style.transform='translateY(20px)';accordion.offsetHeight;accordion.style.transition='opacity 0.3s ease, transform 0.3s ease';accordion.style.opacity='1';accordion.style.transform='translateY(0)';visibleCount++;}else{accordion.style.transition='opacity 0.3s ease, transform 0.3s ease';accordion.style.opacity='0';accordion.style.transform='translateY(-20px)';setTimeout(()=>{accordion.style.display='none';},300);}
+});const noResults=document.getElementById('no-results');if(noResults){noResults.style.display=visibleCount>0?'none':'block';}
+}
+}
+function initializeFilters(){const filterButtons=document.querySelectorAll('.filter-btn');const seriesCards=document.querySelectorAll('.series-card');const accordionItems=document.querySelectorAll('.accordion-item');if(!filterButtons.length)return;updateFilterCounts(filterButtons,seriesCards,accordionItems);filterButtons.forEach(button=>{button.addEventListener('click',function(){const filterValue=this.getAttribute('data-filter');filterButtons.forEach(btn=>btn.classList.remove('active'));this.classList.add('active');applyFilter(filterValue,seriesCards,accordionItems);});});}
+function updateFilterCounts(filterButtons,seriesCards,accordionItems){const counts={};seriesCards.forEach(card=>{const category=card.getAttribute('data-category')||'all';counts[category]=(counts[category]||0)+ 1;});accordionItems.forEach(item=>{const category=item.getAttribute('data-category')||'all';counts[category]=(counts[category]||0)+ 1;});filterButtons.forEach(button=>{const filterValue=button.getAttribute('data-filter');let count=0;if(filterValue==='all'){count=seriesCards.length;}else{count=counts[filterValue]||0;}
+const originalText=button.textContent.replace(/\s*\(\d+\)$/,'');button.textContent=`${originalText} (${count})`;});}
+function applyFilter(filterValue,cards,accordions){let visibleCount=0;cards.forEach(card=>{const cardCategory=card.getAttribute('data-category');if(filterValue==='all'||cardCategory===filterValue){card.style.display='';card.style.opacity='0';card.style.transform='translateY(20px)';card.offsetHeight;card.style.transition='opacity 0.3s ease, transform 0.3s ease';card.style.opacity='1';card.style.transform='translateY(0)';visibleCount++;}else{card.style.transition='opacity 0.3s ease, transform 0.3s ease';card.style.opacity='0';card.style.transform='translateY(-20px)';setTimeout(()=>{card.style.display='none';},300);}
+});accordions.forEach(accordion=>{const accordionCategory=accordion.getAttribute('data-category');if(filterValue==='all'||accordionCategory===filterValue){accordion.style.display='';accordion.style.opacity='0';accordion.style.transform='translateY(20px)';accordion.offsetHeight;accordion.style.transition='opacity 0.3s ease, transform 0.3s ease';accordion.style.opacity='1';accordion.style.transform='translateY(0)';visibleCount++;}else{accordion.style.transition='opacity 0.3s ease, transform 0.3s ease';accordion.style.opacity='0';accordion.style.transform='translateY(-20px)';setTimeout(()=>{accordion.style.display='none';},300);}
+});const noResults=document.getElementById('no-results');if(noResults){noResults.style.display=visibleCount>0?'none':'block';}
+}
+function initializeLazyLoading(){const images=document.querySelectorAll('img[loading="lazy"]');if('IntersectionObserver' in window){const imageObserver=new IntersectionObserver((entries,observer)=>{entries.forEach(entry=>{if(entry.isIntersecting){const img=entry.target;img.src=img.dataset.src||img.src;img.classList.remove('lazy-loading');observer.unobserve(img);}
+});});images.forEach(img=>imageObserver.observe(img));}else{images.forEach(img=>{img.src=img.dataset.src||img.src;img.classList.remove('lazy-loading');});}
+}
+function showAllPodcasts(){const searchInput=document.getElementById('search-input');if(searchInput){searchInput.value='';}
+const filterButtons=document.querySelectorAll('.filter-btn');filterButtons.forEach(btn=>btn.classList.remove('active'));const allButton=document.querySelector('.filter-btn[data-filter="all"]');if(allButton){allButton.classList.add('active');}
+const seriesCards=document.querySelectorAll('.series-card');seriesCards.forEach(card=>{card.style.display='';card.style.opacity='0';card.style.transform='translateY(20px)';card.offsetHeight;card.style.transition='opacity 0.3s ease, transform 0.3s ease';card.style.opacity='1';card.style.transform='translateY(0)';});const accordionItems=document.querySelectorAll('.accordion-item');accordionItems.forEach(accordion=>{accordion.style.display='';accordion.style.opacity='0';accordion.style.transform='translateY(20px)';accordion.offsetHeight;accordion.style.transition='opacity 0.3s ease, transform 0.3s ease';accordion.style.opacity='1';accordion.style.transform='translateY(0)';});const noResults=document.getElementById('no-results');if(noResults){noResults.style.display='none';}
+}
+function trackPodcastInteraction(action,seriesName,platform=null,additionalData={}){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){const eventData={event_category:'podcast_engagement',event_label:seriesName,page_location:window.location.href,...additionalData
+};if(platform){eventData.custom_parameter_1=platform;}
+gtag('event',action,eventData);}
+}
+function trackPlatformClick(e){const link=e.target.closest('.platform-icon');if(!link)return;const card=link.closest('.series-card');if(!card)return;const seriesName=card.querySelector('.card-title').textContent.trim();let platform='unknown';if(link.href.includes('spotify'))platform='spotify';else if(link.href.includes('apple'))platform='apple_podcasts';else if(link.href.includes('youtube'))platform='youtube';trackPodcastInteraction('podcast_platform_click',seriesName,platform,{link_url:link.href,link_text:link.getAttribute('aria-label')||'platform link'
+});}
+function trackListenNowClick(e){const button=e.target.closest('.btn-primary, .btn-quick-listen');if(!button)return;let seriesName='';let episodeCount='unknown';const card=button.closest('.series-card');if(card){seriesName=card.querySelector('.card-title').textContent.trim();episodeCount=card.querySelector('.episode-count')?.textContent||'unknown';}
+const accordion=button.closest('.accordion-item');if(accordion){seriesName=accordion.querySelector('.accordion-title').textContent.trim();episodeCount=accordion.querySelector('.accordion-episodes')?.textContent||'unknown';}
+if(seriesName){trackPodcastInteraction('podcast_listen_now_click',seriesName,null,{episode_count:episodeCount,button_text:button.textContent.trim()
+});}
+}
+function trackSearchInteraction(query,resultsCount){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){gtag('event','podcast_search',{event_category:'podcast_engagement',search_term:query,results_count:resultsCount,page_location:window.location.href
+});}
+}
+function trackFilterInteraction(filterType){const consent=localStorage.getItem('cookie-consent');if(typeof gtag!=='undefined'&&consent==='accepted'){gtag('event','podcast_filter',{event_category:'podcast_engagement',filter_type:filterType,page_location:window.location.href
+});}
+}
+document.addEventListener('click',function(e){if(e.target.closest('.platform-icon')){trackPlatformClick(e);}
+if(e.target.closest('.btn-primary')){trackListenNowClick(e);}
+if(e.target.closest('.filter-btn')){const filterBtn=e.target.closest('.filter-btn');const filterType=filterBtn.getAttribute('data-filter');trackFilterInteraction(filterType);}
+});function initializeAccordion(){const accordionHeaders=document.querySelectorAll('.accordion-header');accordionHeaders.forEach(header=>{header.addEventListener('click',function(){const item=this.closest('.accordion-item');const content=item.querySelector('.accordion-content');const isExpanded=item.hasAttribute('aria-expanded');const allItems=document.querySelectorAll('.accordion-item');allItems.forEach(otherItem=>{if(otherItem!==item){otherItem.removeAttribute('aria-expanded');const otherContent=otherItem.querySelector('.accordion-content');otherContent.style.maxHeight='0';}
+});if(isExpanded){item.removeAttribute('aria-expanded');content.style.maxHeight='0';}else{item.setAttribute('aria-expanded','true');content.style.maxHeight='none';const height=content.scrollHeight;content.style.maxHeight='0';content.offsetHeight;content.style.maxHeight=height + 'px';}
+});});}
+function preloadCriticalImages(){const criticalImages=['images/profile.png','images/dating.png','images/shalom-bayis.png'
+];criticalImages.forEach(src=>{const img=new Image();img.src=src;});}
+preloadCriticalImages();
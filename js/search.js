@@ -0,0 +1,145 @@
+/**
+ * Real Judaism Website - Site Search
+ * Queries the prebuilt prefix-sharded index in data/search/, loading only the
+ * shard for each typed term
+ */
+
+const SiteSearch = (function() {
+    const HEBREW_MARKS = /[\u0591-\u05C7]/g;
+    const HEBREW_FINALS = { 'ך': 'כ', 'ם': 'מ', 'ן': 'נ', 'ף': 'פ', 'ץ': 'צ' };
+    const TOKEN_PATTERN = /[a-z0-9\u05D0-\u05EA]+/g;
+
+    let indexPath = null;
+    let indexRequest = null;
+    let docsRequest = null;
+    const shardRequests = {};
+
+    /**
+     * Normalize text the same way search_index.py does
+     */
+    function normalize(text) {
+        return text
+            .replace(/[’'׳״]/g, '')
+            .replace(HEBREW_MARKS, '')
+            .toLowerCase()
+            .replace(/[ךםןףץ]/g, letter => HEBREW_FINALS[letter]);
+    }
+
+    /**
+     * Shard file name: hex code points of the term's first characters
+     */
+    function shardKey(term, prefixLength) {
+        return Array.from(term.slice(0, prefixLength))
+            .map(char => char.codePointAt(0).toString(16))
+            .join('-');
+    }
+
+    function fetchJson(url) {
+        return fetch(url).then(response => {
+            if (!response.ok) {
+                throw new Error(`HTTP error! status: ${response.status}`);
+            }
+            return response.json();
+        });
+    }
+
+    function loadIndex() {
+        if (!indexRequest) {
+            indexRequest = fetchJson(`${indexPath}index.json`);
+        }
+        return indexRequest;
+    }
+
+    function loadDocs(index) {
+        if (!docsRequest) {
+            docsRequest = fetchJson(`${indexPath}docs.json?v=${index.docs}`);
+        }
+        return docsRequest;
+    }
+
+    function loadShard(index, key) {
+        if (!index.shards[key]) {
+            return Promise.resolve({});
+        }
+        if (!shardRequests[key]) {
+            shardRequests[key] = fetchJson(`${indexPath}${key}.json?v=${index.shards[key]}`);
+        }
+        return shardRequests[key];
+    }
+
+    /**
+     * Collect doc scores for every indexed term starting with the query term
+     */
+    function matchTerm(shard, term) {
+        const scores = {};
+        Object.keys(shard).forEach(indexedTerm => {
+            if (indexedTerm.startsWith(term)) {
+                shard[indexedTerm].forEach(([docId, weight]) => {
+                    // Exact matches rank above prefix matches
+                    const score = indexedTerm === term ? weight * 2 : weight;
+                    scores[docId] = (scores[docId] || 0) + score;
+                });
+            }
+        });
+        return scores;
+    }
+
+    return {
+        /**
+         * Set the path of the search index relative to the current page
+         */
+        init(path) {
+            indexPath = path;
+        },
+
+        /**
+         * Search episodes and blog posts; every term must match (as a prefix)
+         */
+        async search(query, limit = 20) {
+            if (indexPath === null) {
+                throw new Error('SiteSearch.init() must be called first');
+            }
+
+            // Indexed terms are at least two characters long and never stopwords
+            const index = await loadIndex();
+            const stopwords = new Set(index.stopwords || []);
+            const terms = (normalize(query).match(TOKEN_PATTERN) || [])
+                .filter(term => term.length >= 2 && !stopwords.has(term));
+            if (terms.length === 0) {
+                return [];
+            }
+
+            const shards = await Promise.all(
+                terms.map(term => loadShard(index, shardKey(term, index.prefix_length)))
+            );
+
+            let totals = null;
+            terms.forEach((term, i) => {
+                const scores = matchTerm(shards[i], term);
+                if (totals === null) {
+                    totals = scores;
+                    return;
+                }
+                Object.keys(totals).forEach(docId => {
+                    if (scores[docId]) {
+                        totals[docId] += scores[docId];
+                    } else {
+                        delete totals[docId];
+                    }
+                });
+            });
+
+            const ranked = Object.entries(totals)
+                .sort((a, b) => b[1] - a[1])
+                .slice(0, limit);
+            if (ranked.length === 0) {
+                return [];
+            }
+
+            const docs = await loadDocs(index);
+            return ranked
+                .filter(([docId]) => docs[docId])
+                .map(([docId, score]) => Object.assign({ id: docId, score: score }, docs[docId]));
+        }
+    };
+})();
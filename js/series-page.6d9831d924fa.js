@@ -0,0 +1,178 @@
+let seriesPageCurrentSeries='';let seriesEpisodes=[];let allSeriesData={};let seriesCurrentPage=1;const seriesPageEpisodesPerPage=9;let currentFilter='all';let previousFilter='all';document.addEventListener('DOMContentLoaded',function(){initializeSeriesPage();});async function initializeSeriesPage(){const pathParts=window.location.pathname.split('/');seriesPageCurrentSeries=(pathParts[pathParts.length - 1]||pathParts[pathParts.length - 2]).replace('.html','');if(!seriesPageCurrentSeries){console.error('No series found in URL');showNoEpisodesState();return;}
+initializeSpotifyFacades();await loadSeriesData();initializeEpisodeFilters();initializeScrollToEpisodes();initializeLazyLoadingForSeries();initializeLoadMoreButton();if(seriesPageCurrentSeries==='shmiras-einayim'){initializeTabNavigation();}
+}
+function parseDate(dateStr){if(!dateStr)return new Date(0);const[day,month,year]=dateStr.split('-');return new Date(2000 + parseInt(year),parseInt(month)- 1,parseInt(day));}
+async function loadSeriesData(){try{const renderedEpisodes=document.querySelectorAll('.episode-card-rendered');if(renderedEpisodes.length===0){showLoadingState();}
+const seriesFileName=`${seriesPageCurrentSeries}_episodes.json`;const isHebrewPage=window.location.pathname.includes('/hebrew-home/');const dataPath=isHebrewPage?'../../data/':'../data/';const response=await fetch(await getDataFileUrl(dataPath,seriesFileName));if(!response.ok){throw new Error(`HTTP error! status: ${response.status}`);}
+const episodeData=await response.json();seriesEpisodes=episodeData.episodes||[];if(!seriesEpisodes||seriesEpisodes.length===0){throw new Error(`No episodes found for series "${seriesPageCurrentSeries}"`);}
+seriesEpisodes.sort((a,b)=>{const dateA=parseDate(a.date);const dateB=parseDate(b.date);return dateB - dateA;});updateSeriesInfo();if(renderedEpisodes.length===0||!renderedEpisodesCurrent(renderedEpisodes)){renderedEpisodes.forEach(card=>card.classList.remove('episode-card-rendered'));displayEpisodes();}else{const loadingElement=document.getElementById('episodes-loading');if(loadingElement)loadingElement.style.display='none';updateLoadMoreButton();setTimeout(()=>{initializeSpotifyEmbeds();},500);renderedEpisodes.forEach(card=>card.classList.remove('episode-card-rendered'));}
+loadRelatedSeries();console.log(`Loaded ${seriesEpisodes.length} episodes for series: ${seriesPageCurrentSeries}`);}catch(error){console.error('Failed to load episodes:',error);showErrorState();}
+}
+function renderedEpisodesCurrent(renderedEpisodes){const tabbed=seriesPageCurrentSeries==='shmiras-einayim';let expected=filterEpisodes(seriesEpisodes,currentFilter).slice(0,tabbed?9:6);if(tabbed){expected=expected.filter(episode=>['Season 1','Season 2'].includes(getEpisodeSeason(episode)));}
+const renderedUrls=Array.from(renderedEpisodes,card=>card.dataset.episodeUrl||'').sort();const expectedUrls=expected.map(episode=>episode.spotify_embed_url||'').sort();return renderedUrls.join('\n')===expectedUrls.join('\n');}
+function updateSeriesInfo(){const episodeCountElement=document.getElementById('episode-count');if(episodeCountElement){episodeCountElement.textContent=seriesEpisodes.length;animateNumber(episodeCountElement,0,seriesEpisodes.length,1000);}
+const seriesTitle=formatSeriesName(seriesPageCurrentSeries);document.title=`${seriesTitle} - Real Judaism`;}
+function displayEpisodes(){const loadingElement=document.getElementById('episodes-loading');if(loadingElement){loadingElement.style.display='none';}
+hideEmptyStates();let filteredEpisodes=filterEpisodes(seriesEpisodes,currentFilter);if(filteredEpisodes.length===0){showNoEpisodesState();return;}
+const episodesGrid=document.getElementById('episodes-grid');if(episodesGrid&&previousFilter!==currentFilter){episodesGrid.classList.add('fading');setTimeout(()=>{performEpisodeReorder(episodesGrid,filteredEpisodes);previousFilter=currentFilter;},200);}else{performEpisodeReorder(episodesGrid,filteredEpisodes);}
+performEpisodeReorder(episodesGrid,filteredEpisodes);}
+function performEpisodeReorder(episodesGrid,filteredEpisodes){const existingEpisodes=document.querySelectorAll('.episode-card-rendered');const episodesPerPage=seriesPageCurrentSeries==='shmiras-einayim'?9:6;if(seriesPageCurrentSeries==='shmiras-einayim'){const season1Container=document.getElementById('season1-episodes-grid');const season2Container=document.getElementById('season2-episodes-grid');if(!season1Container||!season2Container)return;if(existingEpisodes.length===0){season1Container.innerHTML='';season2Container.innerHTML='';}
+const episodesToShow=filteredEpisodes.slice(0,seriesCurrentPage*episodesPerPage);episodesToShow.forEach((episode,index)=>{const season=getEpisodeSeason(episode);const episodeCard=createEpisodeCard(episode,index + 1,season);if(existingEpisodes.length===0){if(season==='Season 1'){season1Container.appendChild(episodeCard);}else if(season==='Season 2'){season2Container.appendChild(episodeCard);}
+}
+});}else{const container=document.getElementById('episodes-grid');if(!container)return;if(existingEpisodes.length===0){container.innerHTML='';}
+const episodesToShow=filteredEpisodes.slice(0,seriesCurrentPage*episodesPerPage);episodesToShow.forEach((episode,index)=>{const episodeCard=createEpisodeCard(episode,index + 1);if(existingEpisodes.length===0){container.appendChild(episodeCard);}
+});}
+updateLoadMoreButton();if(existingEpisodes.length===0){setTimeout(()=>{initializeSpotifyEmbeds();},500);setTimeout(()=>{const cards=document.querySelectorAll('.episode-card-series');cards.forEach((card,index)=>{setTimeout(()=>{card.style.opacity='1';card.style.transform='translateY(0)';},index*50);});},100);}
+setTimeout(()=>{if(episodesGrid){episodesGrid.classList.remove('fading');}
+},300);}
+function updateLoadMoreButton(){const loadMoreBtn=document.getElementById('load-more-btn');if(!loadMoreBtn||seriesPageCurrentSeries==='shmiras-einayim')return;let filteredEpisodes=filterEpisodes(seriesEpisodes,currentFilter);const episodesPerPage=6;const episodesToShow=filteredEpisodes.slice(0,seriesCurrentPage*episodesPerPage);if(episodesToShow.length<filteredEpisodes.length){loadMoreBtn.style.display='block';}else{loadMoreBtn.style.display='none';}
+}
+function createEpisodeCard(episode,displayIndex,seasonName=null){const card=document.createElement('div');card.className='episode-card-series';const title=episode.title||'Untitled Episode';const description=episode.description||'No description available';const duration=episode.length||episode.duration||'N/A';const episodeNumber=episode.episode_number||displayIndex;const spotifyUrl=episode.spotify_embed_url||'';const cleanTitle=title.replace(/^S[12]\sEp\.\s\d+\s-\s/,'');card.innerHTML=`
+        <div class="episode-spotify-container">
+            ${spotifyUrl?createSpotifyFacade(spotifyUrl,episode.oembed):`
+                <div class="episode-spotify-fallback">
+                    <p class="text-small text-secondary mb-3">Player unavailable</p>
+                    <p class="text-small">This episode is not available for embedded playback.</p>
+                </div>
+            `}
+        </div>
+        <div class="episode-card-content">
+            <div class="episode-card-header">
+                <span class="episode-number">Episode ${episodeNumber}</span>
+                <div class="episode-metadata">
+                    <span class="episode-length">${duration}</span>
+                </div>
+            </div>
+            <h3 class="episode-card-title">${cleanTitle}</h3>
+            <p class="episode-card-description">${truncateText(description,120)}</p>
+            <div class="episode-card-footer">
+                <div class="episode-duration">
+                    <span class="duration-icon">⏱️</span>
+                    ${duration}
+                </div>
+                ${spotifyUrl?`
+                    <a href="${convertEmbedToOpenUrl(spotifyUrl)}" target="_blank" rel="noopener" class="btn-primary episode-spotify-link">
+                        Listen on Spotify
+                    </a>
+                `:''}
+            </div>
+        </div>
+    `;return card;}
+function escapeAttribute(value){return String(value)
+.replace(/&/g,'&amp;')
+.replace(/</g,'&lt;')
+.replace(/>/g,'&gt;')
+.replace(/"/g,'&quot;')
+.replace(/'/g,'&#x27;');}
+function createSpotifyFacade(spotifyUrl,oembed){const art=oembed&&oembed.thumbnail_url?`
+        <img class="episode-spotify-facade-art" src="${escapeAttribute(oembed.thumbnail_url)}" alt=""
+            width="${escapeAttribute(oembed.thumbnail_width||300)}" height="${escapeAttribute(oembed.thumbnail_height||300)}" loading="lazy">
+    `:'';return `
+        <button type="button" class="episode-spotify-facade" data-embed-src="${escapeAttribute(spotifyUrl)}" aria-label="Play episode on Spotify">
+            ${art}
+            <span class="episode-spotify-facade-play" aria-hidden="true">▶</span>
+            <span class="episode-spotify-facade-label">Play on Spotify</span>
+        </button>
+    `;}
+function loadSpotifyEmbed(facade){const iframe=document.createElement('iframe');iframe.className='episode-spotify-embed';iframe.src=facade.dataset.embedSrc;iframe.width='100%';iframe.height='232';iframe.setAttribute('frameborder','0');iframe.setAttribute('allowtransparency','true');iframe.setAttribute('allow','autoplay; encrypted-media');iframe.style.display='block';facade.replaceWith(iframe);}
+function initializeSpotifyFacades(){document.addEventListener('click',event=>{const facade=event.target.closest('.episode-spotify-facade');if(facade)loadSpotifyEmbed(facade);});}
+function initializeSpotifyEmbeds(){const embedContainers=document.querySelectorAll('.episode-spotify-container');console.log(`Found ${embedContainers.length} Spotify embed containers`);embedContainers.forEach((container,index)=>{if(container.querySelector('.episode-spotify-facade'))return;const iframe=container.querySelector('.episode-spotify-embed');const loading=container.querySelector('.episode-spotify-loading');const fallback=container.querySelector('.episode-spotify-fallback');console.log(`Container ${index}: iframe=${!!iframe}, loading=${!!loading}, fallback=${!!fallback}`);if(!iframe){console.log(`Container ${index}: No iframe found, showing fallback`);if(loading)loading.style.display='none';if(fallback)fallback.style.display='flex';return;}
+console.log(`Container ${index}: iframe src = ${iframe.src}`);setTimeout(()=>{console.log(`Attempting to show iframe for container ${index}`);if(loading)loading.style.display='none';iframe.style.display='block';setTimeout(()=>{try{const iframeDoc=iframe.contentDocument||iframe.contentWindow.document;if(!iframeDoc||iframeDoc.body.innerHTML===''){console.log(`Iframe ${index} appears empty, showing fallback`);iframe.style.display='none';if(fallback)fallback.style.display='flex';}else{console.log(`Iframe ${index} appears to have loaded content`);}
+}catch(e){console.log(`Iframe ${index} loaded (cross-origin, can't verify content)`);}
+},3000);},1000);});}
+function initializeEpisodeFilters(){const filterButtons=document.querySelectorAll('.filter-btn');filterButtons.forEach(button=>{button.addEventListener('click',function(){const filter=this.getAttribute('data-filter');setActiveFilter(this,filter);currentFilter=filter;seriesCurrentPage=1;displayEpisodes();});});const loadMoreBtn=document.getElementById('load-more-btn');if(loadMoreBtn){loadMoreBtn.addEventListener('click',function(){seriesCurrentPage++;displayEpisodes();setTimeout(()=>{const newCards=document.querySelectorAll('.episode-card-series:not(.episode-card-rendered)');if(newCards.length>0){const lastCard=newCards[newCards.length - 1];lastCard.scrollIntoView({behavior:'smooth',block:'center'});}
+},100);});}
+}
+function setActiveFilter(activeButton,filter){const filterButtons=document.querySelectorAll('.filter-btn');filterButtons.forEach(btn=>btn.classList.remove('active'));activeButton.classList.add('active');}
+function filterEpisodes(episodes,filter){switch(filter){case 'chronological':
+if(['dating','shalom-bayis','shmiras-einayim'].includes(seriesPageCurrentSeries)){return[...episodes].sort((a,b)=>{const aNum=parseInt(a.episode_number)||999;const bNum=parseInt(b.episode_number)||999;return aNum - bNum;});}
+return[...episodes].sort((a,b)=>{const dateA=parseDate(a.date);const dateB=parseDate(b.date);return dateA - dateB;});case 'recent':
+return[...episodes].sort((a,b)=>{const dateA=parseDate(a.date);const dateB=parseDate(b.date);return dateB - dateA;});case 'popular':
+return[...episodes].sort((a,b)=>{const aNum=parseInt(a.episode_number)||999;const bNum=parseInt(b.episode_number)||999;return aNum - bNum;});case 'all':
+default:
+if(['dating','shalom-bayis','shmiras-einayim'].includes(seriesPageCurrentSeries)){return[...episodes].sort((a,b)=>{const aNum=parseInt(a.episode_number)||999;const bNum=parseInt(b.episode_number)||999;return aNum - bNum;});}else if(['shmiras-halashon','shabbos','mesilas-yesharim'].includes(seriesPageCurrentSeries)){return[...episodes].sort((a,b)=>{const dateA=parseDate(a.date);const dateB=parseDate(b.date);return dateB - dateA;});}
+return episodes;}
+}
+function initializeTabNavigation(){const tabs=document.querySelectorAll('.tab-link');const panes=document.querySelectorAll('.tab-pane');tabs.forEach(tab=>{tab.addEventListener('click',()=>{const targetPaneId=tab.getAttribute('data-tab');tabs.forEach(t=>t.classList.remove('active'));tab.classList.add('active');panes.forEach(pane=>{if(pane.id===targetPaneId){pane.classList.add('active');}else{pane.classList.remove('active');}
+});});});}
+async function loadRelatedSeries(){const container=document.getElementById('related-series');if(!container)return;const relatedSeriesMap={'dating':['shalom-bayis','mesilas-yesharim','shmiras-einayim'],'shalom-bayis':['dating','mesilas-yesharim','shmiras-halashon'],'shmiras-einayim':['mesilas-yesharim','shmiras-halashon','shabbos'],'shmiras-halashon':['mesilas-yesharim','shabbos','shalom-bayis'],'shabbos':['mesilas-yesharim','shmiras-halashon','shmiras-einayim'],'mesilas-yesharim':['shabbos','shmiras-halashon','shalom-bayis']
+};const relatedSeries=relatedSeriesMap[seriesPageCurrentSeries]||['dating','shalom-bayis','mesilas-yesharim'];const gridContainer=document.createElement('div');gridContainer.className='series-links-grid';for(const seriesName of relatedSeries.slice(0,3)){try{const seriesFileName=`${seriesName}_episodes.json`;const isHebrewPage=window.location.pathname.includes('/hebrew-home/');const dataPath=isHebrewPage?'../../data/':'../data/';const response=await fetch(await getDataFileUrl(dataPath,seriesFileName));if(response.ok){const seriesData=await response.json();const episodes=seriesData.episodes||[];const relatedSeriesLink=createRelatedSeriesListItem(seriesName,episodes);gridContainer.appendChild(relatedSeriesLink);}
+}catch(error){console.warn(`Could not load related series ${seriesName}:`,error);}
+}
+container.innerHTML='';container.appendChild(gridContainer);}
+function createRelatedSeriesListItem(seriesName,episodes){const linkItem=document.createElement('a');linkItem.className='series-link-item';const displayName=formatSeriesName(seriesName);const episodeCount=episodes.length;linkItem.innerHTML=`
+        <div class="series-link-content">
+            <h3 class="series-link-title">${displayName}</h3>
+            <span class="series-link-count">${episodeCount} episodes</span>
+        </div>
+        <div class="series-link-arrow">→</div>
+    `;linkItem.href=`${seriesName}.html`;return linkItem;}
+function initializeScrollToEpisodes(){window.scrollToEpisodes=function(){const episodesSection=document.getElementById('episodes');if(episodesSection){episodesSection.scrollIntoView({behavior:'smooth',block:'start'
+});}
+};window.scrollToFirstEpisode=function(){const episodesSection=document.getElementById('episodes');if(episodesSection){episodesSection.scrollIntoView({behavior:'smooth',block:'start'
+});setTimeout(()=>{const firstEpisodeCard=document.querySelector('.episode-card-series');if(firstEpisodeCard){firstEpisodeCard.style.transform='scale(1.02)';firstEpisodeCard.style.boxShadow='0 8px 25px rgba(55, 65, 81, 0.3)';firstEpisodeCard.style.border='2px solid var(--color-primary)';setTimeout(()=>{firstEpisodeCard.style.transform='';firstEpisodeCard.style.boxShadow='';firstEpisodeCard.style.border='';},3000);}
+},500);}
+};}
+function initializeLazyLoadingForSeries(){if(typeof initializeLazyLoading==='function'){initializeLazyLoading();}
+}
+function showLoadingState(){const loadingElement=document.getElementById('episodes-loading');const gridElement=document.getElementById('episodes-grid');const noEpisodesElement=document.getElementById('no-episodes');if(loadingElement)loadingElement.style.display='block';if(gridElement)gridElement.innerHTML='';if(noEpisodesElement)noEpisodesElement.style.display='none';}
+function hideEmptyStates(){if(seriesPageCurrentSeries==='shmiras-einayim'){const season1Grid=document.getElementById('season1-episodes-grid');const season2Grid=document.getElementById('season2-episodes-grid');if(season1Grid){const emptyState1=season1Grid.querySelector('.empty-state');if(emptyState1)emptyState1.style.display='none';}
+if(season2Grid){const emptyState2=season2Grid.querySelector('.empty-state');if(emptyState2)emptyState2.style.display='none';}
+}else{const gridElement=document.getElementById('episodes-grid');if(gridElement){const emptyState=gridElement.querySelector('.empty-state');if(emptyState)emptyState.style.display='none';}
+}
+}
+function showErrorState(){const loadingElement=document.getElementById('episodes-loading');const loadMoreContainer=document.getElementById('load-more-container');if(loadingElement)loadingElement.style.display='none';if(loadMoreContainer)loadMoreContainer.style.display='none';if(seriesPageCurrentSeries==='shmiras-einayim'){const season1Grid=document.getElementById('season1-episodes-grid');const season2Grid=document.getElementById('season2-episodes-grid');if(season1Grid){season1Grid.innerHTML=`
+                <div class="error-state">
+                    <div class="error-icon">⚠️</div>
+                    <h3>Couldn't load episodes</h3>
+                    <p>Please <button onclick="location.reload()">try again</button> or check your connection</p>
+                </div>
+            `;}
+if(season2Grid){season2Grid.innerHTML=`
+                <div class="error-state">
+                    <div class="error-icon">⚠️</div>
+                    <h3>Couldn't load episodes</h3>
+                    <p>Please <button onclick="location.reload()">try again</button> or check your connection</p>
+                </div>
+            `;}
+}else{const gridElement=document.getElementById('episodes-grid');if(gridElement){gridElement.innerHTML=`
+                <div class="error-state">
+                    <div class="error-icon">⚠️</div>
+                    <h3>Couldn't load episodes</h3>
+                    <p>Please <button onclick="location.reload()">try again</button> or check your connection</p>
+                </div>
+            `;}
+}
+}
+function showNoEpisodesState(){const loadingElement=document.getElementById('episodes-loading');const loadMoreContainer=document.getElementById('load-more-container');if(loadingElement)loadingElement.style.display='none';if(loadMoreContainer)loadMoreContainer.style.display='none';if(seriesPageCurrentSeries==='shmiras-einayim'){const season1Grid=document.getElementById('season1-episodes-grid');const season2Grid=document.getElementById('season2-episodes-grid');if(season1Grid){const emptyState1=season1Grid.querySelector('.empty-state');if(emptyState1)emptyState1.style.display='block';}
+if(season2Grid){const emptyState2=season2Grid.querySelector('.empty-state');if(emptyState2)emptyState2.style.display='block';}
+}else{const gridElement=document.getElementById('episodes-grid');if(gridElement){const emptyState=gridElement.querySelector('.empty-state');if(emptyState)emptyState.style.display='block';}
+}
+}
+function formatSeriesName(seriesName){return seriesName
+.split('-')
+.map(word=>word.charAt(0).toUpperCase()+ word.slice(1))
+.join(' ');}
+function generateSeriesDescription(seriesName){const descriptions={'dating':'Insights and guidance on Jewish dating, relationships, and finding your bashert.','mesilas-yesharim':'Exploring the path of the righteous through the teachings of the Mesilas Yesharim.','shabbos':'Deep dive into Shabbos laws, customs, and spiritual significance.','shalom-bayis':'Building and maintaining peace and harmony in the Jewish home.','shmiras-halashon':'Guarding your speech and the power of words in Jewish thought.','shmiras-einayim':'Guarding the eyes and maintaining purity in vision and thought.',};return descriptions[seriesName]||'A collection of teachings and insights on this important topic.';}
+function getSeriesImage(seriesName){const imageMap={'dating':'dating.png','mesilas-yesharim':'mesilas-yesharim.png','shabbos':'shabbos.png','shalom-bayis':'shalom-bayis.png','shmiras-halashon':'shmiras-halashon.png','shmiras-einayim':'shmiras-einayim.png',};return imageMap[seriesName]||'images/profile_2.jpg';}
+function convertEmbedToOpenUrl(embedUrl){if(!embedUrl)return '#';return embedUrl.replace('/embed/','/').replace('?utm_source=generator','');}
+function formatDate(dateString){if(!dateString)return 'Date not available';try{const date=new Date(dateString);return date.toLocaleDateString('en-US',{year:'numeric',month:'short',day:'numeric'
+});}catch(error){return dateString;}
+}
+function truncateText(text,maxLength){if(text.length<=maxLength)return text;return text.substr(0,maxLength).trim()+ '...';}
+function animateNumber(element,start,end,duration){const startTime=performance.now();function updateNumber(currentTime){const elapsed=currentTime - startTime;const progress=Math.min(elapsed / duration,1);const currentNumber=Math.floor(start +(end - start)*progress);element.textContent=currentNumber;if(progress<1){requestAnimationFrame(updateNumber);}
+}
+requestAnimationFrame(updateNumber);}
+function getEpisodeSeason(episode){if(!episode.date)return null;if(episode.title&&episode.title.startsWith('S1'))return 'Season 1';if(episode.title&&episode.title.startsWith('S2'))return 'Season 2';const dateStr=episode.date;const year=parseInt(dateStr.split('-')[2]);if(year>=25||year===2025){return 'Season 2';}else if(year<=22||year===2021||year===2022){return 'Season 1';}
+return null;}
+function createSeasonHeader(seasonName){const headerDiv=document.createElement('div');headerDiv.className='season-header';const episodeCount=seriesEpisodes.filter(ep=>getEpisodeSeason(ep)===seasonName).length;const countText=episodeCount>0?` (${episodeCount} episodes)`:'';headerDiv.innerHTML=`
+        <div class="season-header-content">
+            <h3 class="season-title">${seasonName}${countText}</h3>
+            <div class="season-divider"></div>
+        </div>
+    `;return headerDiv;}
+function initializeLoadMoreButton(){const loadMoreBtn=document.getElementById('load-more-btn');if(loadMoreBtn){loadMoreBtn.addEventListener('click',function(){seriesCurrentPage++;displayEpisodes();});}
+}
+window.scrollToEpisodes=function(){const episodesSection=document.getElementById('episodes');if(episodesSection){episodesSection.scrollIntoView({behavior:'smooth',block:'start'
+});}
+};
@@ -34,6 +34,7 @@ async function initializeSeriesPage() {
     }
 
     // Load episode data and initialize page
+    initializeSpotifyFacades();
     await loadSeriesData();
     initializeEpisodeFilters();
     initializeScrollToEpisodes();
@@ -60,7 +61,11 @@ function parseDate(dateStr) {
  */
 async function loadSeriesData() {
     try {
-        showLoadingState();
+        // Cards pre-rendered into the page stay visible while the data loads
+        const renderedEpisodes = document.querySelectorAll('.episode-card-rendered');
+        if (renderedEpisodes.length === 0) {
+            showLoadingState();
+        }
 
         // Load from specific series JSON file
         const seriesFileName = `${seriesPageCurrentSeries}_episodes.json`;
@@ -69,7 +74,7 @@ async function loadSeriesData() {
         const isHebrewPage = window.location.pathname.includes('/hebrew-home/');
         const dataPath = isHebrewPage ? '../../data/' : '../data/';
 
-        const response = await fetch(`${dataPath}${seriesFileName}?v=` + Date.now());
+        const response = await fetch(await getDataFileUrl(dataPath, seriesFileName));
         if (!response.ok) {
             throw new Error(`HTTP error! status: ${response.status}`);
         }
@@ -91,17 +96,22 @@ async function loadSeriesData() {
         // Update page with series data
         updateSeriesInfo();
 
-        // Check if episodes are already rendered (server-side)
-        const renderedEpisodes = document.querySelectorAll('.episode-card-rendered');
-        if (renderedEpisodes.length === 0) {
-            // No pre-rendered episodes, show loading and load all episodes
+        // Check if episodes are already rendered (server-side) and still match the data
+        if (renderedEpisodes.length === 0 || !renderedEpisodesCurrent(renderedEpisodes)) {
+            // None pre-rendered, or stale ones from before the catalog changed: render from the data
+            renderedEpisodes.forEach(card => card.classList.remove('episode-card-rendered'));
             displayEpisodes();
         } else {
             // Episodes already rendered, just update load more button and initialize embeds
+            const loadingElement = document.getElementById('episodes-loading');
+            if (loadingElement) loadingElement.style.display = 'none';
             updateLoadMoreButton();
             setTimeout(() => {
                 initializeSpotifyEmbeds();
             }, 500);
+
+            // Hydrate: from here on filters and "load more" re-render the grid themselves
+            renderedEpisodes.forEach(card => card.classList.remove('episode-card-rendered'));
         }
 
         loadRelatedSeries();
@@ -114,6 +124,23 @@ async function loadSeriesData() {
     }
 }
 
+/**
+ * Whether the pre-rendered cards are the first page displayEpisodes() would show
+ */
+function renderedEpisodesCurrent(renderedEpisodes) {
+    const tabbed = seriesPageCurrentSeries === 'shmiras-einayim';
+    let expected = filterEpisodes(seriesEpisodes, currentFilter).slice(0, tabbed ? 9 : 6);
+    if (tabbed) {
+        // Episodes without a season have no tab to appear in
+        expected = expected.filter(episode => ['Season 1', 'Season 2'].includes(getEpisodeSeason(episode)));
+    }
+
+    // Season tabs split the cards across grids, so compare the sets rather than the order
+    const renderedUrls = Array.from(renderedEpisodes, card => card.dataset.episodeUrl || '').sort();
+    const expectedUrls = expected.map(episode => episode.spotify_embed_url || '').sort();
+    return renderedUrls.join('\n') === expectedUrls.join('\n');
+}
+
 /**
  * Update series information on the page
  */
@@ -292,18 +319,7 @@ function createEpisodeCard(episode, displayIndex, seasonName = null) {
 
     card.innerHTML = `
         <div class="episode-spotify-container">
-            ${spotifyUrl ? `
-                <iframe
-                    class="episode-spotify-embed"
-                    src="${spotifyUrl}"
-                    width="100%"
-                    height="232"
-                    frameborder="0"
-                    allowtransparency="true"
-                    allow="encrypted-media"
-                    loading="lazy">
-                </iframe>
-            ` : `
+            ${spotifyUrl ? createSpotifyFacade(spotifyUrl, episode.oembed) : `
                 <div class="episode-spotify-fallback">
                     <p class="text-small text-secondary mb-3">Player unavailable</p>
                     <p class="text-small">This episode is not available for embedded playback.</p>
@@ -336,6 +352,63 @@ function createEpisodeCard(episode, displayIndex, seasonName = null) {
     return card;
 }
 
+/**
+ * Escape a value for a double-quoted HTML attribute, as html.escape does in series_prerender.py
+ */
+function escapeAttribute(value) {
+    return String(value)
+        .replace(/&/g, '&amp;')
+        .replace(/</g, '&lt;')
+        .replace(/>/g, '&gt;')
+        .replace(/"/g, '&quot;')
+        .replace(/'/g, '&#x27;');
+}
+
+/**
+ * Static stand-in for the Spotify player; the iframe loads only when pressed
+ */
+function createSpotifyFacade(spotifyUrl, oembed) {
+    // oEmbed fields come from a third party, so they are escaped like the pre-rendered cards
+    const art = oembed && oembed.thumbnail_url ? `
+        <img class="episode-spotify-facade-art" src="${escapeAttribute(oembed.thumbnail_url)}" alt=""
+            width="${escapeAttribute(oembed.thumbnail_width || 300)}" height="${escapeAttribute(oembed.thumbnail_height || 300)}" loading="lazy">
+    ` : '';
+
+    return `
+        <button type="button" class="episode-spotify-facade" data-embed-src="${escapeAttribute(spotifyUrl)}" aria-label="Play episode on Spotify">
+            ${art}
+            <span class="episode-spotify-facade-play" aria-hidden="true">▶</span>
+            <span class="episode-spotify-facade-label">Play on Spotify</span>
+        </button>
+    `;
+}
+
+/**
+ * Swap a facade for the real Spotify player
+ */
+function loadSpotifyEmbed(facade) {
+    const iframe = document.createElement('iframe');
+    iframe.className = 'episode-spotify-embed';
+    iframe.src = facade.dataset.embedSrc;
+    iframe.width = '100%';
+    iframe.height = '232';
+    iframe.setAttribute('frameborder', '0');
+    iframe.setAttribute('allowtransparency', 'true');
+    iframe.setAttribute('allow', 'autoplay; encrypted-media');
+    iframe.style.display = 'block';
+    facade.replaceWith(iframe);
+}
+
+/**
+ * One delegated listener covers pre-rendered and client-rendered facades
+ */
+function initializeSpotifyFacades() {
+    document.addEventListener('click', event => {
+        const facade = event.target.closest('.episode-spotify-facade');
+        if (facade) loadSpotifyEmbed(facade);
+    });
+}
+
 /**
  * Initialize Spotify embeds with error handling
  */
@@ -344,6 +417,9 @@ function initializeSpotifyEmbeds() {
     console.log(`Found ${embedContainers.length} Spotify embed containers`);
 
     embedContainers.forEach((container, index) => {
+        // Facades need no checks until the visitor loads the player
+        if (container.querySelector('.episode-spotify-facade')) return;
+
         const iframe = container.querySelector('.episode-spotify-embed');
         const loading = container.querySelector('.episode-spotify-loading');
         const fallback = container.querySelector('.episode-spotify-fallback');
@@ -448,16 +524,16 @@ function filterEpisodes(episodes, filter) {
             }
             // For other series, use date-based chronological
             return [...episodes].sort((a, b) => {
-                const dateA = new Date(a.date);
-                const dateB = new Date(b.date);
+                const dateA = parseDate(a.date);
+                const dateB = parseDate(b.date);
                 return dateA - dateB;
             });
             
         case 'recent':
             // Show newest first for all series
             return [...episodes].sort((a, b) => {
-                const dateA = new Date(a.date);
-                const dateB = new Date(b.date);
+                const dateA = parseDate(a.date);
+                const dateB = parseDate(b.date);
                 return dateB - dateA;
             });
             
@@ -482,8 +558,8 @@ function filterEpisodes(episodes, filter) {
             } else if (['shmiras-halashon', 'shabbos', 'mesilas-yesharim'].includes(seriesPageCurrentSeries)) {
                 // Reverse chronological (newest first)
                 return [...episodes].sort((a, b) => {
-                    const dateA = new Date(a.date);
-                    const dateB = new Date(b.date);
+                    const dateA = parseDate(a.date);
+                    const dateB = parseDate(b.date);
                     return dateB - dateA;
                 });
             }
@@ -549,7 +625,7 @@ async function loadRelatedSeries() {
             const isHebrewPage = window.location.pathname.includes('/hebrew-home/');
             const dataPath = isHebrewPage ? '../../data/' : '../data/';
 
-            const response = await fetch(`${dataPath}${seriesFileName}?v=` + Date.now());
+            const response = await fetch(await getDataFileUrl(dataPath, seriesFileName));
             if (response.ok) {
                 const seriesData = await response.json();
                 const episodes = seriesData.episodes || [];
@@ -0,0 +1,13 @@
+(function(){'use strict';function easeOutCubic(t){return 1 - Math.pow(1 - t,3);}
+function parseTargetNumber(text){const match=text.match(/(\d+)/);return match?parseInt(match[1],10):0;}
+function formatNumber(num,originalText){const formatted=num.toLocaleString();return originalText.includes('+')?formatted + '+':formatted;}
+function animateNumber(element,target,duration=1500){const startTime=performance.now();const startValue=0;function update(currentTime){const elapsed=currentTime - startTime;const progress=Math.min(elapsed / duration,1);const easedProgress=easeOutCubic(progress);const currentValue=Math.floor(startValue +(target - startValue)*easedProgress);element.textContent=formatNumber(currentValue,element.dataset.originalText);if(progress<1){requestAnimationFrame(update);}else{element.textContent=element.dataset.originalText;}
+}
+requestAnimationFrame(update);}
+function initStatsAnimation(){const numberElements=document.querySelectorAll('.credential-number');if(numberElements.length===0)return;numberElements.forEach(element=>{element.dataset.originalText=element.textContent;element.textContent='0';});const observer=new IntersectionObserver((entries)=>{entries.forEach(entry=>{if(entry.isIntersecting){const credentialItems=entry.target.querySelectorAll('.credential-item');credentialItems.forEach((item,index)=>{const numberElement=item.querySelector('.credential-number');if(numberElement&&numberElement.dataset.originalText){const target=parseTargetNumber(numberElement.dataset.originalText);setTimeout(()=>{animateNumber(numberElement,target);},index*200);}
+});observer.disconnect();}
+});},{threshold:0.3,rootMargin:'0px 0px -50px 0px'
+});const credentialsSection=document.querySelector('.credentials-section');if(credentialsSection){observer.observe(credentialsSection);}
+}
+if(document.readyState==='loading'){document.addEventListener('DOMContentLoaded',initStatsAnimation);}else{initStatsAnimation();}
+window.addEventListener('load',initStatsAnimation);})();
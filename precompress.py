@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+Asset Precompression Build Stage
+Writes maximum-level compressed siblings (.gz, and .br when brotli is installed)
+for every text asset so servers can send precompressed bytes without per-request CPU
+"""
+
+import argparse
+import glob
+import gzip
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from build_cache import CACHE_DIR, BuildCache, file_hash
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Text assets served by the site (relative to the site root)
+ASSET_PATTERNS = [
+    '*.html',
+    'blog/*.html',
+    'series/*.html',
+    'hebrew-home/*.html',
+    'hebrew-home/blog/*.html',
+    'hebrew-home/series/*.html',
+    'hebrew-home/js/*.js',
+    'hebrew-home/data/*.json',
+    'hebrew-home/data/blog/*.json',
+    'css/*.css',
+    'css/purged/*.css',
+    'js/*.js',
+    'data/*.json',
+    'data/v/*.json',
+    'data/blog/*.json',
+    'data/search/*.json',
+    'sitemap.xml',
+    'feeds/*.xml',
+    'robots.txt',
+    'site.webmanifest'
+]
+
+# Files smaller than this gain nothing from compression
+MIN_SIZE = 256
+
+def gzip_compress(data):
+    """Gzip at maximum level with a fixed mtime so output is reproducible"""
+    buffer = io.BytesIO()
+    with gzip.GzipFile(filename='', mode='wb', compresslevel=9, fileobj=buffer, mtime=0) as f:
+        f.write(data)
+    return buffer.getvalue()
+
+def brotli_compress(data):
+    """Brotli at maximum quality"""
+    return brotli.compress(data, quality=11)
+
+def available_codecs():
+    """Return (extension, compress function) pairs for the codecs available here"""
+    codecs = [('.gz', gzip_compress)]
+    if brotli is not None:
+        codecs.append(('.br', brotli_compress))
+    return codecs
+
+class Precompressor:
+    """Compresses site text assets, skipping sources whose hash has not changed"""
+
+    def __init__(self, root=".", patterns=None, force=False, dry_run=False, max_workers=None):
+        self.root = root
+        self.patterns = patterns or ASSET_PATTERNS
+        self.force = force
+        self.dry_run = dry_run
+        self.max_workers = max_workers
+        self.codecs = available_codecs()
+        self.cache = BuildCache('precompress', cache_dir=os.path.join(root, CACHE_DIR))
+        self.results = []
+
+    def find_assets(self):
+        """List every text asset matching the configured patterns"""
+        assets = set()
+        for pattern in self.patterns:
+            assets.update(glob.glob(os.path.join(self.root, pattern)))
+        return sorted(path for path in assets if os.path.isfile(path))
+
+    def cache_key(self, path):
+        """Cache keys are site-relative paths with forward slashes"""
+        return os.path.relpath(path, self.root).replace(os.sep, '/')
+
+    def is_up_to_date(self, path, key, source_hash):
+        """Check the cached hash matches and every sibling written last time still exists"""
+        entry = self.cache.get(key)
+        if not entry or entry.get('hash') != source_hash:
+            return False
+        return all(os.path.exists(path + ext) for ext in entry.get('outputs', []))
+
+    def compress_asset(self, path):
+        """Compress a single asset; returns a result record for the report"""
+        key = self.cache_key(path)
+        source_hash = file_hash(path)
+        result = {'path': key, 'size': os.path.getsize(path), 'outputs': {}, 'skipped': False}
+
+        if not self.force and self.is_up_to_date(path, key, source_hash):
+            result['skipped'] = True
+            return result
+
+        with open(path, 'rb') as f:
+            data = f.read()
+
+        for ext, compress in self.codecs:
+            target = path + ext
+            compressed = compress(data) if len(data) >= MIN_SIZE else None
+            if compressed is None or len(compressed) >= len(data):
+                # Not worth serving - make sure no stale sibling is left behind
+                if not self.dry_run and os.path.exists(target):
+                    os.remove(target)
+                continue
+
+            result['outputs'][ext] = len(compressed)
+            if not self.dry_run:
+                with open(target, 'wb') as f:
+                    f.write(compressed)
+
+        if not self.dry_run:
+            self.cache.set(key, {'hash': source_hash, 'outputs': sorted(result['outputs'])})
+
+        return result
+
+    def remove_orphans(self, assets):
+        """Delete compressed siblings whose source file no longer exists"""
+        removed = 0
+        asset_set = set(assets)
+        for ext, _ in self.codecs:
+            for pattern in self.patterns:
+                for sibling in glob.glob(os.path.join(self.root, pattern + ext)):
+                    if sibling[:-len(ext)] not in asset_set:
+                        if not self.dry_run:
+                            os.remove(sibling)
+                        removed += 1
+        return removed
+
+    def run(self):
+        """Compress every changed asset and print the per-file savings report"""
+        assets = self.find_assets()
+        codec_names = ', '.join(ext.lstrip('.') for ext, _ in self.codecs)
+        print(f"🗜️  Precompressing {len(assets)} assets ({codec_names})" + (" (DRY RUN)" if self.dry_run else ""))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            self.results = list(pool.map(self.compress_asset, assets))
+
+        removed = self.remove_orphans(assets)
+        self.cache.prune(self.cache_key(path) for path in assets)
+        if not self.dry_run:
+            self.cache.save()
+
+        self.print_report(removed)
+        return self.results
+
+    def print_report(self, removed=0):
+        """Print byte savings per compressed file and overall totals"""
+        compressed = [r for r in self.results if not r['skipped']]
+        skipped = len(self.results) - len(compressed)
+        total_source = 0
+        total_saved = {}
+
+        for result in compressed:
+            if not result['outputs']:
+                continue
+            total_source += result['size']
+            parts = []
+            for ext, size in result['outputs'].items():
+                saved = result['size'] - size
+                total_saved[ext] = total_saved.get(ext, 0) + saved
+                parts.append(f"{ext} {size:,} (-{saved / result['size']:.0%})")
+            print(f"   {result['path']}: {result['size']:,} bytes → " + ', '.join(parts))
+
+        print(f"📊 Compressed {len(compressed)} files, skipped {skipped} unchanged")
+        for ext, saved in total_saved.items():
+            print(f"   {ext}: saved {saved:,} of {total_source:,} bytes ({saved / total_source:.0%})")
+        if removed:
+            print(f"🧹 Removed {removed} orphaned compressed files")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Precompress site text assets")
+    parser.add_argument('--force', action='store_true', help='Recompress every asset, ignoring the cache')
+    parser.add_argument('--dry-run', action='store_true', help='Report savings without writing files')
+    parser.add_argument('--root', type=str, default='.', help='Site root directory')
+    return parser.parse_args()
+
+def main():
+    """Run the precompression stage"""
+    args = parse_arguments()
+
+    try:
+        Precompressor(root=args.root, force=args.force, dry_run=args.dry_run).run()
+    except Exception as e:
+        print(f"❌ Precompression failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
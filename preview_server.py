@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Local Preview Server
+Threaded, cross-platform stand-in for Netlify: serves precompressed siblings
+(with Range support), applies _headers/_redirects and netlify.toml rules, and
+rebuilds only the affected build stages when their inputs change
+"""
+
+import argparse
+import email.utils
+import fnmatch
+import mimetypes
+import os
+import posixpath
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+try:
+    import tomllib
+except ImportError:
+    tomllib = None
+
+# Preferred first; only used when the sibling exists and the client accepts it
+ENCODINGS = [('br', '.br'), ('gzip', '.gz')]
+
+# Netlify's default for anything _headers does not cover
+DEFAULT_CACHE_CONTROL = 'public, max-age=0, must-revalidate'
+
+REDIRECT_STATUSES = (301, 302, 303, 307, 308)
+
+CONTENT_TYPES = {
+    '.webmanifest': 'application/manifest+json',
+    '.json': 'application/json',
+    '.xml': 'application/xml',
+    '.js': 'text/javascript',
+    '.css': 'text/css',
+    '.svg': 'image/svg+xml',
+    '.webp': 'image/webp'
+}
+
+RANGE_PATTERN = re.compile(r'^bytes=(\d*)-(\d*)$')
+
+def compile_pattern(pattern):
+    """Netlify path pattern → regex: '*' is a splat, ':name' matches one segment"""
+    parts = []
+    for token in re.split(r'(\*|:[A-Za-z_]\w*)', pattern.rstrip('/') or '/'):
+        if token == '*':
+            parts.append(r'(?P<splat>.*)')
+        elif token.startswith(':'):
+            parts.append(rf'(?P<{token[1:]}>[^/]+)')
+        else:
+            parts.append(re.escape(token))
+    return re.compile('^' + ''.join(parts) + '/?$')
+
+def parse_headers_file(path):
+    """Rules from a _headers file: [(regex, [(name, value), ...]), ...]"""
+    rules = []
+    if not os.path.exists(path):
+        return rules
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            stripped = line.strip()
+            if not stripped or stripped.startswith('#'):
+                continue
+            if not line[0].isspace():
+                rules.append((compile_pattern(stripped), []))
+            elif rules and ':' in stripped:
+                name, value = stripped.split(':', 1)
+                rules[-1][1].append((name.strip(), value.strip()))
+    return rules
+
+def parse_redirects_file(path):
+    """Rules from a _redirects file: [{'pattern', 'to', 'status', 'force'}, ...]"""
+    rules = []
+    if not os.path.exists(path):
+        return rules
+
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            fields = line.split('#', 1)[0].split()
+            if len(fields) < 2:
+                continue
+            status, force = 301, False
+            if len(fields) > 2 and re.match(r'^\d{3}!?$', fields[2]):
+                status, force = int(fields[2].rstrip('!')), fields[2].endswith('!')
+            rules.append({'pattern': compile_pattern(fields[0]), 'to': fields[1], 'status': status, 'force': force})
+    return rules
+
+def parse_netlify_toml(path):
+    """[[headers]] and [[redirects]] from netlify.toml, in the same shapes as above"""
+    if tomllib is None or not os.path.exists(path):
+        return [], []
+
+    with open(path, 'rb') as f:
+        config = tomllib.load(f)
+
+    headers = [(compile_pattern(rule['for']), [(name, str(value)) for name, value in rule.get('values', {}).items()])
+               for rule in config.get('headers', []) if 'for' in rule]
+    redirects = [{'pattern': compile_pattern(rule['from']), 'to': rule['to'], 'status': int(rule.get('status', 301)),
+                  'force': bool(rule.get('force', False))}
+                 for rule in config.get('redirects', []) if 'from' in rule and 'to' in rule]
+    return headers, redirects
+
+def expand_target(target, match):
+    """Fill ':splat' and ':name' placeholders in a redirect target"""
+    values = {name: value or '' for name, value in match.groupdict().items()}
+    return re.sub(r':([A-Za-z_]\w*)', lambda m: values.get(m.group(1), m.group(0)), target)
+
+def parse_range(header, size):
+    """(start, end) for a single 'bytes=' range, None for no/ignored range, False if unsatisfiable"""
+    match = RANGE_PATTERN.match(header or '')
+    if not match or match.groups() == ('', ''):
+        return None
+
+    start, end = match.groups()
+    if start == '':
+        length = int(end)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+class SiteRules:
+    """Header and redirect rules for the site, reloaded when their files change"""
+
+    def __init__(self, root):
+        self.root = root
+        self.signature = None
+        self.headers = []
+        self.redirects = []
+        self.lock = threading.Lock()
+
+    def sources(self):
+        return [os.path.join(self.root, name) for name in ('_headers', '_redirects', 'netlify.toml')]
+
+    def refresh(self):
+        """Re-parse the rule files if any of them changed"""
+        signature = tuple(os.stat(path).st_mtime_ns if os.path.exists(path) else None for path in self.sources())
+        with self.lock:
+            if signature == self.signature:
+                return
+            headers_path, redirects_path, toml_path = self.sources()
+            toml_headers, toml_redirects = parse_netlify_toml(toml_path)
+            # Netlify reads _headers/_redirects before netlify.toml
+            self.headers = parse_headers_file(headers_path) + toml_headers
+            self.redirects = parse_redirects_file(redirects_path) + toml_redirects
+            self.signature = signature
+
+    def headers_for(self, url_path):
+        """Custom headers for a request path; later rules win for the same name"""
+        merged = {}
+        for pattern, values in self.headers:
+            if pattern.match(url_path):
+                for name, value in values:
+                    merged[name.lower()] = (name, value)
+        return list(merged.values())
+
+class PreviewRequestHandler(BaseHTTPRequestHandler):
+    """Serves the site the way Netlify would"""
+
+    server_version = "PreviewServer/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def root(self):
+        return self.server.root
+
+    @property
+    def rules(self):
+        return self.server.rules
+
+    def do_GET(self):
+        self.handle_request(send_body=True)
+
+    def do_HEAD(self):
+        self.handle_request(send_body=False)
+
+    def resolve_file(self, url_path):
+        """Static file for a URL path (exact, directory index or pretty .html URL)"""
+        relative = posixpath.normpath(url_path).lstrip('/')
+        if relative.startswith('..'):
+            return None
+
+        base = os.path.join(self.root, *[part for part in relative.split('/') if part and part != '.'])
+        candidates = [os.path.join(base, 'index.html')] if url_path.endswith('/') else [
+            base, os.path.join(base, 'index.html'), base + '.html'
+        ]
+        for candidate in candidates:
+            if os.path.isfile(candidate):
+                return candidate
+        return None
+
+    def handle_request(self, send_body):
+        self.rules.refresh()
+        url_path = unquote(urlsplit(self.path).path) or '/'
+        file_path = self.resolve_file(url_path)
+        status = 200
+
+        for rule in self.rules.redirects:
+            # Existing files shadow rules unless the rule is forced (status with '!')
+            if file_path and not rule['force']:
+                continue
+            match = rule['pattern'].match(url_path)
+            if not match:
+                continue
+
+            target = expand_target(rule['to'], match)
+            if rule['status'] in REDIRECT_STATUSES:
+                self.send_redirect(rule['status'], target, url_path)
+                return
+            rewritten = self.resolve_file(urlsplit(target).path)
+            if rewritten:
+                file_path, status = rewritten, rule['status']
+                break
+
+        if not file_path:
+            fallback = os.path.join(self.root, '404.html')
+            file_path, status = (fallback if os.path.isfile(fallback) else None), 404
+        if not file_path:
+            self.send_error(404)
+            return
+
+        self.send_file(file_path, status, url_path, send_body)
+
+    def choose_encoding(self, file_path):
+        """(path to send, Content-Encoding) honouring Accept-Encoding and existing siblings"""
+        accepted = {token.split(';')[0].strip().lower() for token in self.headers.get('Accept-Encoding', '').split(',')}
+        for encoding, ext in ENCODINGS:
+            if encoding in accepted and os.path.isfile(file_path + ext):
+                return file_path + ext, encoding
+        return file_path, None
+
+    def content_type(self, file_path):
+        ext = os.path.splitext(file_path)[1].lower()
+        content_type = CONTENT_TYPES.get(ext) or mimetypes.guess_type(file_path)[0] or 'application/octet-stream'
+        if content_type.startswith('text/') or content_type.endswith(('json', 'xml', 'javascript')):
+            content_type += '; charset=utf-8'
+        return content_type
+
+    def send_common_headers(self, url_path, content_type=None):
+        """Netlify defaults first, then the matching _headers/netlify.toml rules"""
+        headers = {'cache-control': ('Cache-Control', DEFAULT_CACHE_CONTROL)}
+        if content_type:
+            headers['content-type'] = ('Content-Type', content_type)
+        for name, value in self.rules.headers_for(url_path):
+            headers[name.lower()] = (name, value)
+        for name, value in headers.values():
+            self.send_header(name, value)
+
+    def send_redirect(self, status, location, url_path):
+        self.send_response(status)
+        self.send_header('Location', location)
+        self.send_header('Content-Length', '0')
+        self.send_common_headers(url_path)
+        self.end_headers()
+
+    def send_file(self, file_path, status, url_path, send_body):
+        """Send a file (or one byte range of it), precompressed when possible"""
+        send_path, encoding = self.choose_encoding(file_path)
+        stat = os.stat(send_path)
+        etag = f'"{stat.st_mtime_ns:x}-{stat.st_size:x}{"-" + encoding if encoding else ""}"'
+
+        if status == 200 and etag in self.headers.get('If-None-Match', ''):
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        byte_range = parse_range(self.headers.get('Range'), stat.st_size) if status == 200 else None
+        if byte_range is False:
+            self.send_response(416)
+            self.send_header('Content-Range', f"bytes */{stat.st_size}")
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        start, end = byte_range or (0, stat.st_size - 1)
+        length = max(end - start + 1, 0)
+
+        self.send_response(206 if byte_range else status)
+        self.send_common_headers(url_path, self.content_type(file_path))
+        self.send_header('Content-Length', str(length))
+        self.send_header('Accept-Ranges', 'bytes')
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', email.utils.formatdate(stat.st_mtime, usegmt=True))
+        self.send_header('Vary', 'Accept-Encoding')
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        if byte_range:
+            self.send_header('Content-Range', f"bytes {start}-{end}/{stat.st_size}")
+        self.end_headers()
+
+        if not send_body:
+            return
+        with open(send_path, 'rb') as f:
+            f.seek(start)
+            remaining = length
+            while remaining > 0:
+                chunk = f.read(min(65536, remaining))
+                if not chunk:
+                    break
+                self.wfile.write(chunk)
+                remaining -= len(chunk)
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+class PreviewServer(ThreadingHTTPServer):
+    """Threaded HTTP server bound to a site root"""
+
+    daemon_threads = True
+
+    def __init__(self, address, root=".", quiet=False):
+        super().__init__(address, PreviewRequestHandler)
+        self.root = os.path.abspath(root)
+        self.rules = SiteRules(self.root)
+        self.quiet = quiet
+
+def affected_stages(stages, changed_paths):
+    """Stages whose inputs include a changed file, plus every stage downstream of them"""
+    affected = {stage.name for stage in stages
+                if any(fnmatch.fnmatch(path, pattern) for path in changed_paths for pattern in stage.inputs)}
+
+    grew = True
+    while grew:
+        downstream = {stage.name for stage in stages if affected.intersection(stage.deps)}
+        grew = not downstream <= affected
+        affected |= downstream
+    return affected
+
+class SiteWatcher:
+    """Polls build inputs and rebuilds the stages they feed (portable: no OS file events)"""
+
+    def __init__(self, interval=1.0):
+        from build import default_stages
+        self.stages = default_stages()
+        self.patterns = sorted({pattern for stage in self.stages for pattern in stage.inputs})
+        self.interval = interval
+        self.snapshot = self.scan()
+
+    def scan(self):
+        from build import expand
+        snapshot = {}
+        for path in expand(self.patterns):
+            stat = os.stat(path)
+            snapshot[path.replace(os.sep, '/')] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def changes(self):
+        current = self.scan()
+        changed = {path for path in set(current) | set(self.snapshot) if current.get(path) != self.snapshot.get(path)}
+        return changed, current
+
+    def rebuild(self, changed_paths):
+        from build import SiteBuilder
+
+        targets = affected_stages(self.stages, changed_paths)
+        if not targets:
+            return
+        print(f"\n🔁 {len(changed_paths)} file(s) changed → rebuilding {', '.join(sorted(targets))}")
+        SiteBuilder(self.stages).build(sorted(targets))
+
+    def run(self):
+        while True:
+            time.sleep(self.interval)
+            changed, current = self.changes()
+            if not changed:
+                continue
+
+            # Let editors finish writing before building
+            time.sleep(self.interval)
+            changed, current = self.changes()
+            try:
+                self.rebuild(changed)
+            except Exception as e:
+                print(f"❌ Rebuild failed: {e}")
+            # Files the build itself wrote are not new edits
+            self.snapshot = self.scan()
+
+    def start(self):
+        thread = threading.Thread(target=self.run, daemon=True)
+        thread.start()
+        return thread
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Serve the site locally with Netlify-like headers, redirects and compression")
+    parser.add_argument('--port', '-p', type=int, default=8000, help='Port to listen on (default: 8000)')
+    parser.add_argument('--host', type=str, default='127.0.0.1', help='Interface to bind (default: 127.0.0.1)')
+    parser.add_argument('--no-watch', action='store_true', help='Do not rebuild when source files change')
+    parser.add_argument('--interval', type=float, default=1.0, help='Seconds between change checks (default: 1)')
+    parser.add_argument('--quiet', action='store_true', help='Do not log requests')
+    return parser.parse_args()
+
+def main():
+    """Run the preview server"""
+    # Build stages use paths relative to the site root
+    os.chdir(os.path.dirname(os.path.abspath(__file__)))
+    args = parse_arguments()
+
+    try:
+        server = PreviewServer((args.host, args.port), quiet=args.quiet)
+    except OSError as e:
+        print(f"❌ Could not listen on {args.host}:{args.port}: {e}")
+        return 1
+
+    if not args.no_watch:
+        watcher = SiteWatcher(interval=args.interval)
+        watcher.start()
+        print(f"👀 Watching {len(watcher.snapshot)} build inputs for changes")
+
+    print(f"🌐 Serving {server.root} at http://{args.host}:{args.port}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n👋 Stopping preview server")
+    finally:
+        server.server_close()
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Run Metrics
+Counters, gauges and latency histograms for the episode update run, written
+as a Prometheus textfile (for node_exporter's textfile collector) and as one
+JSON line per run for trend analysis
+"""
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+PREFIX = "episode_update_"
+TEXTFILE_NAME = "episode_update.prom"
+RUN_LOG_NAME = "episode_update_runs.jsonl"
+
+# Seconds; the Prometheus client defaults, suited to network and file I/O
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# For in-process checks that take microseconds
+FAST_BUCKETS = (0.000001, 0.000005, 0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005)
+
+def label_key(labels):
+    return tuple(sorted((name, str(value)) for name, value in labels.items()))
+
+def format_labels(key, extra=()):
+    pairs = list(key) + list(extra)
+    if not pairs:
+        return ''
+    escaped = (value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for _, value in pairs)
+    return '{' + ','.join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + '}'
+
+def format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+class MetricsRegistry:
+    """Thread-safe in-memory metrics for one run"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.context = threading.local()
+        self.reset()
+
+    def reset(self):
+        with self.lock:
+            self.started = time.time()
+            self.counters = {}
+            self.gauges = {}
+            self.histograms = {}
+            self.help = {}
+
+    @contextmanager
+    def labelled(self, **labels):
+        """Add labels to every metric recorded by this thread inside the block"""
+        previous = getattr(self.context, 'labels', {})
+        self.context.labels = {**previous, **labels}
+        try:
+            yield
+        finally:
+            self.context.labels = previous
+
+    def key_for(self, labels):
+        return label_key({**getattr(self.context, 'labels', {}), **labels})
+
+    def inc(self, name, value=1, help=None, **labels):
+        """Add to a counter"""
+        with self.lock:
+            series = self.counters.setdefault(name, {})
+            key = self.key_for(labels)
+            series[key] = series.get(key, 0) + value
+            if help:
+                self.help.setdefault(name, help)
+
+    def total(self, name):
+        """Sum of a counter across all its labels"""
+        with self.lock:
+            return sum(self.counters.get(name, {}).values())
+
+    def set(self, name, value, help=None, **labels):
+        """Set a gauge"""
+        with self.lock:
+            self.gauges.setdefault(name, {})[self.key_for(labels)] = value
+            if help:
+                self.help.setdefault(name, help)
+
+    def observe(self, name, value, buckets=DEFAULT_BUCKETS, help=None, **labels):
+        """Record one histogram observation"""
+        with self.lock:
+            series = self.histograms.setdefault(name, {})
+            key = self.key_for(labels)
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = {'buckets': buckets, 'counts': [0] * len(buckets),
+                                           'sum': 0.0, 'count': 0, 'max': 0.0}
+            for index, bound in enumerate(histogram['buckets']):
+                if value <= bound:
+                    histogram['counts'][index] += 1
+            histogram['sum'] += value
+            histogram['count'] += 1
+            histogram['max'] = max(histogram['max'], value)
+            if help:
+                self.help.setdefault(name, help)
+
+    @contextmanager
+    def timed(self, name, buckets=DEFAULT_BUCKETS, help=None, **labels):
+        """Time a block into <name>_duration_seconds; failures also count in <name>_errors_total"""
+        start = time.perf_counter()
+        try:
+            yield
+        except Exception:
+            self.inc(f"{name}_errors_total", help=f"Failed {name.replace('_', ' ')} calls", **labels)
+            raise
+        finally:
+            self.observe(f"{name}_duration_seconds", time.perf_counter() - start, buckets=buckets,
+                         help=help or f"Duration of {name.replace('_', ' ')} calls", **labels)
+
+    def render_prometheus(self):
+        """The metrics in Prometheus text exposition format"""
+        lines = []
+        with self.lock:
+            for kind, metrics in (('counter', self.counters), ('gauge', self.gauges)):
+                for name in sorted(metrics):
+                    full_name = PREFIX + name
+                    if name in self.help:
+                        lines.append(f"# HELP {full_name} {self.help[name]}")
+                    lines.append(f"# TYPE {full_name} {kind}")
+                    for key, value in sorted(metrics[name].items()):
+                        lines.append(f"{full_name}{format_labels(key)} {format_value(value)}")
+
+            for name in sorted(self.histograms):
+                full_name = PREFIX + name
+                if name in self.help:
+                    lines.append(f"# HELP {full_name} {self.help[name]}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(self.histograms[name].items()):
+                    for bound, count in zip(histogram['buckets'], histogram['counts']):
+                        lines.append(f"{full_name}_bucket{format_labels(key, [('le', repr(float(bound)))])} {count}")
+                    lines.append(f"{full_name}_bucket{format_labels(key, [('le', '+Inf')])} {histogram['count']}")
+                    lines.append(f"{full_name}_sum{format_labels(key)} {format_value(histogram['sum'])}")
+                    lines.append(f"{full_name}_count{format_labels(key)} {histogram['count']}")
+        return '\n'.join(lines) + '\n'
+
+    def snapshot(self):
+        """The metrics as plain JSON-friendly data"""
+        def series(metrics, convert):
+            return {name: [dict(labels=dict(key), **convert(value)) for key, value in sorted(values.items())]
+                    for name, values in sorted(metrics.items())}
+
+        with self.lock:
+            return {
+                'counters': series(self.counters, lambda value: {'value': value}),
+                'gauges': series(self.gauges, lambda value: {'value': value}),
+                'histograms': series(self.histograms, lambda histogram: {
+                    'count': histogram['count'],
+                    'sum': round(histogram['sum'], 6),
+                    'max': round(histogram['max'], 6),
+                    'mean': round(histogram['sum'] / histogram['count'], 6) if histogram['count'] else 0.0
+                })
+            }
+
+    def write(self, directory, success, extra=None):
+        """Write the textfile (atomically, as the textfile collector requires) and append the run record"""
+        finished = time.time()
+        self.set('last_run_timestamp_seconds', round(finished), help="Unix time the last run finished")
+        self.set('last_run_duration_seconds', round(finished - self.started, 3), help="Wall time of the last run")
+        self.set('last_run_success', 1 if success else 0, help="1 if the last run succeeded")
+
+        os.makedirs(directory, exist_ok=True)
+        textfile = os.path.join(directory, TEXTFILE_NAME)
+        with open(textfile + '.tmp', 'w', encoding='utf-8') as f:
+            f.write(self.render_prometheus())
+        os.replace(textfile + '.tmp', textfile)
+
+        record = {
+            'started': datetime.fromtimestamp(self.started, timezone.utc).isoformat(timespec='seconds'),
+            'duration_seconds': round(finished - self.started, 3),
+            'success': success
+        }
+        record.update(extra or {})
+        record.update(self.snapshot())
+        with open(os.path.join(directory, RUN_LOG_NAME), 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+        print(f"📈 Wrote run metrics to {textfile}")
+        return textfile
+
+# Shared by every module of the update run
+metrics = MetricsRegistry()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Search Index Builder
+Builds a prefix-sharded inverted index over episode and blog catalogs so the
+browser only downloads the shard for the term being typed
+"""
+
+import glob
+import html
+import json
+import os
+import re
+from build_cache import CACHE_DIR, BuildCache, file_hash, hash_bytes
+
+INDEX_DIR = "data/search"
+INDEX_VERSION = 2
+PREFIX_LENGTH = 2
+
+# Weight of a term occurrence per field
+FIELD_WEIGHTS = {
+    'title': 3,
+    'excerpt': 2,
+    'description': 1,
+    'full_content': 1
+}
+
+ENGLISH_STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'but', 'by', 'for', 'from', 'has',
+    'have', 'he', 'her', 'his', 'i', 'if', 'in', 'into', 'is', 'it', 'its', 'of',
+    'on', 'or', 'our', 'she', 'so', 'that', 'the', 'their', 'them', 'there',
+    'they', 'this', 'to', 'was', 'we', 'were', 'what', 'when', 'which', 'who',
+    'will', 'with', 'you', 'your'
+}
+
+# Niqqud and cantillation marks are dropped so pointed and unpointed text match
+HEBREW_MARKS = re.compile(r'[\u0591-\u05C7]')
+# Final letter forms are folded so prefix matching works mid-word
+HEBREW_FINALS = str.maketrans('ךםןףץ', 'כמנפצ')
+# Single-letter prefixes (ו, ה, ב, ל, מ, ש, כ) that attach to Hebrew words
+HEBREW_PREFIXES = 'והבלמשכ'
+TOKEN_PATTERN = re.compile(r'[a-z0-9\u05D0-\u05EA]+')
+
+HEBREW_STOPWORDS = {word.translate(HEBREW_FINALS) for word in [
+    'של', 'את', 'על', 'עם', 'זה', 'זו', 'הוא', 'היא', 'הם', 'הן', 'אם', 'כי',
+    'לא', 'גם', 'אל', 'או', 'כל', 'מה', 'יש', 'אין', 'אשר', 'כמו'
+]}
+TAG_PATTERN = re.compile(r'<[^>]+>')
+
+def normalize_text(text):
+    """Strip markup and diacritics and fold case/final forms for indexing"""
+    text = html.unescape(TAG_PATTERN.sub(' ', text or ''))
+    text = text.replace('’', "'").replace("'", '').replace('׳', '').replace('״', '')
+    text = HEBREW_MARKS.sub('', text)
+    return text.lower().translate(HEBREW_FINALS)
+
+def is_hebrew(token):
+    """Check whether a token is written in Hebrew letters"""
+    return '\u05D0' <= token[0] <= '\u05EA'
+
+def tokenize(text):
+    """Split text into index terms for both English and Hebrew"""
+    terms = []
+    for token in TOKEN_PATTERN.findall(normalize_text(text)):
+        if len(token) < 2 or token in ENGLISH_STOPWORDS or token in HEBREW_STOPWORDS:
+            continue
+        terms.append(token)
+
+        # Also index Hebrew words without their attached prefix letter
+        if is_hebrew(token) and len(token) > 3 and token[0] in HEBREW_PREFIXES:
+            terms.append(token[1:])
+    return terms
+
+def shard_key(term):
+    """Shard file name for a term: hex code points of its first characters"""
+    return '-'.join(f"{ord(c):x}" for c in term[:PREFIX_LENGTH])
+
+def series_page_url(series_name):
+    """Site-relative URL of a series page"""
+    if series_name.endswith('-hebrew'):
+        return f"hebrew-home/series/{series_name}.html"
+    return f"series/{series_name}.html"
+
+def episode_key(episode):
+    """Spotify episode ID taken from the embed URL"""
+    url = episode.get('spotify_embed_url', '')
+    return url.split('/episode/')[-1] if '/episode/' in url else None
+
+class SearchIndexBuilder:
+    """Builds and incrementally updates the sharded search index"""
+
+    def __init__(self, root=".", index_dir=INDEX_DIR, dry_run=False):
+        self.root = root
+        self.index_dir = os.path.join(root, index_dir)
+        self.dry_run = dry_run
+        self.cache = BuildCache('search_index', cache_dir=os.path.join(root, CACHE_DIR))
+
+    def list_sources(self):
+        """List (kind, path) for every catalog feeding the index"""
+        sources = []
+        for path in sorted(glob.glob(os.path.join(self.root, 'data', '*_episodes.json'))):
+            sources.append(('episodes', path))
+        for path in ['data/blog_posts.json', 'hebrew-home/data/blog_posts.json']:
+            full_path = os.path.join(self.root, path)
+            if os.path.exists(full_path):
+                sources.append(('blog', full_path))
+        return sources
+
+    def weigh_fields(self, fields):
+        """Build a term → weight map from (field name, text) pairs"""
+        weights = {}
+        for field, text in fields:
+            for term in tokenize(text):
+                weights[term] = weights.get(term, 0) + FIELD_WEIGHTS[field]
+        return weights
+
+    def index_episodes(self, path):
+        """Extract documents from a series episode catalog"""
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            episodes = json.load(f).get('episodes', [])
+
+        series_name = os.path.basename(path).replace('_episodes.json', '')
+        documents = {}
+        for episode in episodes:
+            key = episode_key(episode)
+            if not key:
+                continue
+            documents[f"e:{key}"] = {
+                'meta': {
+                    'title': episode.get('title', ''),
+                    'url': series_page_url(series_name),
+                    'type': 'episode',
+                    'series': series_name,
+                    'date': episode.get('date', '')
+                },
+                'terms': self.weigh_fields([
+                    ('title', episode.get('title', '')),
+                    ('description', episode.get('description', ''))
+                ])
+            }
+        return documents
+
+    def index_blog(self, path):
+        """Extract documents from a blog post catalog"""
+        with open(path, 'r', encoding='utf-8-sig') as f:
+            posts = json.load(f)
+
+        hebrew = path.replace(os.sep, '/').endswith('hebrew-home/data/blog_posts.json')
+        url_prefix = 'hebrew-home/blog/' if hebrew else 'blog/'
+        documents = {}
+        for post in posts:
+            slug = post.get('slug')
+            if not slug:
+                continue
+            documents[f"b:{slug}"] = {
+                'meta': {
+                    'title': post.get('title', ''),
+                    'url': f"{url_prefix}{slug}.html",
+                    'type': 'blog',
+                    'lang': 'he' if hebrew else 'en',
+                    'date': post.get('date', '')
+                },
+                'terms': self.weigh_fields([
+                    ('title', post.get('title', '')),
+                    ('excerpt', post.get('excerpt', '')),
+                    ('full_content', post.get('full_content', ''))
+                ])
+            }
+        return documents
+
+    def index_current(self):
+        """Whether index.json exists and was written by this version of the builder"""
+        try:
+            with open(os.path.join(self.index_dir, 'index.json'), 'r', encoding='utf-8') as f:
+                return json.load(f).get('version') == INDEX_VERSION
+        except (OSError, ValueError):
+            return False
+
+    def collect_documents(self):
+        """Re-index only the catalogs whose hash changed, reusing cached documents"""
+        documents = {}
+        reindexed = []
+        source_keys = []
+
+        for kind, path in self.list_sources():
+            key = os.path.relpath(path, self.root).replace(os.sep, '/')
+            source_keys.append(key)
+            source_hash = file_hash(path)
+            entry = self.cache.get(key)
+
+            if entry and entry.get('hash') == source_hash:
+                documents.update(entry['documents'])
+                continue
+
+            try:
+                source_docs = self.index_episodes(path) if kind == 'episodes' else self.index_blog(path)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Skipping {key} in search index: {e}")
+                continue
+
+            self.cache.set(key, {'hash': source_hash, 'documents': source_docs})
+            documents.update(source_docs)
+            reindexed.append(key)
+
+        self.cache.prune(source_keys)
+        return documents, reindexed
+
+    def build_shards(self, documents):
+        """Invert document term maps into prefix shards of sorted postings"""
+        shards = {}
+        for doc_id in sorted(documents):
+            for term, weight in documents[doc_id]['terms'].items():
+                shard = shards.setdefault(shard_key(term), {})
+                shard.setdefault(term, []).append([doc_id, weight])
+
+        for shard in shards.values():
+            for postings in shard.values():
+                postings.sort(key=lambda posting: (-posting[1], posting[0]))
+        return shards
+
+    def write_json(self, file_name, data):
+        """Write a JSON file only if its content changed; returns its content hash"""
+        payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'), sort_keys=True).encode('utf-8')
+        path = os.path.join(self.index_dir, file_name)
+
+        try:
+            with open(path, 'rb') as f:
+                unchanged = f.read() == payload
+        except FileNotFoundError:
+            unchanged = False
+
+        if not unchanged and not self.dry_run:
+            with open(path, 'wb') as f:
+                f.write(payload)
+
+        return hash_bytes(payload), not unchanged
+
+    def build(self):
+        """Build or incrementally update the search index"""
+        print("🔎 Building search index..." + (" (DRY RUN)" if self.dry_run else ""))
+
+        documents, reindexed = self.collect_documents()
+        if not reindexed and self.index_current():
+            print("📋 Search index up to date")
+            return False
+
+        if not self.dry_run and not os.path.exists(self.index_dir):
+            os.makedirs(self.index_dir)
+
+        shards = self.build_shards(documents)
+        written = 0
+        shard_hashes = {}
+        for key, shard in shards.items():
+            shard_hashes[key], changed = self.write_json(f"{key}.json", shard)
+            written += changed
+
+        docs_hash, docs_changed = self.write_json('docs.json', {
+            doc_id: document['meta'] for doc_id, document in documents.items()
+        })
+
+        # Remove shards for prefixes that no longer occur
+        removed = 0
+        if os.path.isdir(self.index_dir):
+            for path in glob.glob(os.path.join(self.index_dir, '*.json')):
+                name = os.path.basename(path)[:-len('.json')]
+                if name not in shard_hashes and name not in ('docs', 'index'):
+                    if not self.dry_run:
+                        os.remove(path)
+                    removed += 1
+
+        # The query side drops the same stopwords, or "laws of the" would prefix-match "often"
+        self.write_json('index.json', {
+            'version': INDEX_VERSION,
+            'prefix_length': PREFIX_LENGTH,
+            'stopwords': sorted(ENGLISH_STOPWORDS | HEBREW_STOPWORDS),
+            'docs': docs_hash,
+            'shards': shard_hashes
+        })
+
+        if not self.dry_run:
+            self.cache.save()
+
+        print(f"✅ Search index: {len(documents)} documents, {len(shards)} shards "
+              f"({written} shards written, {removed} removed{', docs updated' if docs_changed else ''})")
+        for key in reindexed:
+            print(f"   Re-indexed {key}")
+        return True
+
+def main():
+    """Build the search index for the current site"""
+    try:
+        SearchIndexBuilder().build()
+    except Exception as e:
+        print(f"❌ Search index build failed: {e}")
+        return 1
+
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
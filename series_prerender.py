@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Series Page Pre-renderer
+Renders the first page of episode cards into each series page between marker
+comments, so cards paint before series-page.js has fetched the catalog.
+The client script hydrates those cards and takes over from there.
+"""
+
+import argparse
+import glob
+import html
+import json
+import os
+import re
+from datetime import datetime
+from build_cache import CACHE_DIR, BuildCache, file_hash, hash_bytes
+from css_purge import read_text, write_if_changed
+from site_feeds import series_page_path
+from site_templates import Template
+
+PRERENDER_START = '<!-- prerendered-episodes:start -->'
+PRERENDER_END = '<!-- prerendered-episodes:end -->'
+
+# Mirrors series-page.js: how many cards the first page shows
+EPISODES_PER_PAGE = 6
+TABBED_EPISODES_PER_PAGE = 9
+
+# Series whose default order is by episode number; the rest stay newest first
+EPISODE_NUMBER_ORDER = ('dating', 'shalom-bayis', 'shmiras-einayim')
+
+# Series split into season tabs: grid id per season
+SEASON_GRIDS = {
+    'shmiras-einayim': {'Season 1': 'season1-episodes-grid', 'Season 2': 'season2-episodes-grid'}
+}
+DEFAULT_GRID = 'episodes-grid'
+
+SEASON_PREFIX = re.compile(r'^S[12]\sEp\.\s\d+\s-\s')
+
+# Same markup as createEpisodeCard() in series-page.js, plus the episode-card-rendered marker and
+# the episode URL series-page.js checks the cards against the catalog with
+EPISODE_CARD = Template('''
+<div class="episode-card-series episode-card-rendered" data-episode-url="{{ episode_url }}">
+    <div class="episode-spotify-container">
+        {{ player }}
+    </div>
+    <div class="episode-card-content">
+        <div class="episode-card-header">
+            <span class="episode-number">Episode {{ episode_number }}</span>
+            <div class="episode-metadata">
+                <span class="episode-length">{{ duration }}</span>
+            </div>
+        </div>
+        <h3 class="episode-card-title">{{ title }}</h3>
+        <p class="episode-card-description">{{ description }}</p>
+        <div class="episode-card-footer">
+            <div class="episode-duration">
+                <span class="duration-icon">⏱️</span>
+                {{ duration }}
+            </div>
+            {{ spotify_link }}
+        </div>
+    </div>
+</div>''', name='episode_card')
+
+# Same markup as createSpotifyFacade(): the player iframe loads on click
+SPOTIFY_PLAYER = Template(
+    '<button type="button" class="episode-spotify-facade" data-embed-src="{{ src }}" '
+    'aria-label="Play episode on Spotify">{{ art }}'
+    '<span class="episode-spotify-facade-play" aria-hidden="true">▶</span>'
+    '<span class="episode-spotify-facade-label">Play on Spotify</span></button>'
+)
+
+SPOTIFY_ART = Template(
+    '<img class="episode-spotify-facade-art" src="{{ src }}" alt="" width="{{ width }}" '
+    'height="{{ height }}" loading="lazy">'
+)
+
+SPOTIFY_FALLBACK = (
+    '<div class="episode-spotify-fallback">'
+    '<p class="text-small text-secondary mb-3">Player unavailable</p>'
+    '<p class="text-small">This episode is not available for embedded playback.</p>'
+    '</div>'
+)
+
+SPOTIFY_LINK = Template(
+    '<a href="{{ href }}" target="_blank" rel="noopener" class="btn-primary episode-spotify-link">Listen on Spotify</a>'
+)
+
+RENDERER_HASH = hash_bytes((EPISODE_CARD.hash + SPOTIFY_PLAYER.hash + SPOTIFY_ART.hash + SPOTIFY_LINK.hash).encode('utf-8'))
+
+def parse_date(date_str):
+    """Parse DD-MM-YY like series-page.js parseDate(); undated episodes sort last"""
+    try:
+        return datetime.strptime(date_str, '%d-%m-%y')
+    except (TypeError, ValueError):
+        return datetime.min
+
+def episode_number_key(episode):
+    """parseInt(episode_number) || 999"""
+    match = re.match(r'\s*([+-]?\d+)', str(episode.get('episode_number') or ''))
+    number = int(match.group(1)) if match else 0
+    return number or 999
+
+def default_order(series_name, episodes):
+    """The order series-page.js shows under the default 'all' filter"""
+    ordered = sorted(episodes, key=lambda episode: parse_date(episode.get('date')), reverse=True)
+    if series_name in EPISODE_NUMBER_ORDER:
+        ordered.sort(key=episode_number_key)
+    return ordered
+
+def episode_season(episode):
+    """Mirror of getEpisodeSeason(): explicit S1/S2 title prefix, else the date's year"""
+    if not episode.get('date'):
+        return None
+    title = episode.get('title') or ''
+    if title.startswith('S1'):
+        return 'Season 1'
+    if title.startswith('S2'):
+        return 'Season 2'
+    try:
+        year = int(episode['date'].split('-')[2])
+    except (IndexError, ValueError):
+        return None
+    if year >= 25:
+        return 'Season 2'
+    if year <= 22:
+        return 'Season 1'
+    return None
+
+def truncate_text(text, max_length):
+    """Mirror of truncateText(): JS lengths count UTF-16 code units"""
+    encoded = text.encode('utf-16-le')
+    if len(encoded) <= max_length * 2:
+        return text
+    return encoded[:max_length * 2].decode('utf-16-le', errors='ignore').strip() + '...'
+
+def open_url(embed_url):
+    """Mirror of convertEmbedToOpenUrl()"""
+    return embed_url.replace('/embed/', '/', 1).replace('?utm_source=generator', '', 1)
+
+def render_player(spotify_url, oembed):
+    """Player facade, with the episode artwork when oEmbed data is available"""
+    oembed = oembed or {}
+    art = ''
+    if oembed.get('thumbnail_url'):
+        art = SPOTIFY_ART.render(
+            src=html.escape(oembed['thumbnail_url']),
+            width=html.escape(str(oembed.get('thumbnail_width') or 300)),
+            height=html.escape(str(oembed.get('thumbnail_height') or 300))
+        )
+    return SPOTIFY_PLAYER.render(src=html.escape(spotify_url), art=art)
+
+def render_card(episode, display_index):
+    """Render one episode card"""
+    spotify_url = episode.get('spotify_embed_url') or ''
+    duration = episode.get('length') or episode.get('duration') or 'N/A'
+    title = SEASON_PREFIX.sub('', episode.get('title') or 'Untitled Episode')
+    description = episode.get('description') or 'No description available'
+
+    return EPISODE_CARD.render(
+        episode_url=html.escape(spotify_url),
+        player=render_player(spotify_url, episode.get('oembed')) if spotify_url else SPOTIFY_FALLBACK,
+        episode_number=html.escape(str(episode.get('episode_number') or display_index)),
+        duration=html.escape(str(duration)),
+        title=html.escape(title, quote=False),
+        description=html.escape(truncate_text(description, 120), quote=False),
+        spotify_link=SPOTIFY_LINK.render(href=html.escape(open_url(spotify_url))) if spotify_url else ''
+    )
+
+def render_grids(series_name, episodes):
+    """Card markup for each grid of a series page: {grid id: html}"""
+    ordered = default_order(series_name, episodes)
+    seasons = SEASON_GRIDS.get(series_name)
+
+    if not seasons:
+        cards = [render_card(episode, index + 1) for index, episode in enumerate(ordered[:EPISODES_PER_PAGE])]
+        return {DEFAULT_GRID: ''.join(cards)}
+
+    grids = {grid_id: [] for grid_id in seasons.values()}
+    for index, episode in enumerate(ordered[:TABBED_EPISODES_PER_PAGE]):
+        grid_id = seasons.get(episode_season(episode))
+        if grid_id:
+            grids[grid_id].append(render_card(episode, index + 1))
+    return {grid_id: ''.join(cards) for grid_id, cards in grids.items()}
+
+def replace_block(page_html, grid_id, cards_html):
+    """Put the cards between a grid's markers, adding the markers on first run"""
+    block = f"{PRERENDER_START}{cards_html}\n{PRERENDER_END}"
+    grid_open = re.search(r'<div\b[^>]*\bid="' + re.escape(grid_id) + r'"[^>]*>', page_html)
+    if not grid_open:
+        return page_html, False
+
+    start = page_html.find(PRERENDER_START, grid_open.end())
+    end = page_html.find(PRERENDER_END, grid_open.end())
+    next_div = page_html.find('<div', grid_open.end())
+    if start != -1 and end != -1 and (next_div == -1 or start < next_div):
+        return page_html[:start] + block + page_html[end + len(PRERENDER_END):], True
+
+    return page_html[:grid_open.end()] + '\n' + block + page_html[grid_open.end():], True
+
+class SeriesPrerenderer:
+    """Pre-renders the first page of episode cards into series pages"""
+
+    def __init__(self, root=".", dry_run=False, force=False):
+        self.root = root
+        self.dry_run = dry_run
+        self.force = force
+        self.cache = BuildCache('series_prerender', cache_dir=os.path.join(root, CACHE_DIR))
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def list_series(self):
+        """Series with both a catalog and a page"""
+        pattern = self.path(os.path.join('data', '*_episodes.json'))
+        names = sorted(os.path.basename(path).replace('_episodes.json', '') for path in glob.glob(pattern))
+        return [name for name in names if os.path.exists(self.path(series_page_path(name)))]
+
+    def signature(self, series_name):
+        data_hash = file_hash(self.path(f"data/{series_name}_episodes.json"))
+        return f"{data_hash}:{RENDERER_HASH}"
+
+    def changed_series(self):
+        """Series whose catalog (or the card markup) changed since they were last rendered"""
+        return [name for name in self.list_series() if self.force or not self.cache.is_fresh(name, self.signature(name))]
+
+    def render_series(self, series_name):
+        """Re-render one series page; returns True if the page changed"""
+        with open(self.path(f"data/{series_name}_episodes.json"), 'r', encoding='utf-8-sig') as f:
+            episodes = json.load(f).get('episodes', [])
+
+        page_path = series_page_path(series_name)
+        original, encoding = read_text(self.path(page_path))
+        page_html = original
+
+        for grid_id, cards_html in render_grids(series_name, episodes).items():
+            page_html, found = replace_block(page_html, grid_id, cards_html)
+            if not found:
+                print(f"⚠️  {page_path} has no #{grid_id} grid")
+
+        if page_html == original:
+            return False
+        if self.dry_run:
+            print(f"🔍 DRY RUN: Would pre-render {page_path}")
+            return True
+
+        write_if_changed(self.path(page_path), page_html, encoding)
+        print(f"🧱 Pre-rendered {page_path}")
+        return True
+
+    def update(self, series_names=None):
+        """Re-render the given series (default: those whose data changed)"""
+        print("🧱 Pre-rendering series pages..." + (" (DRY RUN)" if self.dry_run else ""))
+        available = self.list_series()
+        if series_names is None:
+            series_names = self.changed_series()
+        series_names = [name for name in series_names if name in available]
+
+        written = 0
+        failed = 0
+        for series_name in series_names:
+            try:
+                written += self.render_series(series_name)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Failed to pre-render {series_name}: {e}")
+                failed += 1
+                continue
+            if not self.dry_run:
+                self.cache.set(series_name, self.signature(series_name))
+
+        if not self.dry_run:
+            self.cache.prune(available)
+            self.cache.save()
+
+        print(f"✅ Series pages: {written} of {len(series_names)} re-rendered")
+        return not failed
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Pre-render the first page of episode cards into series pages")
+    parser.add_argument('series', nargs='*', help='Series to render (default: those whose data changed)')
+    parser.add_argument('--force', action='store_true', help='Re-render every series page')
+    parser.add_argument('--dry-run', action='store_true', help='Report what would change without writing')
+    return parser.parse_args()
+
+def main():
+    """Pre-render out-of-date series pages"""
+    args = parse_arguments()
+
+    try:
+        success = SeriesPrerenderer(dry_run=args.dry_run, force=args.force).update(args.series or None)
+    except Exception as e:
+        print(f"❌ Series pre-rendering failed: {e}")
+        return 1
+
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Sitemap and Podcast Feed Generator
+Regenerates sitemap.xml and per-series RSS feeds from the episode and blog
+catalogs with a streaming XML writer, rewriting only what actually changed
+"""
+
+import glob
+import json
+import os
+from datetime import date, datetime, timezone
+from email.utils import format_datetime
+from xml.sax.saxutils import XMLGenerator
+from build_cache import CACHE_DIR, BuildCache, file_hash
+
+SITE_URL = "https://real-judaism.com"
+FEEDS_DIR = "feeds"
+
+SERIES_TITLES = {
+    'dating': 'Dating',
+    'shalom-bayis': 'Shalom Bayis',
+    'shmiras-einayim': 'Shmiras Einayim',
+    'shmiras-halashon': 'Shmiras Halashon',
+    'shabbos': 'Shabbos Malkesa',
+    'mesilas-yesharim': 'Mesilas Yesharim',
+    'shalom-bayis-hebrew': 'שלום בית',
+    'shmiras-einayim-hebrew': 'שמירת עיניים'
+}
+
+# Pages without a data source for lastmod: (path, changefreq, priority)
+STATIC_PAGES = [
+    ('', 'weekly', '1.0'),
+    ('about.html', 'monthly', '0.8'),
+    ('blog.html', 'weekly', '0.8'),
+    ('hebrew-home/index.html', 'weekly', '0.8'),
+    ('hebrew-home/blog-hebrew.html', 'weekly', '0.7'),
+    ('hebrew-home/about-hebrew.html', 'monthly', '0.7'),
+    ('privacy-policy.html', 'yearly', '0.3'),
+    ('terms-of-service.html', 'yearly', '0.3'),
+    ('thank-you.html', 'yearly', '0.3')
+]
+
+BLOG_SOURCES = [
+    ('data/blog_posts.json', 'blog/'),
+    ('hebrew-home/data/blog_posts.json', 'hebrew-home/blog/')
+]
+
+def parse_episode_date(date_str):
+    """Parse the episode DD-MM-YY date format"""
+    try:
+        return datetime.strptime(date_str, '%d-%m-%y').date()
+    except (TypeError, ValueError):
+        return None
+
+def parse_blog_date(date_str):
+    """Parse the blog 'September 17, 2025' date format"""
+    try:
+        return datetime.strptime(date_str, '%B %d, %Y').date()
+    except (TypeError, ValueError):
+        return None
+
+def series_page_path(series_name):
+    """Site-relative path of a series page"""
+    if series_name.endswith('-hebrew'):
+        return f"hebrew-home/series/{series_name}.html"
+    return f"series/{series_name}.html"
+
+class XmlStream:
+    """Thin indenting wrapper around XMLGenerator that writes straight to a file"""
+
+    def __init__(self, stream):
+        self.generator = XMLGenerator(stream, encoding='utf-8', short_empty_elements=True)
+        self.depth = 0
+
+    def start_document(self):
+        self.generator.startDocument()
+
+    def end_document(self):
+        self.generator.ignorableWhitespace('\n')
+        self.generator.endDocument()
+
+    def indent(self):
+        # The XML declaration already ends with a newline
+        if self.depth:
+            self.generator.ignorableWhitespace('\n' + '  ' * self.depth)
+
+    def open(self, name, attrs=None):
+        self.indent()
+        self.generator.startElement(name, attrs or {})
+        self.depth += 1
+
+    def close(self, name):
+        self.depth -= 1
+        self.generator.ignorableWhitespace('\n' + '  ' * self.depth)
+        self.generator.endElement(name)
+
+    def element(self, name, text='', attrs=None):
+        self.indent()
+        self.generator.startElement(name, attrs or {})
+        if text:
+            self.generator.characters(text)
+        self.generator.endElement(name)
+
+class SiteFeeds:
+    """Writes sitemap.xml and feeds/<series>.xml"""
+
+    def __init__(self, root=".", dry_run=False, today=None):
+        self.root = root
+        self.dry_run = dry_run
+        self.today = today or date.today()
+        self.cache = BuildCache('site_feeds', cache_dir=os.path.join(root, CACHE_DIR))
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def list_series(self):
+        """Series names that have an episode catalog"""
+        pattern = self.path(os.path.join('data', '*_episodes.json'))
+        return sorted(os.path.basename(path).replace('_episodes.json', '') for path in glob.glob(pattern))
+
+    def load_episodes(self, series_name):
+        with open(self.path(f"data/{series_name}_episodes.json"), 'r', encoding='utf-8-sig') as f:
+            return json.load(f).get('episodes', [])
+
+    def load_blog_posts(self, data_path):
+        try:
+            with open(self.path(data_path), 'r', encoding='utf-8-sig') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return []
+
+    def write_streamed(self, relative_path, write_body):
+        """Stream XML into a temp file and only replace the target if the bytes changed"""
+        target = self.path(relative_path)
+        temp_path = target + '.tmp'
+
+        directory = os.path.dirname(target)
+        if directory and not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            xml = XmlStream(f)
+            xml.start_document()
+            write_body(xml)
+            xml.end_document()
+
+        if os.path.exists(target) and file_hash(target) == file_hash(temp_path):
+            os.remove(temp_path)
+            return False
+
+        if self.dry_run:
+            os.remove(temp_path)
+            print(f"🔍 DRY RUN: Would write {relative_path}")
+            return True
+
+        os.replace(temp_path, target)
+        print(f"📰 Wrote {relative_path}")
+        return True
+
+    def write_series_feed(self, series_name):
+        """Write the RSS feed for one series"""
+        episodes = self.load_episodes(series_name)
+        title = SERIES_TITLES.get(series_name, series_name.replace('-', ' ').title())
+        page_url = f"{SITE_URL}/{series_page_path(series_name)}"
+        feed_url = f"{SITE_URL}/{FEEDS_DIR}/{series_name}.xml"
+        newest = max(filter(None, (parse_episode_date(ep.get('date')) for ep in episodes)), default=None)
+
+        def body(xml):
+            xml.open('rss', {'version': '2.0', 'xmlns:atom': 'http://www.w3.org/2005/Atom'})
+            xml.open('channel')
+            xml.element('title', f"{title} - Real Judaism")
+            xml.element('link', page_url)
+            xml.element('atom:link', attrs={'href': feed_url, 'rel': 'self', 'type': 'application/rss+xml'})
+            xml.element('description', f"{title} podcast episodes from Real Judaism")
+            xml.element('language', 'he' if series_name.endswith('-hebrew') else 'en')
+            if newest:
+                xml.element('lastBuildDate', self.rfc822(newest))
+
+            for episode in episodes:
+                url = episode.get('spotify_embed_url', '')
+                episode_id = url.split('/episode/')[-1] if '/episode/' in url else None
+                xml.open('item')
+                xml.element('title', episode.get('title', ''))
+                if episode_id:
+                    xml.element('link', f"https://open.spotify.com/episode/{episode_id}")
+                    xml.element('guid', episode_id, {'isPermaLink': 'false'})
+                xml.element('description', episode.get('description', ''))
+                published = parse_episode_date(episode.get('date'))
+                if published:
+                    xml.element('pubDate', self.rfc822(published))
+                xml.close('item')
+
+            xml.close('channel')
+            xml.close('rss')
+
+        return self.write_streamed(f"{FEEDS_DIR}/{series_name}.xml", body)
+
+    def rfc822(self, day):
+        return format_datetime(datetime(day.year, day.month, day.day, tzinfo=timezone.utc))
+
+    def write_sitemap(self):
+        """Write sitemap.xml with lastmod taken from episode and blog dates"""
+        series_lastmod = {}
+        for series_name in self.list_series():
+            dates = [parse_episode_date(ep.get('date')) for ep in self.load_episodes(series_name)]
+            series_lastmod[series_name] = max(filter(None, dates), default=None)
+
+        blog_entries = []
+        for data_path, url_prefix in BLOG_SOURCES:
+            for post in self.load_blog_posts(data_path):
+                published = parse_blog_date(post.get('date'))
+                # Scheduled posts are left out until their publication date
+                if post.get('slug') and (published is None or published <= self.today):
+                    blog_entries.append((f"{url_prefix}{post['slug']}.html", published))
+
+        newest_blog = max(filter(None, (published for _, published in blog_entries)), default=None)
+        newest_episode = max(filter(None, series_lastmod.values()), default=None)
+        page_lastmod = {'': newest_episode, 'blog.html': newest_blog, 'hebrew-home/blog-hebrew.html': newest_blog}
+
+        def url(xml, path, lastmod, changefreq, priority):
+            xml.open('url')
+            xml.element('loc', f"{SITE_URL}/{path}")
+            if lastmod:
+                xml.element('lastmod', lastmod.isoformat())
+            xml.element('changefreq', changefreq)
+            xml.element('priority', priority)
+            xml.close('url')
+
+        def body(xml):
+            xml.open('urlset', {'xmlns': 'http://www.sitemaps.org/schemas/sitemap/0.9'})
+            for path, changefreq, priority in STATIC_PAGES:
+                url(xml, path, page_lastmod.get(path), changefreq, priority)
+            for series_name, lastmod in series_lastmod.items():
+                if os.path.exists(self.path(series_page_path(series_name))):
+                    url(xml, series_page_path(series_name), lastmod, 'weekly', '0.8')
+            for path, published in blog_entries:
+                if os.path.exists(self.path(path)):
+                    url(xml, path, published, 'monthly', '0.7')
+            xml.close('urlset')
+
+        return self.write_streamed('sitemap.xml', body)
+
+    def changed_series(self):
+        """Series whose catalog hash differs from the last generated feed"""
+        changed = []
+        for series_name in self.list_series():
+            source_hash = file_hash(self.path(f"data/{series_name}_episodes.json"))
+            feed_exists = os.path.exists(self.path(f"{FEEDS_DIR}/{series_name}.xml"))
+            if not feed_exists or not self.cache.is_fresh(series_name, source_hash):
+                changed.append(series_name)
+        return changed
+
+    def update(self, series_names=None):
+        """Regenerate feeds for the given (or changed) series, then the sitemap"""
+        print("📰 Updating sitemap and feeds..." + (" (DRY RUN)" if self.dry_run else ""))
+        if series_names is None:
+            series_names = self.changed_series()
+
+        written = 0
+        failed = 0
+        for series_name in series_names:
+            try:
+                written += self.write_series_feed(series_name)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"⚠️  Failed to write feed for {series_name}: {e}")
+                failed += 1
+                continue
+            if not self.dry_run:
+                self.cache.set(series_name, file_hash(self.path(f"data/{series_name}_episodes.json")))
+
+        sitemap_written = self.write_sitemap()
+        if not self.dry_run:
+            self.cache.prune(self.list_series())
+            self.cache.save()
+
+        print(f"✅ Feeds: {written} of {len(series_names)} regenerated, sitemap {'updated' if sitemap_written else 'unchanged'}")
+        return not failed
+
+def main():
+    """Regenerate sitemap.xml and any out-of-date series feeds"""
+    try:
+        success = SiteFeeds().update()
+    except Exception as e:
+        print(f"❌ Sitemap/feed generation failed: {e}")
+        return 1
+
+    return 0 if success else 1
+
+if __name__ == "__main__":
+    exit(main())
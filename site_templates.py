@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Site Template Engine
+Precompiles HTML templates into static chunks and {{ slot }} placeholders once,
+then renders pages by joining chunks with slot values
+"""
+
+import os
+import re
+import threading
+from build_cache import hash_bytes
+
+SLOT_PATTERN = re.compile(r'\{\{\s*([A-Za-z_][A-Za-z0-9_]*)\s*\}\}')
+
+class TemplateError(Exception):
+    """Raised when a template is rendered without a value for one of its slots"""
+
+class Template:
+    """A template compiled into alternating static chunks and named slots"""
+
+    def __init__(self, source, name="<string>"):
+        self.name = name
+        self.source = source
+        self.hash = hash_bytes(source.encode('utf-8'))
+        self.static_chunks, self.slots = self.compile(source)
+
+    @staticmethod
+    def compile(source):
+        """Split the source into static chunks and the slot names between them"""
+        static_chunks = []
+        slots = []
+        position = 0
+
+        for match in SLOT_PATTERN.finditer(source):
+            static_chunks.append(source[position:match.start()])
+            slots.append(match.group(1))
+            position = match.end()
+
+        static_chunks.append(source[position:])
+        return static_chunks, slots
+
+    @property
+    def slot_names(self):
+        """The distinct slot names used by the template"""
+        return set(self.slots)
+
+    def render(self, context=None, **values):
+        """Render by joining static chunks with slot values; values are inserted verbatim"""
+        if context:
+            values = {**context, **values}
+
+        parts = [self.static_chunks[0]]
+        for slot, static in zip(self.slots, self.static_chunks[1:]):
+            try:
+                value = values[slot]
+            except KeyError:
+                raise TemplateError(f"Template {self.name} has no value for slot '{slot}'")
+            parts.append(value if isinstance(value, str) else str(value))
+            parts.append(static)
+
+        return ''.join(parts)
+
+_template_cache = {}
+_template_lock = threading.Lock()
+
+def load_template(path):
+    """Load and compile a template file, reusing the compiled form while the file is unchanged"""
+    mtime = os.path.getmtime(path)
+
+    with _template_lock:
+        cached = _template_cache.get(path)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+    with open(path, 'r', encoding='utf-8') as f:
+        template = Template(f.read(), name=path)
+
+    with _template_lock:
+        _template_cache[path] = (mtime, template)
+    return template
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+"""
+Site Validator
+Checks the episode and blog data against the schema the pipeline writes and
+every internal link in the pages. Files are checked on a worker pool and each
+file's findings are cached by content hash, so unchanged files are not re-read.
+Exits non-zero on errors, for CI gating.
+"""
+
+import argparse
+import json
+import os
+import posixpath
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from urllib.parse import unquote, urlsplit
+from build_cache import BuildCache, FileHashIndex, hash_bytes
+from css_purge import PAGE_PATTERNS, SCRIPT_BLOCK_PATTERN, expand, read_text
+from preview_server import SiteRules, expand_target
+
+EPISODE_PATTERNS = ['data/*_episodes.json']
+BLOG_PATTERNS = ['data/blog_posts.json', 'hebrew-home/data/blog_posts.json']
+
+# Fields EpisodeFormatter.format_episode writes, and their types
+EPISODE_FIELDS = {
+    'title': str,
+    'description': str,
+    'date': str,
+    'length': str,
+    'spotify_embed_url': str,
+    'series': str,
+    'episode_number': int,
+    'file_path': str
+}
+BLOG_FIELDS = ('week_number', 'title', 'excerpt', 'read_time', 'date', 'slug', 'full_content')
+
+EMBED_URL_PATTERN = re.compile(r'^https://open\.spotify\.com/embed/episode/([0-9A-Za-z]{22})$')
+SLUG_PATTERN = re.compile(r'^[a-z0-9]+(?:-[a-z0-9]+)*$')
+LINK_ATTR_PATTERN = re.compile(r'\s(href|src|data-src|srcset|poster)\s*=\s*"([^"]*)"', re.IGNORECASE)
+EXTERNAL_PREFIXES = ('http:', 'https:', '//', 'mailto:', 'tel:', 'javascript:', 'data:', '#')
+
+# Bump when the checks change so cached results are not reused
+RULES_HASH = hash_bytes(json.dumps({
+    'version': 1,
+    'episode_fields': sorted(EPISODE_FIELDS),
+    'blog_fields': BLOG_FIELDS
+}).encode('utf-8'))
+
+SKIP_DIRS = {'.git', '.build-cache', 'node_modules', '__pycache__'}
+
+def issue(level, path, message, line=None):
+    return {'level': level, 'path': path, 'line': line, 'message': message}
+
+def number_ranges(numbers):
+    """[3, 4, 5, 9] → '3-5, 9'"""
+    ranges = []
+    for number in sorted(numbers):
+        if ranges and number == ranges[-1][1] + 1:
+            ranges[-1][1] = number
+        else:
+            ranges.append([number, number])
+    return ', '.join(str(start) if start == end else f"{start}-{end}" for start, end in ranges)
+
+def check_episodes(path, data):
+    """Schema, unique keys and contiguous numbering of one episode catalog"""
+    issues = []
+    if not isinstance(data, dict) or not isinstance(data.get('episodes'), list):
+        return [issue('error', path, "expected an object with an 'episodes' list")]
+
+    keys = {}
+    numbers = {}
+    for position, episode in enumerate(data['episodes']):
+        where = f"episodes[{position}]"
+        if not isinstance(episode, dict):
+            issues.append(issue('error', path, f"{where}: expected an object"))
+            continue
+
+        match = EMBED_URL_PATTERN.match(episode.get('spotify_embed_url') or '')
+        if match:
+            where += f" ({match.group(1)})"
+
+        for field, field_type in EPISODE_FIELDS.items():
+            value = episode.get(field)
+            if field not in episode:
+                issues.append(issue('error', path, f"{where}: missing '{field}'"))
+            elif field == 'episode_number' and value is None:
+                # Trailers and bonus episodes are kept unnumbered
+                issues.append(issue('warning', path, f"{where}: no episode_number"))
+            elif not isinstance(value, field_type) or isinstance(value, bool):
+                issues.append(issue('error', path, f"{where}: '{field}' should be {field_type.__name__}, "
+                                                   f"got {type(value).__name__}"))
+
+        if isinstance(episode.get('date'), str):
+            try:
+                datetime.strptime(episode['date'], '%d-%m-%y')
+            except ValueError:
+                issues.append(issue('error', path, f"{where}: date '{episode['date']}' is not DD-MM-YY"))
+        if isinstance(episode.get('spotify_embed_url'), str) and not match:
+            issues.append(issue('error', path, f"{where}: malformed spotify_embed_url '{episode['spotify_embed_url']}'"))
+
+        if match:
+            if match.group(1) in keys:
+                issues.append(issue('error', path, f"{where}: duplicate episode key (also episodes[{keys[match.group(1)]}])"))
+            keys.setdefault(match.group(1), position)
+        number = episode.get('episode_number')
+        if isinstance(number, int) and not isinstance(number, bool):
+            numbers.setdefault(number, []).append(position)
+
+    duplicated = sorted(number for number, positions in numbers.items() if len(positions) > 1)
+    if duplicated:
+        issues.append(issue('warning', path, f"episode numbers used more than once: {number_ranges(duplicated)}"))
+    if numbers:
+        missing = set(range(1, max(numbers) + 1)) - set(numbers)
+        if missing:
+            issues.append(issue('warning', path, f"episode numbers missing: {number_ranges(missing)}"))
+    return issues
+
+def check_blog_posts(path, data):
+    """Schema and unique slugs of one locale's blog posts"""
+    if not isinstance(data, list):
+        return [issue('error', path, "expected a list of posts")]
+
+    issues = []
+    slugs = {}
+    for position, post in enumerate(data):
+        where = f"posts[{position}]"
+        if not isinstance(post, dict):
+            issues.append(issue('error', path, f"{where}: expected an object"))
+            continue
+        if isinstance(post.get('slug'), str):
+            where += f" ({post['slug']})"
+
+        for field in BLOG_FIELDS:
+            if not isinstance(post.get(field), str) or not post[field].strip():
+                issues.append(issue('error', path, f"{where}: missing or empty '{field}'"))
+
+        slug = post.get('slug')
+        if isinstance(slug, str):
+            if not SLUG_PATTERN.match(slug):
+                issues.append(issue('error', path, f"{where}: slug is not lowercase-hyphenated"))
+            if slug in slugs:
+                issues.append(issue('error', path, f"{where}: duplicate slug (also posts[{slugs[slug]}])"))
+            slugs.setdefault(slug, position)
+    return issues
+
+def page_links(text):
+    """[(line, url)] for every local link in a page, ignoring inline scripts"""
+    # Blank out scripts but keep their newlines so line numbers stay right
+    text = SCRIPT_BLOCK_PATTERN.sub(lambda m: '\n' * m.group(0).count('\n'), text)
+
+    links = []
+    for match in LINK_ATTR_PATTERN.finditer(text):
+        line = text.count('\n', 0, match.start()) + 1
+        values = match.group(2).split(',') if match.group(1).lower() == 'srcset' else [match.group(2)]
+        for value in values:
+            url = value.strip().split(' ')[0]
+            if not url or url.lower().startswith(EXTERNAL_PREFIXES) or '{{' in url or '${' in url:
+                continue
+            links.append((line, url))
+    return links
+
+def file_for(absolute, files):
+    """Site file served for a root-relative path (exact, directory index or pretty .html URL)"""
+    relative = absolute.lstrip('/')
+    candidates = [relative + 'index.html'] if absolute.endswith('/') else [
+        relative, relative + '/index.html', relative + '.html'
+    ]
+    return next((candidate for candidate in candidates if candidate in files), None)
+
+class SiteValidator:
+    """Validates data files and page links, reusing cached results for unchanged files"""
+
+    def __init__(self, root=".", force=False, max_workers=None, check_data=True, check_links=True):
+        self.root = root
+        self.force = force
+        self.max_workers = max_workers
+        self.check_data = check_data
+        self.check_links = check_links
+        cache_dir = os.path.join(root, '.build-cache')
+        self.cache = BuildCache('site_validator', cache_dir=cache_dir)
+        self.hashes = FileHashIndex(cache_dir=cache_dir)
+
+    def path(self, relative_path):
+        return os.path.join(self.root, relative_path)
+
+    def check_file(self, job):
+        """(path, cache entry, was cached) for one file"""
+        relative_path, kind = job
+        signature = f"{self.hashes.hash(self.path(relative_path))}:{RULES_HASH}"
+        entry = self.cache.get(relative_path)
+        if not self.force and entry and entry.get('signature') == signature:
+            return relative_path, entry, True
+
+        entry = {'signature': signature, 'issues': [], 'links': []}
+        if kind == 'page':
+            text, _ = read_text(self.path(relative_path))
+            entry['links'] = page_links(text)
+        else:
+            try:
+                with open(self.path(relative_path), 'r', encoding='utf-8-sig') as f:
+                    data = json.load(f)
+            except (ValueError, UnicodeDecodeError) as e:
+                entry['issues'] = [issue('error', relative_path, f"does not parse: {e}")]
+            else:
+                checker = check_episodes if kind == 'episodes' else check_blog_posts
+                entry['issues'] = checker(relative_path, data)
+
+        self.cache.set(relative_path, entry)
+        return relative_path, entry, False
+
+    def site_files(self):
+        """Every file of the site as a root-relative posix path"""
+        files = set()
+        for directory, dirs, names in os.walk(self.root):
+            dirs[:] = [name for name in dirs if name not in SKIP_DIRS]
+            relative_dir = os.path.relpath(directory, self.root).replace(os.sep, '/')
+            for name in names:
+                files.add(name if relative_dir == '.' else f"{relative_dir}/{name}")
+        return files
+
+    def resolves(self, page, url, files, redirects):
+        """Whether a page-relative or root-relative URL reaches a file, directly or through a redirect"""
+        url_path = unquote(urlsplit(url).path)
+        if not url_path:
+            return True
+        if url_path.startswith('/'):
+            absolute = posixpath.normpath(url_path)
+        else:
+            absolute = posixpath.normpath(posixpath.join('/' + posixpath.dirname(page), url_path))
+        if url_path.endswith('/') and absolute != '/':
+            absolute += '/'
+        if absolute.startswith('/..'):
+            return False
+        if file_for(absolute, files):
+            return True
+
+        # Like Netlify, the first matching rule decides; the /* → 404.html fallback does not count
+        for rule in redirects:
+            match = rule['pattern'].match(absolute)
+            if match:
+                target = expand_target(rule['to'], match)
+                if rule['status'] >= 400:
+                    return False
+                return target.startswith(EXTERNAL_PREFIXES) or file_for(urlsplit(target).path or '/', files)
+        return False
+
+    def run(self):
+        """Validate the site; returns the list of issues"""
+        jobs = []
+        if self.check_data:
+            jobs += [(path, 'episodes') for path in expand(EPISODE_PATTERNS, self.root)]
+            jobs += [(path, 'blog') for path in expand(BLOG_PATTERNS, self.root)]
+        if self.check_links:
+            # Templates' links are relative to the pages generated from them, not to the template
+            jobs += [(path, 'page') for path in expand(PAGE_PATTERNS, self.root) if 'template' not in posixpath.basename(path)]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            results = list(pool.map(self.check_file, jobs))
+        cached = sum(1 for _, _, was_cached in results if was_cached)
+        print(f"🔍 Validated {len(results)} files ({cached} unchanged, from cache)")
+
+        rules = SiteRules(self.root)
+        rules.refresh()
+        files = self.site_files()
+
+        issues = []
+        for relative_path, entry, _ in results:
+            issues.extend(entry['issues'])
+            for line, url in entry['links']:
+                if not self.resolves(relative_path, url, files, rules.redirects):
+                    issues.append(issue('error', relative_path, f'broken link "{url}"', line))
+
+        if self.check_data and self.check_links:
+            self.cache.prune(path for path, _ in jobs)
+        self.cache.save()
+        self.hashes.save()
+        return issues
+
+def print_report(issues):
+    for found in sorted(issues, key=lambda found: (found['level'] != 'error', found['path'], found['line'] or 0)):
+        location = f"{found['path']}:{found['line']}" if found['line'] else found['path']
+        print(f"{'❌' if found['level'] == 'error' else '⚠️ '} {location}: {found['message']}")
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Validate the site's data files and internal links")
+    parser.add_argument('--strict', action='store_true', help='Fail on warnings (e.g. gaps in episode numbering) too')
+    parser.add_argument('--force', action='store_true', help='Re-check every file, ignoring the cache')
+    parser.add_argument('--only', choices=['data', 'links'], help='Run just the data checks or just the link checks')
+    parser.add_argument('--workers', type=int, help='Worker threads (default: Python\'s choice)')
+    return parser.parse_args()
+
+def main():
+    """Validate the site and exit non-zero if it has problems"""
+    args = parse_arguments()
+
+    try:
+        issues = SiteValidator(force=args.force, max_workers=args.workers,
+                               check_data=args.only != 'links', check_links=args.only != 'data').run()
+    except OSError as e:
+        print(f"❌ Validation could not run: {e}")
+        return 2
+
+    print_report(issues)
+    errors = sum(1 for found in issues if found['level'] == 'error')
+    warnings = len(issues) - errors
+
+    if errors or (args.strict and warnings):
+        print(f"❌ Validation failed: {errors} error(s), {warnings} warning(s)")
+        return 1
+    print(f"✅ Site is valid ({warnings} warning(s))")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
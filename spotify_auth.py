@@ -8,18 +8,44 @@ import json
 import base64
 import requests
 import os
+import re
+import threading
 from datetime import datetime, timedelta
 import time
+from run_metrics import metrics
+
+# Spotify IDs are 22 base-62 characters; folding them keeps metric labels bounded
+SPOTIFY_ID_PATTERN = re.compile(r'/[0-9A-Za-z]{22}(?=/|$)')
+
+class RateBudget:
+    """Spaces out requests so every caller sharing the budget stays under one request rate"""
+
+    def __init__(self, requests_per_second):
+        self.interval = 1.0 / requests_per_second
+        self.lock = threading.Lock()
+        self.next_slot = 0.0
+
+    def wait(self):
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
 
 class SpotifyAuth:
     """Handles Spotify API authentication and token management"""
 
-    def __init__(self, client_id, client_secret):
+    def __init__(self, client_id, client_secret, session=None, rate_budget=None):
         self.client_id = client_id
         self.client_secret = client_secret
         self.access_token = None
         self.token_expires = None
         self.base_url = "https://api.spotify.com/v1"
+        # A requests.Session pools connections across calls (and callers); plain requests otherwise
+        self.http = session or requests
+        self.rate_budget = rate_budget
+        self.token_lock = threading.Lock()
 
     def _get_auth_header(self):
         """Generate base64 encoded authorization header"""
@@ -47,8 +73,9 @@ class SpotifyAuth:
         data = {'grant_type': 'client_credentials'}
 
         try:
-            response = requests.post(auth_url, headers=headers, data=data)
-            response.raise_for_status()
+            with metrics.timed('spotify_token_request', help="Spotify access token request latency"):
+                response = self.http.post(auth_url, headers=headers, data=data)
+                response.raise_for_status()
 
             token_data = response.json()
             self.access_token = token_data['access_token']
@@ -66,8 +93,9 @@ class SpotifyAuth:
 
     def make_request(self, endpoint, params=None):
         """Make authenticated request to Spotify API"""
-        if not self._is_token_valid():
-            self.get_access_token()
+        with self.token_lock:
+            if not self._is_token_valid():
+                self.get_access_token()
 
         url = f"{self.base_url}{endpoint}"
         headers = {
@@ -75,15 +103,33 @@ class SpotifyAuth:
             'Content-Type': 'application/json'
         }
 
+        endpoint_label = SPOTIFY_ID_PATTERN.sub('/{id}', endpoint)
+        start = time.perf_counter()
+        status = 'error'
+        if self.rate_budget:
+            self.rate_budget.wait()
+
         try:
-            response = requests.get(url, headers=headers, params=params)
+            response = self.http.get(url, headers=headers, params=params)
+            status = str(response.status_code)
+            if response.status_code == 429:
+                metrics.inc('spotify_throttled_total', help="Spotify requests rejected with 429 Too Many Requests",
+                            endpoint=endpoint_label)
             response.raise_for_status()
             return response.json()
 
         except requests.exceptions.RequestException as e:
+            metrics.inc('spotify_request_errors_total', help="Spotify requests that failed",
+                        endpoint=endpoint_label, status=status)
             print(f"❌ Spotify API request failed: {e}")
             raise Exception(f"API request failed: {e}")
 
+        finally:
+            metrics.inc('spotify_requests_total', help="Spotify API requests by response status",
+                        endpoint=endpoint_label, status=status)
+            metrics.observe('spotify_request_duration_seconds', time.perf_counter() - start,
+                            help="Spotify API request latency", endpoint=endpoint_label)
+
 def load_config(config_file="episode_detector_config.json"):
     """Load configuration from JSON file with environment variable override for secrets"""
     try:
@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Spotify oEmbed Prefetcher
+Batch-fetches oEmbed metadata (title, artwork, player size) for episodes and
+stores it on the episode records, so series pages can show a light static
+facade and only load the Spotify iframe when a visitor presses play
+"""
+
+import argparse
+import json
+import os
+import re
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+import requests
+from build_cache import CACHE_DIR, BuildCache, hash_bytes
+
+OEMBED_ENDPOINT = "https://open.spotify.com/oembed"
+OEMBED_FIELDS = ('title', 'thumbnail_url', 'thumbnail_width', 'thumbnail_height', 'width', 'height')
+EPISODE_ID_PATTERN = re.compile(r'/episode/([A-Za-z0-9]+)')
+
+def episode_id(embed_url):
+    """Spotify episode id from an embed or open URL"""
+    match = EPISODE_ID_PATTERN.search(embed_url or '')
+    return match.group(1) if match else None
+
+def episode_page_url(spotify_id):
+    return f"https://open.spotify.com/episode/{spotify_id}"
+
+class OEmbedPrefetcher:
+    """Fetches oEmbed metadata in parallel, at most once per episode"""
+
+    def __init__(self, endpoint=None, max_workers=4, timeout=10, cache_dir=CACHE_DIR):
+        self.endpoint = endpoint or os.getenv('SPOTIFY_OEMBED_URL') or OEMBED_ENDPOINT
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # Responses from other endpoints (e.g. the stand-in) never mix with real ones
+        cache_name = 'spotify_oembed' if self.endpoint == OEMBED_ENDPOINT else f"spotify_oembed-{hash_bytes(self.endpoint.encode('utf-8'))}"
+        self.cache = BuildCache(cache_name, cache_dir=cache_dir)
+        self.session = requests.Session()
+        self.fetched = 0
+        self.failed = 0
+
+    def fetch(self, spotify_id):
+        """Fetch one episode's oEmbed data; returns the stored subset or None"""
+        try:
+            response = self.session.get(self.endpoint, params={'url': episode_page_url(spotify_id)}, timeout=self.timeout)
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.RequestException, ValueError) as e:
+            print(f"⚠️  oEmbed lookup failed for {spotify_id}: {e}")
+            return None
+        return {field: data[field] for field in OEMBED_FIELDS if data.get(field) is not None}
+
+    def prefetch(self, spotify_ids):
+        """Metadata for each id, fetching only ids never fetched before"""
+        spotify_ids = list(dict.fromkeys(spotify_ids))
+        missing = [spotify_id for spotify_id in spotify_ids if self.cache.get(spotify_id) is None]
+
+        if missing:
+            print(f"🖼️  Fetching oEmbed data for {len(missing)} episode(s) "
+                  f"({len(spotify_ids) - len(missing)} cached)...")
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                for spotify_id, metadata in zip(missing, pool.map(self.fetch, missing)):
+                    # Failures are not cached so the next run retries them
+                    if metadata:
+                        self.cache.set(spotify_id, metadata)
+                        self.fetched += 1
+                    else:
+                        self.failed += 1
+
+        return {spotify_id: self.cache.get(spotify_id) for spotify_id in spotify_ids if self.cache.get(spotify_id)}
+
+    def enrich(self, episodes):
+        """Attach an 'oembed' entry to episodes that lack one; returns how many were filled in"""
+        pending = [(episode, episode_id(episode.get('spotify_embed_url'))) for episode in episodes
+                   if not episode.get('oembed')]
+        pending = [(episode, spotify_id) for episode, spotify_id in pending if spotify_id]
+        if not pending:
+            return 0
+
+        metadata = self.prefetch(spotify_id for _, spotify_id in pending)
+        filled = 0
+        for episode, spotify_id in pending:
+            if spotify_id in metadata:
+                episode['oembed'] = metadata[spotify_id]
+                filled += 1
+        return filled
+
+    def save(self):
+        return self.cache.save()
+
+class OEmbedStandInHandler(BaseHTTPRequestHandler):
+    """Answers /oembed?url=... with deterministic fake metadata"""
+
+    def do_GET(self):
+        request = urlparse(self.path)
+        spotify_id = episode_id(parse_qs(request.query).get('url', [''])[0])
+
+        if request.path != '/oembed' or not spotify_id:
+            self.send_error(404)
+            return
+
+        body = json.dumps({
+            'type': 'rich',
+            'version': '1.0',
+            'provider_name': 'Spotify',
+            'title': f"Stand-in episode {spotify_id}",
+            'thumbnail_url': f"https://i.scdn.co/image/stand-in-{spotify_id}",
+            'thumbnail_width': 300,
+            'thumbnail_height': 300,
+            'width': 456,
+            'height': 152,
+            'html': ''
+        }).encode('utf-8')
+
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+class OEmbedStandIn:
+    """Local stand-in for the Spotify oEmbed endpoint, for tests and offline runs"""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.server = ThreadingHTTPServer((host, port), OEmbedStandInHandler)
+        self.thread = None
+
+    @property
+    def endpoint(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}/oembed"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self.endpoint
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+def backfill(series_names, prefetcher, updater):
+    """Add oEmbed data to existing catalogs; returns the number of episodes filled in"""
+    total = 0
+    for series_name in series_names:
+        file_path = f"data/{series_name}_episodes.json"
+        episodes, data = updater.load_existing_data(file_path)
+        filled = prefetcher.enrich(episodes)
+        if filled:
+            if not updater.dry_run:
+                updater.create_backup(file_path)
+            updater.save_file(file_path, data)
+        print(f"   {series_name}: {filled} episode(s) enriched")
+        total += filled
+    return total
+
+def parse_arguments():
+    """Parse command line arguments"""
+    parser = argparse.ArgumentParser(description="Prefetch Spotify oEmbed data into the episode catalogs")
+    parser.add_argument('series', nargs='*', help='Series to backfill (default: every catalog)')
+    parser.add_argument('--dry-run', action='store_true', help='Fetch but do not write the catalogs')
+    parser.add_argument('--stand-in', action='store_true',
+                        help='Use a local stand-in endpoint (implies --dry-run, uses a throwaway cache)')
+    parser.add_argument('--serve', type=int, metavar='PORT',
+                        help='Only run the stand-in endpoint on PORT (for SPOTIFY_OEMBED_URL)')
+    return parser.parse_args()
+
+def main():
+    """Backfill oEmbed data for episodes that have none"""
+    from file_updater import FileUpdater
+    from site_feeds import SiteFeeds
+
+    args = parse_arguments()
+
+    if args.serve is not None:
+        stand_in = OEmbedStandIn(port=args.serve)
+        print(f"🧪 oEmbed stand-in listening on {stand_in.endpoint} (Ctrl+C to stop)")
+        try:
+            stand_in.server.serve_forever()
+        except KeyboardInterrupt:
+            stand_in.server.server_close()
+        return 0
+
+    series_names = args.series or SiteFeeds().list_series()
+    dry_run = args.dry_run or args.stand_in
+    updater = FileUpdater(dry_run=dry_run)
+
+    try:
+        if args.stand_in:
+            with OEmbedStandIn() as stand_in, tempfile.TemporaryDirectory() as cache_dir:
+                prefetcher = OEmbedPrefetcher(endpoint=stand_in.endpoint, cache_dir=cache_dir)
+                total = backfill(series_names, prefetcher, updater)
+        else:
+            prefetcher = OEmbedPrefetcher()
+            total = backfill(series_names, prefetcher, updater)
+            prefetcher.save()
+    except Exception as e:
+        print(f"❌ oEmbed backfill failed: {e}")
+        return 1
+
+    print(f"✅ oEmbed: {total} episode(s) enriched, {prefetcher.fetched} fetched, {prefetcher.failed} failed")
+    return 0 if prefetcher.failed == 0 else 1
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,9 +1,10 @@
 @echo off
-echo Starting local development server...
+echo Starting local preview server...
 echo.
 echo Your website will be available at: http://localhost:8000
+echo Headers, redirects and compression match Netlify; edits to data, blog posts
+echo and templates rebuild the affected pages automatically.
 echo.
 echo Press Ctrl+C to stop the server
 echo.
-python -m http.server 8000
-
+python preview_server.py --port 8000
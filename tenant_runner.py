@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Multi-Config Runs
+Updates several podcast sites (one episode_detector_config.json each) in one
+process. The sites share a pooled HTTP session, the access token and a request
+rate budget; their shows are fetched together, then each site is updated in
+its own root with a per-site report.
+"""
+
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+import requests
+from requests.adapters import HTTPAdapter
+from episode_detector import EpisodeDetector
+from run_metrics import metrics
+from spotify_auth import RateBudget, SpotifyAuth, load_config
+
+DEFAULT_WORKERS = 4
+
+@contextmanager
+def working_directory(path):
+    """Run a block inside a site root; every data path in the pipeline is relative to it"""
+    previous = os.getcwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(previous)
+
+def load_tenants(config_paths):
+    """[{name, config_path, root, config}] for each config file"""
+    tenants = []
+    for config_path in config_paths:
+        config = load_config(config_path)
+        settings = config['settings']
+        # site_root is relative to the config file; the default is the config's own directory
+        config_dir = os.path.dirname(os.path.abspath(config_path))
+        root = os.path.normpath(os.path.join(config_dir, settings.get('site_root') or '.'))
+        name = settings.get('tenant_name') or os.path.basename(root)
+
+        if any(tenant['name'] == name for tenant in tenants):
+            raise Exception(f"Two configs share the tenant name '{name}'; set settings.tenant_name")
+        if not os.path.isdir(root):
+            raise Exception(f"Site root '{root}' for {config_path} does not exist")
+
+        tenants.append({'name': name, 'config_path': config_path, 'root': root, 'config': config})
+    return tenants
+
+class TenantRunner:
+    """Fetches every tenant's shows through shared clients, then updates each site"""
+
+    def __init__(self, tenants, workers=DEFAULT_WORKERS, requests_per_second=None):
+        self.tenants = tenants
+        self.workers = workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=workers, pool_maxsize=workers)
+        self.session.mount('https://', adapter)
+        self.rate_budget = RateBudget(requests_per_second) if requests_per_second else None
+        self.clients = {}
+
+    def client_for(self, config):
+        """One SpotifyAuth (and so one token) per distinct set of credentials"""
+        credentials = (config['spotify']['client_id'], config['spotify']['client_secret'])
+        if credentials not in self.clients:
+            self.clients[credentials] = SpotifyAuth(*credentials, session=self.session, rate_budget=self.rate_budget)
+        return self.clients[credentials]
+
+    def fetch_all(self, detectors):
+        """{tenant: {series: episodes}} with every show of every tenant fetched concurrently"""
+        jobs = [(tenant['name'], series_name, show_id)
+                for tenant in self.tenants
+                for series_name, show_id in tenant['config']['shows'].items()]
+        print(f"📡 Fetching {len(jobs)} shows for {len(self.tenants)} sites ({self.workers} workers)...")
+
+        def fetch(job):
+            name, series_name, show_id = job
+            start = time.perf_counter()
+            with metrics.labelled(tenant=name):
+                episodes = detectors[name].fetch_show_episodes(show_id)
+            return name, series_name, episodes, time.perf_counter() - start
+
+        fetched = {tenant['name']: {} for tenant in self.tenants}
+        fetch_seconds = {tenant['name']: 0.0 for tenant in self.tenants}
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            for name, series_name, episodes, seconds in pool.map(fetch, jobs):
+                fetched[name][series_name] = episodes
+                fetch_seconds[name] += seconds
+        return fetched, fetch_seconds
+
+    def run(self, update_func):
+        """Run update_func(config, detector, fetched) in each site root; returns the per-tenant reports"""
+        detectors = {}
+        for tenant in self.tenants:
+            # Detectors open their catalog database (if any) relative to the site root
+            with working_directory(tenant['root']):
+                detectors[tenant['name']] = EpisodeDetector(tenant['config'], auth=self.client_for(tenant['config']))
+
+        fetched, fetch_seconds = self.fetch_all(detectors)
+
+        reports = []
+        for tenant in self.tenants:
+            name = tenant['name']
+            print(f"\n🏠 Updating {name} ({tenant['root']})")
+            print("=" * 50)
+
+            new_before = metrics.total('episodes_new_total')
+            start = time.perf_counter()
+            try:
+                with working_directory(tenant['root']), metrics.labelled(tenant=name), \
+                        metrics.timed('tenant_update', help="Time to update one site"):
+                    success = update_func(tenant['config'], detectors[name], fetched[name])
+            except Exception as e:
+                print(f"❌ Update of {name} failed: {e}")
+                success = False
+            metrics.set('tenant_success', 1 if success else 0, help="1 if the site's last update succeeded", tenant=name)
+
+            reports.append({
+                'tenant': name,
+                'success': success,
+                'shows': len(tenant['config']['shows']),
+                'new_episodes': metrics.total('episodes_new_total') - new_before,
+                'fetch_seconds': round(fetch_seconds[name], 2),
+                'update_seconds': round(time.perf_counter() - start, 2)
+            })
+
+        self.session.close()
+        self.print_report(reports)
+        return reports
+
+    def print_report(self, reports):
+        print("\n📊 Site Summary:")
+        for report in reports:
+            print(f"   {'✅' if report['success'] else '❌'} {report['tenant']}: "
+                  f"{report['new_episodes']} new episode(s) across {report['shows']} shows "
+                  f"(fetch {report['fetch_seconds']}s, update {report['update_seconds']}s)")
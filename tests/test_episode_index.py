@@ -0,0 +1,48 @@
+"""
+Tests for the episode ID index staleness check
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from build_cache import file_hash
+from episode_index import EpisodeIndex
+
+OLD_ID = "548VVqsw1GzzAGKjmKYi0y"
+NEW_ID = "548Vqsw1GzzAGKjmKYi0yc"
+
+def key(episode):
+    return episode['spotify_embed_url'].split('/episode/')[-1]
+
+class EpisodeIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.data_dir = tempfile.TemporaryDirectory()
+        self.data_path = os.path.join(self.data_dir.name, 'dating_episodes.json')
+        self.write_catalog(OLD_ID)
+        episodes = [{'episode_number': 1, 'spotify_embed_url': f"https://open.spotify.com/embed/episode/{OLD_ID}"}]
+        EpisodeIndex.from_episodes(episodes, key, source_hash=file_hash(self.data_path)).write(self.data_path)
+
+    def tearDown(self):
+        self.data_dir.cleanup()
+
+    def write_catalog(self, episode_id):
+        with open(self.data_path, 'w', encoding='utf-8') as f:
+            json.dump({'episodes': [{'episode_number': 1,
+                                     'spotify_embed_url': f"https://open.spotify.com/embed/episode/{episode_id}"}]}, f)
+
+    def test_current_index_loads(self):
+        index = EpisodeIndex.load(self.data_path)
+        self.assertIn(OLD_ID, index)
+        self.assertEqual(index.max_episode_number, 1)
+
+    def test_same_size_hand_edit_is_stale(self):
+        size = os.path.getsize(self.data_path)
+        self.write_catalog(NEW_ID)
+        self.assertEqual(os.path.getsize(self.data_path), size)
+        self.assertIsNone(EpisodeIndex.load(self.data_path))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,89 @@
+"""
+Tests for the --check exit codes of the episode update script
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+import requests
+import episode_update
+
+SHOW_ID = "2GLIzh7FPz3opaDuHqT8bz"
+KNOWN_ID = "4rOoJ6Egrf8K2IrywzwOMk"
+NEW_ID = "7ooBHjyEEvSdrdXe6zsKpm"
+
+def response(status, payload=None):
+    """A requests.Response as the Spotify API would return it"""
+    result = requests.Response()
+    result.status_code = status
+    result.url = f"https://api.spotify.com/v1/shows/{SHOW_ID}/episodes"
+    result._content = json.dumps(payload or {}).encode('utf-8')
+    return result
+
+def episode(episode_id):
+    return {'id': episode_id, 'name': 'Episode', 'description': '', 'release_date': '2026-10-01'}
+
+class CheckExitCodeTest(unittest.TestCase):
+
+    def setUp(self):
+        self.site = tempfile.TemporaryDirectory()
+        self.previous = os.getcwd()
+        os.chdir(self.site.name)
+        os.makedirs('data')
+        with open('episode_detector_config.json', 'w', encoding='utf-8') as f:
+            json.dump({'spotify': {'client_id': 'id', 'client_secret': 'secret'},
+                       'shows': {'shabbos': SHOW_ID},
+                       'settings': {'trailer_keywords': ['trailer']}}, f)
+        with open('data/shabbos_episodes.json', 'w', encoding='utf-8') as f:
+            json.dump({'episodes': [{'title': 'Episode', 'episode_number': 1,
+                                     'spotify_embed_url': f"https://open.spotify.com/embed/episode/{KNOWN_ID}"}]}, f)
+
+    def tearDown(self):
+        os.chdir(self.previous)
+        self.site.cleanup()
+
+    def check(self, api_response):
+        token = response(200, {'access_token': 'token', 'expires_in': 3600})
+        with mock.patch.object(sys, 'argv', ['episode_update.py', '--check']), \
+                mock.patch('requests.post', return_value=token), \
+                mock.patch('requests.get', return_value=api_response):
+            return episode_update.main()
+
+    def test_nothing_new(self):
+        self.assertEqual(self.check(response(200, {'items': [episode(KNOWN_ID)]})), episode_update.EXIT_NOTHING_NEW)
+
+    def test_updates_available(self):
+        api_response = response(200, {'items': [episode(NEW_ID), episode(KNOWN_ID)]})
+        self.assertEqual(self.check(api_response), episode_update.EXIT_UPDATES_AVAILABLE)
+
+    def test_api_error_is_not_nothing_new(self):
+        for status in (400, 401, 429, 500):
+            with self.subTest(status=status):
+                self.assertEqual(self.check(response(status)), episode_update.EXIT_ERROR)
+        self.assertEqual(episode_update.EXIT_ERROR, 2)
+
+    def test_malformed_response_is_an_error(self):
+        self.assertEqual(self.check(response(200, {'error': 'no items'})), episode_update.EXIT_ERROR)
+
+    def test_timeout_is_an_error(self):
+        token = response(200, {'access_token': 'token', 'expires_in': 3600})
+        with mock.patch.object(sys, 'argv', ['episode_update.py', '--check']), \
+                mock.patch('requests.post', return_value=token), \
+                mock.patch('requests.get', side_effect=requests.exceptions.Timeout("read timed out")):
+            self.assertEqual(episode_update.main(), episode_update.EXIT_ERROR)
+
+    def test_invalid_show_id_is_an_error(self):
+        with open('episode_detector_config.json', 'r+', encoding='utf-8') as f:
+            config = json.load(f)
+            config['shows']['shabbos'] = SHOW_ID + 'x'
+            f.seek(0)
+            json.dump(config, f)
+            f.truncate()
+        self.assertEqual(self.check(response(200, {'items': []})), episode_update.EXIT_ERROR)
+
+if __name__ == "__main__":
+    unittest.main()
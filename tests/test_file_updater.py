@@ -0,0 +1,59 @@
+"""
+Tests for appending new episodes without re-reading the catalog
+Run with: python -m unittest discover -s tests
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+from episode_journal import journal_path
+from file_updater import FileUpdater
+
+KNOWN_ID = "4rOoJ6Egrf8K2IrywzwOMk"
+NEW_ID = "7ooBHjyEEvSdrdXe6zsKpm"
+DATA_PATH = "data/shabbos_episodes.json"
+
+def episode(episode_id, number):
+    return {'title': f"Episode {number}", 'episode_number': number,
+            'spotify_embed_url': f"https://open.spotify.com/embed/episode/{episode_id}"}
+
+class UpdateSeriesFileTest(unittest.TestCase):
+
+    def setUp(self):
+        self.site = tempfile.TemporaryDirectory()
+        self.previous = os.getcwd()
+        os.chdir(self.site.name)
+        os.makedirs('data')
+        self.updater = FileUpdater(backup_enabled=False)
+        self.updater.save_file(DATA_PATH, {'episodes': [episode(KNOWN_ID, 1)]})
+
+    def tearDown(self):
+        os.chdir(self.previous)
+        self.site.cleanup()
+
+    def journaled(self):
+        with open(journal_path(DATA_PATH), 'r', encoding='utf-8') as f:
+            return [json.loads(line)['key'] for line in f]
+
+    def test_appends_without_reading_the_catalog(self):
+        with mock.patch.object(self.updater.journal, 'load', side_effect=AssertionError("catalog parsed")):
+            self.assertTrue(self.updater.update_series_file('shabbos', [episode(NEW_ID, 2), episode(KNOWN_ID, 1)]))
+
+        self.assertEqual(self.journaled(), [NEW_ID])
+        self.assertEqual(self.updater.updated_files[0]['total_episodes'], 2)
+
+    def test_journaled_episodes_count_as_known(self):
+        self.updater.update_series_file('shabbos', [episode(NEW_ID, 2)])
+        self.updater.update_series_file('shabbos', [episode(NEW_ID, 2)])
+        self.assertEqual(self.journaled(), [NEW_ID])
+
+    def test_stale_index_falls_back_to_the_catalog(self):
+        with open(DATA_PATH, 'w', encoding='utf-8') as f:
+            json.dump({'episodes': [episode(KNOWN_ID, 1), episode(NEW_ID, 2)]}, f)
+        self.updater.update_series_file('shabbos', [episode(NEW_ID, 2)])
+        self.assertFalse(os.path.exists(journal_path(DATA_PATH)))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+"""
+Tests that the committed blog pages are what the generator renders from the JSON
+Run with: python -m unittest discover -s tests
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from generate_blog_posts import LOCALES, build_page, load_posts, page_slug
+from site_templates import load_template
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The later build stages rewrite the <head> (critical CSS) and script tags; <main> is the generator's alone
+MAIN_PATTERN = re.compile(r'<main\b.*?</main>', re.S)
+
+def main_content(html):
+    return MAIN_PATTERN.search(html).group(0)
+
+class CommittedPagesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.previous = os.getcwd()
+        os.chdir(ROOT)
+        self.output = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        os.chdir(self.previous)
+        self.output.cleanup()
+
+    def render(self, locale, posts, index):
+        """Render one post the way a build without a cache does; returns (rendered, committed) html"""
+        post = posts[index]
+        prev_post = posts[index - 1] if index > 0 else None
+        next_post = posts[index + 1] if index < len(posts) - 1 else None
+        file_name = f"{page_slug(post, locale)}.html"
+        rendered_path = os.path.join(self.output.name, file_name)
+
+        result = build_page((locale, load_template(locale['template']), post, prev_post, next_post, rendered_path))
+        self.assertIsNone(result['error'])
+        with open(rendered_path, 'r', encoding='utf-8') as f:
+            rendered = f.read()
+        with open(os.path.join(locale['output_dir'], file_name), 'r', encoding='utf-8') as f:
+            committed = f.read()
+        return rendered, committed
+
+    def test_authored_post_renders_unchanged(self):
+        # Week 1 carries hand-written headings, highlight boxes and a blockquote
+        locale = LOCALES[0]
+        rendered, committed = self.render(locale, load_posts(locale['data_path']), 0)
+        self.assertIn('class="content-highlight"', rendered)
+        self.assertEqual(main_content(rendered), main_content(committed))
+
+    def test_every_committed_page_matches_its_json(self):
+        for locale in LOCALES:
+            posts = load_posts(locale['data_path'])
+            for index, post in enumerate(posts):
+                with self.subTest(locale=locale['code'], slug=post['slug']):
+                    rendered, committed = self.render(locale, posts, index)
+                    self.assertEqual(main_content(rendered), main_content(committed))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""
+Tests for the precompressed siblings of site assets
+Run with: python -m unittest discover -s tests
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+from precompress import MIN_SIZE, Precompressor
+
+class PrecompressorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.root = tempfile.TemporaryDirectory()
+        self.page = os.path.join(self.root.name, 'index.html')
+
+    def tearDown(self):
+        self.root.cleanup()
+
+    def write_page(self, content):
+        with open(self.page, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def run_stage(self):
+        return Precompressor(root=self.root.name, patterns=['*.html']).run()
+
+    def test_writes_siblings(self):
+        self.write_page('<p>episode</p>\n' * 100)
+        self.run_stage()
+        with gzip.open(self.page + '.gz', 'rt', encoding='utf-8') as f:
+            self.assertEqual(f.read(), '<p>episode</p>\n' * 100)
+
+    def test_shrinking_below_min_size_removes_stale_siblings(self):
+        self.write_page('<p>episode</p>\n' * 100)
+        self.run_stage()
+        self.assertTrue(os.path.exists(self.page + '.gz'))
+
+        self.write_page('<p>moved</p>')
+        self.assertLess(os.path.getsize(self.page), MIN_SIZE)
+        self.run_stage()
+        for ext in ('.gz', '.br'):
+            self.assertFalse(os.path.exists(self.page + ext))
+
+if __name__ == "__main__":
+    unittest.main()
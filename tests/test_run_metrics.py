@@ -0,0 +1,45 @@
+"""
+Tests for run metrics labels
+Run with: python -m unittest discover -s tests
+"""
+
+import threading
+import unittest
+from run_metrics import MetricsRegistry
+
+class LabelledMetricsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.metrics = MetricsRegistry()
+
+    def test_labelled_block_adds_labels(self):
+        with self.metrics.labelled(tenant='a'):
+            self.metrics.inc('episodes_written_total', 2, series='shabbos')
+            with self.metrics.timed('file_save'):
+                pass
+        self.metrics.inc('episodes_written_total', 1, series='shabbos')
+
+        snapshot = self.metrics.snapshot()
+        self.assertEqual(snapshot['counters']['episodes_written_total'], [
+            {'labels': {'series': 'shabbos'}, 'value': 1},
+            {'labels': {'series': 'shabbos', 'tenant': 'a'}, 'value': 2}
+        ])
+        self.assertEqual(snapshot['histograms']['file_save_duration_seconds'][0]['labels'], {'tenant': 'a'})
+        self.assertEqual(self.metrics.total('episodes_written_total'), 3)
+
+    def test_labels_stay_in_their_thread(self):
+        def record(name):
+            with self.metrics.labelled(tenant=name):
+                self.metrics.inc('episodes_fetched_total')
+
+        with self.metrics.labelled(tenant='main'):
+            worker = threading.Thread(target=record, args=('worker',))
+            worker.start()
+            worker.join()
+            self.metrics.inc('episodes_fetched_total')
+
+        labels = [series['labels'] for series in self.metrics.snapshot()['counters']['episodes_fetched_total']]
+        self.assertEqual(labels, [{'tenant': 'main'}, {'tenant': 'worker'}])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests for the oEmbed prefetcher against the local stand-in endpoint
+Run with: python -m unittest discover -s tests
+"""
+
+import socket
+import tempfile
+import unittest
+from series_prerender import render_card
+from spotify_oembed import OEmbedPrefetcher, OEmbedStandIn
+
+EPISODE_ID = "4rOoJ6Egrf8K2IrywzwOMk"
+EMBED_URL = f"https://open.spotify.com/embed/episode/{EPISODE_ID}?utm_source=generator"
+
+class OEmbedPrefetcherTest(unittest.TestCase):
+
+    def setUp(self):
+        self.stand_in = OEmbedStandIn()
+        self.stand_in.start()
+        self.cache_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.stand_in.stop()
+        self.cache_dir.cleanup()
+
+    def prefetcher(self, endpoint=None, **kwargs):
+        return OEmbedPrefetcher(endpoint=endpoint or self.stand_in.endpoint, cache_dir=self.cache_dir.name, **kwargs)
+
+    def test_cache_miss_then_hit(self):
+        prefetcher = self.prefetcher()
+        first = prefetcher.prefetch([EPISODE_ID])
+        self.assertEqual(first[EPISODE_ID]['title'], f"Stand-in episode {EPISODE_ID}")
+        self.assertEqual(prefetcher.fetched, 1)
+
+        # A hit must not touch the endpoint at all
+        self.stand_in.stop()
+        self.assertEqual(prefetcher.prefetch([EPISODE_ID]), first)
+        self.assertEqual(prefetcher.fetched, 1)
+        self.assertEqual(prefetcher.failed, 0)
+
+    def test_cache_survives_save(self):
+        prefetcher = self.prefetcher()
+        prefetcher.prefetch([EPISODE_ID])
+        prefetcher.save()
+
+        reloaded = self.prefetcher()
+        self.assertIn(EPISODE_ID, reloaded.prefetch([EPISODE_ID]))
+        self.assertEqual(reloaded.fetched, 0)
+
+    def test_enrich_fills_missing_oembed_only(self):
+        episodes = [{'spotify_embed_url': EMBED_URL}, {'spotify_embed_url': EMBED_URL, 'oembed': {'title': 'kept'}}]
+        self.assertEqual(self.prefetcher().enrich(episodes), 1)
+        self.assertEqual(episodes[0]['oembed']['thumbnail_width'], 300)
+        self.assertEqual(episodes[1]['oembed'], {'title': 'kept'})
+
+    def assert_falls_back(self, prefetcher):
+        episode = {'spotify_embed_url': EMBED_URL, 'title': 'Episode', 'episode_number': 1}
+        self.assertEqual(prefetcher.enrich([episode]), 0)
+        self.assertEqual(prefetcher.failed, 1)
+        self.assertNotIn('oembed', episode)
+        # Failures are not cached, so the next run retries
+        self.assertIsNone(prefetcher.cache.get(EPISODE_ID))
+
+        # The card still gets a play facade, just without artwork
+        card = render_card(episode, 1)
+        self.assertIn('episode-spotify-facade', card)
+        self.assertNotIn('episode-spotify-facade-art', card)
+
+    def test_not_found_falls_back(self):
+        endpoint = self.stand_in.endpoint.replace('/oembed', '/missing')
+        self.assert_falls_back(self.prefetcher(endpoint))
+
+    def test_timeout_falls_back(self):
+        # Accepts connections (through the backlog) but never answers
+        with socket.socket() as silent:
+            silent.bind(('127.0.0.1', 0))
+            silent.listen(1)
+            host, port = silent.getsockname()
+            self.assert_falls_back(self.prefetcher(f"http://{host}:{port}/oembed", timeout=0.2))
+
+if __name__ == "__main__":
+    unittest.main()